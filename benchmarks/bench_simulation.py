@@ -0,0 +1,212 @@
+import sys
+import os
+import gc
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from properties import flat, house
+from strategies.simulation import test_strategy
+from utils.repayment import (
+    step,
+    multistep,
+    time_to_loan_to_value,
+    months_to_loan_to_value,
+    calculate_fixed_monthly_payment,
+)
+
+"""
+Benchmarks for the simulation hot paths.
+Each benchmark reports operations per second and peak traced memory. Results can be saved as
+a JSON baseline and later runs compared against it; the run fails (exit code 1) when any
+benchmark is slower or uses more memory than the baseline by more than the threshold.
+
+    python benchmarks/bench_simulation.py --save            # record a baseline
+    python benchmarks/bench_simulation.py --threshold 0.15  # compare against it
+"""
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+STRATEGY_CODES = ["HH", "FF", "HF", "FH"]
+GRID_SIZES = [11, 51, 101]  # overpayment points in the find_optimal_strategy grid
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """Registers a factory that returns the zero-argument operation to time."""
+    def register(factory):
+        BENCHMARKS[name] = factory
+        return factory
+    return register
+
+
+@benchmark("step")
+def bench_step():
+    prop = flat.clone()
+    payment = calculate_fixed_monthly_payment(prop)
+
+    def op():
+        prop.reset()
+        step(prop, payment, 500)
+    return op
+
+
+@benchmark("multistep_12")
+def bench_multistep():
+    payment = calculate_fixed_monthly_payment(flat)
+
+    def op():
+        multistep(flat.clone(), 12, payment, 500)
+    return op
+
+
+@benchmark("time_to_loan_to_value")
+def bench_time_to_loan_to_value():
+    payment = calculate_fixed_monthly_payment(flat)
+
+    def op():
+        time_to_loan_to_value(flat.clone(), 0.75, payment, 500)
+    return op
+
+
+@benchmark("months_to_loan_to_value")
+def bench_months_to_loan_to_value():
+    payment = calculate_fixed_monthly_payment(house)
+
+    def op():
+        months_to_loan_to_value(house, 0.75, payment, 500)
+    return op
+
+
+def _strategy_factory(strategy: str):
+    def factory():
+        def op():
+            test_strategy(1800, 5000, 0.5, strategy, 0.1)
+        return op
+    return factory
+
+
+for _code in STRATEGY_CODES:
+    benchmark(f"test_strategy_{_code}")(_strategy_factory(_code))
+
+
+def _grid_factory(points: int):
+    def factory():
+        from run.run import find_optimal_strategy
+        overpayments = [i / (points - 1) for i in range(points)]
+
+        def op():
+            find_optimal_strategy([0.05, 0.10], overpayments, STRATEGY_CODES)
+        return op
+    return factory
+
+
+for _points in GRID_SIZES:
+    benchmark(f"find_optimal_strategy_{2 * len(STRATEGY_CODES) * _points}")(_grid_factory(_points))
+
+
+def time_op(op, min_time: float = 0.2, repeat: int = 5) -> float:
+    """Best-of-repeat operations per second, calibrating the loop count to min_time."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        best = min(best, time.perf_counter() - start)
+    return number / best
+
+
+def peak_memory(op) -> int:
+    """Peak bytes allocated by a single call of op."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(names: list[str] = None, min_time: float = 0.2, repeat: int = 5) -> dict:
+    results = {}
+    for name in names or BENCHMARKS:
+        op = BENCHMARKS[name]()
+        results[name] = {
+            "ops_per_sec": time_op(op, min_time, repeat),
+            "peak_bytes": peak_memory(op),
+        }
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Lists the benchmarks that regressed past threshold (a fraction, e.g. 0.2 for 20%)."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{name}: {result['ops_per_sec']:,.1f} ops/s vs baseline {base['ops_per_sec']:,.1f}"
+            )
+        if result["peak_bytes"] > base["peak_bytes"] * (1 + threshold):
+            regressions.append(
+                f"{name}: peak {result['peak_bytes']:,} B vs baseline {base['peak_bytes']:,} B"
+            )
+    return regressions
+
+
+def load_baseline(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path: str, results: dict):
+    with open(path, "w") as f:
+        json.dump({"python": platform.python_version(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON baseline file")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed regression, e.g. 0.2 = 20%%")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing round")
+    parser.add_argument("--repeat", type=int, default=5, help="timing rounds; the best one is kept")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run_benchmarks(args.names, args.min_time, args.repeat)
+    for name, result in results.items():
+        print(f"{name:<34} {result['ops_per_sec']:>14,.1f} ops/s {result['peak_bytes'] / 1024:>10,.1f} KiB")
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"\nBaseline written to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        regressions = compare(results, load_baseline(args.baseline), args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
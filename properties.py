@@ -1,6 +1,6 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Mortgage:
     deposit: int
     mortgage_principal_init: int
@@ -11,9 +11,38 @@ class Mortgage:
     mortgage_principal: int
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            "deposit": self.deposit,
+            "mortgage_principal_init": self.mortgage_principal_init,
+            "interest_rate": self.interest_rate,
+            "mortgage_length": self.mortgage_length,
+            "years_complete": self.years_complete,
+            "months_complete": self.months_complete,
+            "mortgage_principal": self.mortgage_principal,
+        }
+
+    def clone(self):
+        """Field-by-field copy of the mortgage."""
+        return Mortgage(
+            self.deposit,
+            self.mortgage_principal_init,
+            self.interest_rate,
+            self.mortgage_length,
+            self.years_complete,
+            self.months_complete,
+            self.mortgage_principal,
+        )
+
+    def reset(self):
+        """Winds the mortgage back to the day it started."""
+        self.years_complete = 0
+        self.months_complete = 0
+        self.mortgage_principal = self.mortgage_principal_init
 
 class Property:
+    # Slots keep per-portfolio memory down and make attribute access in the monthly step cheaper
+    __slots__ = ("property_value", "buy_to_let", "is_flat", "mortgage")
+
     def __init__(
             self, 
             property_value: int, 
@@ -46,6 +75,20 @@ class Property:
             "buy_to_let": self.buy_to_let,
             "mortgage": self.mortgage.to_dict(),
         }
+
+    def clone(self):
+        """Cheap copy of the property and its mortgage; replaces copy.deepcopy of the templates."""
+        new = Property.__new__(Property)
+        new.property_value = self.property_value
+        new.buy_to_let = self.buy_to_let
+        new.is_flat = self.is_flat
+        new.mortgage = self.mortgage.clone()
+        return new
+
+    def reset(self):
+        """Returns the mortgage to its starting balance and term progress."""
+        self.mortgage.reset()
+        return self
     
     def convert_to_buy_to_let(self, new_mortgage_length: int):
         """Convert property to buy-to-let, update interest rate and mortgage length.
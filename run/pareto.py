@@ -0,0 +1,87 @@
+import sys
+import os
+from bisect import bisect_right
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from run.sweep import iter_grid
+from run.sink import simulate_scenarios
+
+"""
+Pareto frontier of sweep results over (months, net assets): fewer months and more net assets
+are both better, and a scenario is kept unless another one is at least as good on both.
+
+ParetoFrontier keeps the frontier sorted by months, which makes net assets strictly
+increasing along it. Adding a result is a binary search for its months plus removal of the
+neighbours it now dominates, so a stream of results is folded in without keeping any that
+are dominated. pareto_frontier does the same for a finished list with one sort and a skyline
+sweep. Both are O(n log n) overall, and ties keep the first result seen.
+"""
+
+
+class ParetoFrontier:
+    def __init__(self):
+        self._months = []
+        self._assets = []
+        self._rows = []
+        self.seen = 0
+
+    def add(self, months: int, net_assets: float, row=None) -> bool:
+        """Folds in one result; returns whether it is on the frontier (for now)."""
+        self.seen += 1
+        i = bisect_right(self._months, months)
+        # The closest point with no more months has the most assets of all of them
+        if i and self._assets[i - 1] >= net_assets:
+            return False
+        j = i
+        while j < len(self._months) and self._assets[j] <= net_assets:
+            j += 1
+        if i and self._months[i - 1] == months:
+            i -= 1
+        self._months[i:j] = [months]
+        self._assets[i:j] = [net_assets]
+        self._rows[i:j] = [row]
+        return True
+
+    def update(self, rows, months_key: str = "months", assets_key: str = "net_assets"):
+        """Adds every row (a dict, such as sink rows) of an iterable; returns self."""
+        for row in rows:
+            self.add(row[months_key], row[assets_key], row)
+        return self
+
+    def __len__(self):
+        return len(self._months)
+
+    def __iter__(self):
+        """(months, net_assets, row) from fewest months to most."""
+        return iter(zip(self._months, self._assets, self._rows))
+
+    def points(self) -> list[tuple]:
+        return list(zip(self._months, self._assets))
+
+
+def pareto_frontier(results: list[tuple]) -> list[tuple]:
+    """
+    Frontier of (months, net_assets, ...) tuples in one sort and a sweep, fewest months first.
+    Among equal results the earliest in the input is kept.
+    """
+    order = sorted(range(len(results)), key=lambda i: (results[i][0], -results[i][1], i))
+    frontier = []
+    best_assets = float('-inf')
+    for i in order:
+        if results[i][1] > best_assets:
+            frontier.append(results[i])
+            best_assets = results[i][1]
+    return frontier
+
+
+def find_pareto_frontier(
+    deposit_rates: list[float],
+    overpayment_rates: list[float],
+    strategy_codes: list[str],
+    income: int = 1800,
+    current_saving: int = 5000
+) -> ParetoFrontier:
+    """Streams every scenario of the grid through a ParetoFrontier."""
+    scenarios = iter_grid(deposit_rates, strategy_codes, overpayment_rates)
+    return ParetoFrontier().update(simulate_scenarios(scenarios, income, current_saving))
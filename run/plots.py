@@ -1,8 +1,13 @@
 import sys
 import os
+import html
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from strategies.simulation import test_strategy
+from strategies.cache import ResultCache
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 # Note: many parts of this page was ChatGPT generated.
 
@@ -131,14 +136,134 @@ def plot_equity_per_property(history):
     plt.show()
 
 
+# ------------------- Batch rendering -------------------
+# The functions below draw the same five charts onto standalone Agg figures written to files,
+# so they need no GUI and no pyplot state and can run in worker processes.
+
+REPORT_CHARTS = ["savings", "property_value_vs_mortgage", "ltv_ratios", "net_worth", "equity"]
+
+def extract_series(history) -> dict:
+    """Every series the charts need, built in a single pass over the history."""
+    series = {"months": [], "savings": [], "net_worth": [], "properties": {}}
+    for entry in history:
+        month = entry["month"]
+        equity_total = 0
+        for i, prop in enumerate(entry["properties"]):
+            data = series["properties"].setdefault(
+                i, {"months": [], "values": [], "mortgages": [], "ltvs": [], "equity": []}
+            )
+            equity = prop["value"] - prop["mortgage_principal"]
+            data["months"].append(month)
+            data["values"].append(prop["value"])
+            data["mortgages"].append(prop["mortgage_principal"])
+            data["ltvs"].append(prop["ltv"])
+            data["equity"].append(equity)
+            equity_total += equity
+        series["months"].append(month)
+        series["savings"].append(entry["savings"])
+        series["net_worth"].append(entry["savings"] + equity_total)
+    return series
+
+def _finish(ax, title: str, ylabel: str):
+    ax.set_title(title)
+    ax.set_xlabel("Month")
+    ax.set_ylabel(ylabel)
+    ax.grid(True)
+    ax.legend()
+
+def draw_chart(name: str, series: dict) -> Figure:
+    """Draws one of REPORT_CHARTS from extracted series onto a new figure."""
+    fig = Figure(figsize=(12, 6) if name == "property_value_vs_mortgage" else (10, 5))
+    ax = fig.subplots()
+    properties = series["properties"]
+
+    if name == "savings":
+        ax.plot(series["months"], series["savings"], label='Savings', color='green')
+        _finish(ax, "Savings Over Time", "Savings (£)")
+    elif name == "property_value_vs_mortgage":
+        for i, data in properties.items():
+            ax.plot(data["months"], data["values"], label=f'Property {i+1} Value')
+            ax.plot(data["months"], data["mortgages"], label=f'Property {i+1} Mortgage', linestyle='--')
+        _finish(ax, "Property Value vs Mortgage Over Time", "£")
+    elif name == "ltv_ratios":
+        for i, data in properties.items():
+            ax.plot(data["months"], data["ltvs"], label=f'Property {i+1} LTV')
+        _finish(ax, "LTV Ratios Over Time", "Loan-to-Value Ratio")
+    elif name == "net_worth":
+        ax.plot(series["months"], series["net_worth"], label="Net Worth", color="blue")
+        _finish(ax, "Net Worth Over Time", "Net Worth (£)")
+    elif name == "equity":
+        for i, data in properties.items():
+            ax.plot(data["months"], data["equity"], label=f'Property {i+1} Equity')
+        _finish(ax, "Equity per Property Over Time", "Equity (£)")
+    else:
+        raise ValueError(f"Unknown chart: {name}")
+
+    fig.tight_layout()
+    return fig
+
+def _check_name(name: str):
+    """Scenario names become file names, so they must not reach outside the report directory."""
+    if not name or ".." in name or "/" in name or (os.altsep and os.altsep in name) or os.sep in name:
+        raise ValueError(f"Invalid scenario name: {name!r}")
+
+def render_scenario(name: str, history, directory: str, image_format: str = "png") -> list[str]:
+    """Writes every chart for one scenario to directory and returns the file paths."""
+    _check_name(name)
+    series = extract_series(history)
+    paths = []
+    for chart in REPORT_CHARTS:
+        path = os.path.join(directory, f"{name}_{chart}.{image_format}")
+        draw_chart(chart, series).savefig(path)
+        paths.append(path)
+    return paths
+
+def render_report(histories: dict, directory: str, processes: int = None, image_format: str = "png") -> str:
+    """
+    Renders the charts for many scenarios ({name: history}) across a process pool and writes
+    an index.html that shows them side by side. Returns the path of the index.
+    """
+    names = list(histories)
+    for name in names:
+        _check_name(name)
+    os.makedirs(directory, exist_ok=True)
+    if processes == 1:
+        rendered = [render_scenario(name, histories[name], directory, image_format) for name in names]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [
+                pool.submit(render_scenario, name, histories[name], directory, image_format)
+                for name in names
+            ]
+            rendered = [future.result() for future in futures]
+
+    rows = []
+    for name, paths in zip(names, rendered):
+        images = "".join(
+            f'<td><img src="{html.escape(os.path.basename(path))}" width="400"></td>' for path in paths
+        )
+        rows.append(f"<tr><th>{html.escape(name)}</th>{images}</tr>")
+    index = os.path.join(directory, "index.html")
+    with open(index, "w") as f:
+        f.write("<html><body><table>\n" + "\n".join(rows) + "\n</table></body></html>\n")
+    return index
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", help="render the charts to this directory instead of showing them")
+    parser.add_argument("--cache", nargs="?", const="", metavar="DIR",
+                        help="reuse the simulation from an on-disk cache (default ~/.cache/investments)")
+    args = parser.parse_args()
+
     income = 1800
     current_saving = 5000
     overpayment_pct = 0.75
     strategy = "FF"
     deposit = 0.05
 
-    months_passed, net_assets, history = test_strategy(
+    simulate = ResultCache(args.cache or None).test_strategy if args.cache is not None else test_strategy
+    months_passed, net_assets, history = simulate(
         income,
         current_saving,
         overpayment_pct,
@@ -146,6 +271,10 @@ if __name__ == "__main__":
         deposit,
     )
 
+    if args.output:
+        print(render_report({f"{strategy}_{overpayment_pct}_{deposit}": history}, args.output, processes=1))
+        sys.exit()
+
     # Run plots
     plot_savings_over_time(history)
     plot_property_value_vs_mortgage(history)
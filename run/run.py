@@ -1,14 +1,34 @@
 import sys
 import os
+import argparse
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The repository root goes first so that `run` is this package rather than this script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
 
 from strategies.simulation import test_strategy
+from strategies.batch import simulate_grid
+from strategies.cache import ResultCache
+from utils import trace, profiling
+from run.sweep import find_optimal_strategy_parallel
+from run.search import find_optimal_strategy_pruned, find_optimal_strategy_adaptive
+from run.sink import stream_sweep, ResultSink
+from run.pareto import find_pareto_frontier, ParetoFrontier
+
+MONTHLY_INCOME = 1800
+INITIAL_SAVINGS = 5000
 
 
-def find_optimal_strategy(deposit_rates: list[float], overpayment_rates: list[float], strategy_codes: list[str]):
-    monthly_income = 1800
-    initial_savings = 5000
+def find_optimal_strategy(
+    deposit_rates: list[float],
+    overpayment_rates: list[float],
+    strategy_codes: list[str],
+    cache: ResultCache = None
+):
+    monthly_income = MONTHLY_INCOME
+    initial_savings = INITIAL_SAVINGS
+    simulate = cache.test_strategy if cache is not None else test_strategy
 
     best_months = float('inf')
     best_strategy = None
@@ -19,15 +39,20 @@ def find_optimal_strategy(deposit_rates: list[float], overpayment_rates: list[fl
     for deposit in deposit_rates:
         for strategy in strategy_codes:
             for overpayment in overpayment_rates:
-                months, net_assets, _ = test_strategy(
+                months, net_assets, _ = simulate(
                     income=monthly_income,
                     current_saving=initial_savings,
                     overpayment_pct=overpayment,
                     strategy=strategy,
-                    deposit=deposit
+                    deposit=deposit,
+                    history_mode="off"
                 )
 
-                print(f"Tested - Strategy: {strategy}, Overpayment: {overpayment:.2f}, Months: {months}, Deposit: {deposit * 100}%")
+                if trace.info_on:
+                    trace.event(
+                        "sweep.tested", trace.INFO,
+                        strategy=strategy, overpayment=overpayment, months=months, deposit=deposit
+                    )
 
                 is_better = (
                     months < best_months or
@@ -44,16 +69,127 @@ def find_optimal_strategy(deposit_rates: list[float], overpayment_rates: list[fl
     return best_months, best_strategy, best_overpayment, best_deposit, highest_assets
 
 
+def find_optimal_strategy_batch(deposit_rates: list[float], overpayment_rates: list[float], strategy_codes: list[str]):
+    """Same search as find_optimal_strategy, but the whole grid is simulated in one vectorised batch."""
+    months, net_assets = simulate_grid(
+        MONTHLY_INCOME, INITIAL_SAVINGS, deposit_rates, strategy_codes, overpayment_rates
+    )
+
+    months = months.ravel()
+    net_assets = net_assets.ravel()
+    if months.size == 0:
+        return float('inf'), None, None, None, float('-inf')
+
+    # Fewest months, then highest assets, then first in loop order (matches the serial tie-break)
+    best = np.lexsort((np.arange(months.size), -net_assets, months))[0]
+    d, s, o = np.unravel_index(best, (len(deposit_rates), len(strategy_codes), len(overpayment_rates)))
+
+    return int(months[best]), strategy_codes[s], overpayment_rates[o], deposit_rates[d], float(net_assets[best])
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--processes", type=int, default=1, help="worker processes for a parallel sweep")
+    parser.add_argument("--batch", action="store_true", help="simulate the whole grid as one vectorised batch")
+    parser.add_argument("--prune", action="store_true", help="skip simulations that cannot beat the best so far")
+    parser.add_argument("--adaptive", nargs="?", type=float, const=0.001, metavar="TOL",
+                        help="search overpayment rates continuously down to TOL instead of the 1%% grid")
+    parser.add_argument("--pareto", action="store_true",
+                        help="print the months vs net assets Pareto frontier instead of a single winner")
+    parser.add_argument("--output", help="directory to stream every scenario's result to (resumable)")
+    parser.add_argument("--with-history", action="store_true", help="also write monthly histories with --output")
+    parser.add_argument("--fresh", action="store_true", help="discard earlier results in --output instead of resuming")
+    parser.add_argument("--cache", nargs="?", const="", metavar="DIR",
+                        help="reuse results of earlier runs from an on-disk cache (default ~/.cache/investments)")
+    parser.add_argument("--verbose", action="store_true", help="log every tested scenario to stderr")
+    parser.add_argument("--timing", action="store_true", help="print per-function timings after the sweep")
+    parser.add_argument("--profile", nargs="?", const="", metavar="FOLDED",
+                        help="print a profiling report, and write collapsed stacks to FOLDED if given")
+    args = parser.parse_args()
+
+    if args.verbose:
+        trace.configure(trace.INFO)
+    if args.timing:
+        trace.enable_timing()
+    if args.profile is not None:
+        profiling.enable()
+
     deposit_options = [0.05, 0.10]
     overpayment_options = [i / 100 for i in range(0, 101)]
     strategy_options = ['HH', 'FF', 'HF', 'FH']
 
-    result = find_optimal_strategy(deposit_options, overpayment_options, strategy_options)
+    if args.pareto:
+        if args.output:
+            try:
+                stream_sweep(
+                    args.output, deposit_options, overpayment_options, strategy_options,
+                    income=MONTHLY_INCOME, current_saving=INITIAL_SAVINGS, include_history=args.with_history,
+                    resume=not args.fresh
+                )
+            except ValueError as error:
+                sys.exit(f"{error}; use --fresh to start again")
+            frontier = ParetoFrontier().update(ResultSink(args.output).read())
+        else:
+            frontier = find_pareto_frontier(
+                deposit_options, overpayment_options, strategy_options,
+                income=MONTHLY_INCOME, current_saving=INITIAL_SAVINGS
+            )
+        print(f"Pareto frontier ({len(frontier)} of {frontier.seen} scenarios):")
+        for months, net_assets, row in frontier:
+            print(f"  {months:>4} months  £{net_assets:>12,.2f}  {row['strategy']} "
+                  f"overpayment {row['overpayment_pct']:.2f} deposit {row['deposit']:.2f}")
+        sys.exit()
+
+    if args.output:
+        try:
+            stats = stream_sweep(
+                args.output, deposit_options, overpayment_options, strategy_options,
+                income=MONTHLY_INCOME, current_saving=INITIAL_SAVINGS, include_history=args.with_history,
+                resume=not args.fresh
+            )
+        except ValueError as error:
+            sys.exit(f"{error}; use --fresh to start again")
+        print(f"Wrote {stats['written']} results to {args.output} (resumed after {stats['skipped']})")
+        best = min(ResultSink(args.output).read(), key=lambda r: (r["months"], -r["net_assets"], r["index"]))
+        result = (best["months"], best["strategy"], best["overpayment_pct"], best["deposit"], best["net_assets"])
+    elif args.adaptive is not None:
+        result, stats = find_optimal_strategy_adaptive(
+            deposit_options, strategy_options,
+            income=MONTHLY_INCOME, current_saving=INITIAL_SAVINGS, tolerance=args.adaptive
+        )
+        print(f"Adaptive search used {stats['evaluations']} simulations")
+    elif args.prune:
+        result, stats = find_optimal_strategy_pruned(
+            deposit_options, overpayment_options, strategy_options,
+            income=MONTHLY_INCOME, current_saving=INITIAL_SAVINGS
+        )
+        print(f"Pruned {stats['pruned']} of {stats['total']} simulations "
+              f"({stats['skipped']} skipped, {stats['aborted']} stopped early)")
+    elif args.batch:
+        result = find_optimal_strategy_batch(deposit_options, overpayment_options, strategy_options)
+    elif args.processes > 1:
+        result = find_optimal_strategy_parallel(
+            deposit_options, overpayment_options, strategy_options,
+            income=MONTHLY_INCOME, current_saving=INITIAL_SAVINGS, processes=args.processes
+        )
+    else:
+        cache = ResultCache(args.cache or None) if args.cache is not None else None
+        result = find_optimal_strategy(deposit_options, overpayment_options, strategy_options, cache)
 
     print("\nOptimal Strategy Found:")
     print(f"  Strategy:            {result[1]}")
-    print(f"  Overpayment Rate:    {result[2]:.2f}")
+    rate_digits = 2 if args.adaptive is None else 4
+    print(f"  Overpayment Rate:    {result[2]:.{rate_digits}f}")
     print(f"  Deposit Rate:        {result[3]:.2f}")
     print(f"  Months to Complete:  {result[0]}")
     print(f"  Net Assets Achieved: {result[4]:,.2f}")
+
+    if args.timing:
+        print("\nTimings:")
+        for row in trace.timing_report():
+            print(f"  {row['function']:<60} {row['calls']:>10} calls {row['total_s']:>9.3f}s")
+    if args.profile is not None:
+        print("\nProfile:")
+        print(profiling.report())
+        if args.profile:
+            profiling.write_collapsed(args.profile)
@@ -0,0 +1,156 @@
+import sys
+import os
+import math
+import random
+import argparse
+from collections import namedtuple
+from itertools import product
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.simulation import test_strategy
+
+"""
+Lazy scenario space for household-level sweeps.
+Each axis is a sequence of values (lists, tuples and ranges all work); a scenario is one value
+per axis. The space is never materialised: its size is the product of the axis lengths, the
+scenario at any index is decoded from the index as a mixed-radix number (last axis fastest,
+so the default axes keep run.find_optimal_strategy's loop order), and enumeration, sampling
+and sharding all walk indices.
+
+Property prices enter as a price_scale on the model's property values, and interest rates as
+an override of its mortgage rate (None keeps the 2025 rates of generate_property).
+"""
+
+AXES = ("income", "current_saving", "price_scale", "interest_rate", "deposit", "strategy", "overpayment_pct")
+Scenario = namedtuple("Scenario", AXES)
+
+DEFAULT_AXES = {
+    "income": [1800],
+    "current_saving": [5000],
+    "price_scale": [1.0],
+    "interest_rate": [None],
+    "deposit": [0.05, 0.10],
+    "strategy": ["HH", "FF", "HF", "FH"],
+    "overpayment_pct": [i / 100 for i in range(0, 101)],
+}
+
+
+class ScenarioSpace:
+    def __init__(self, **axes):
+        unknown = set(axes) - set(AXES)
+        if unknown:
+            raise ValueError(f"Unknown axes: {sorted(unknown)}")
+        self.axes = [axes.get(name, DEFAULT_AXES[name]) for name in AXES]
+        self.size = math.prod(len(values) for values in self.axes)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index: int) -> Scenario:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("scenario index out of range")
+        values = []
+        for axis in reversed(self.axes):
+            index, digit = divmod(index, len(axis))
+            values.append(axis[digit])
+        return Scenario(*reversed(values))
+
+    def __iter__(self):
+        return (Scenario(*values) for values in product(*self.axes))
+
+    def iter_range(self, start: int, stop: int):
+        """Scenarios start..stop - 1 in order, decoding only the first index."""
+        stop = min(stop, self.size)
+        if start >= stop:
+            return
+        digits = []
+        index = start
+        for axis in reversed(self.axes):
+            index, digit = divmod(index, len(axis))
+            digits.append(digit)
+        digits.reverse()
+
+        for _ in range(stop - start):
+            yield Scenario(*(axis[d] for axis, d in zip(self.axes, digits)))
+            # Odometer increment, last axis fastest
+            for position in range(len(digits) - 1, -1, -1):
+                digits[position] += 1
+                if digits[position] < len(self.axes[position]):
+                    break
+                digits[position] = 0
+
+    def shard(self, worker: int, workers: int):
+        """The contiguous block of scenarios handled by worker (0-based) of workers."""
+        if not 0 <= worker < workers:
+            raise ValueError("worker must be in range(workers)")
+        return self.iter_range(self.size * worker // workers, self.size * (worker + 1) // workers)
+
+    def sample(self, n: int, seed: int = None) -> list[Scenario]:
+        """n distinct scenarios drawn uniformly at random."""
+        indices = random.Random(seed).sample(range(self.size), min(n, self.size))
+        return [self[i] for i in indices]
+
+    def latin_hypercube(self, n: int, seed: int = None) -> list[Scenario]:
+        """
+        n scenarios whose values on every axis are spread over n equal strata of that axis,
+        each stratum used once, with the strata paired at random across axes.
+        """
+        rng = random.Random(seed)
+        columns = []
+        for axis in self.axes:
+            strata = list(range(n))
+            rng.shuffle(strata)
+            columns.append([axis[int((s + rng.random()) / n * len(axis))] for s in strata])
+        return [Scenario(*values) for values in zip(*columns)]
+
+
+def run_scenario(scenario: Scenario):
+    """(months_passed, total_net_assets) of one scenario."""
+    months, net_assets, _ = test_strategy(
+        income=scenario.income,
+        current_saving=scenario.current_saving,
+        overpayment_pct=scenario.overpayment_pct,
+        strategy=scenario.strategy,
+        deposit=scenario.deposit,
+        history_mode="off",
+        price_scale=scenario.price_scale,
+        interest_rate=scenario.interest_rate
+    )
+    return months, net_assets
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--shard", default="0/1", help="run block I of K (e.g. 2/8)")
+    parser.add_argument("--sample", type=int, help="run this many random scenarios instead")
+    parser.add_argument("--lhs", type=int, help="run this many Latin-hypercube scenarios instead")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    space = ScenarioSpace(
+        income=range(1500, 4001, 100),
+        current_saving=range(0, 50001, 5000),
+        price_scale=[0.8, 0.9, 1.0, 1.1, 1.2],
+        interest_rate=[None, 0.03, 0.04, 0.05, 0.06, 0.07],
+    )
+    print(f"Scenario space: {space.size:,} scenarios")
+
+    if args.sample:
+        scenarios = space.sample(args.sample, args.seed)
+    elif args.lhs:
+        scenarios = space.latin_hypercube(args.lhs, args.seed)
+    else:
+        worker, workers = (int(part) for part in args.shard.split("/"))
+        scenarios = space.shard(worker, workers)
+
+    best = None
+    count = 0
+    for scenario in scenarios:
+        months, net_assets = run_scenario(scenario)
+        count += 1
+        if best is None or (months, -net_assets) < best[:2]:
+            best = (months, -net_assets, scenario)
+    print(f"Ran {count:,} scenarios; best: {best[0]} months, £{-best[1]:,.2f}, {best[2]}")
@@ -0,0 +1,190 @@
+import sys
+import os
+import math
+from itertools import product
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.simulation import test_strategy, purchase_first_property, generate_property
+from utils.saving import costs
+from utils.overpayments import calculate_overpayment
+from utils.repayment import months_to_loan_to_value
+
+"""
+Pruned version of run.find_optimal_strategy.
+Months are not monotone in overpayment_pct (interest rounding makes neighbouring rates differ
+by a month either way), so bracketing over the rates could miss the exhaustive optimum.
+Instead the search uses bounds that hold for every rate:
+- a lower bound on months per (deposit, strategy), so whole rows of rates are skipped once
+  the best result so far already beats it;
+- a month budget equal to the best months so far, so every other simulation is abandoned as
+  soon as it can no longer win.
+Only results that cannot win are dropped, so the optimum and its tie-break are unchanged.
+
+find_optimal_strategy_adaptive instead treats overpayment_pct as continuous: a coarse grid,
+then repeated halving of the step around the best few points until the step is below the
+tolerance. It is a heuristic for the same non-monotone objective, so it trades the exhaustive
+guarantee for resolution finer than any affordable grid. Deposits stay on their grid, since
+generate_property only defines mortgage rates for the grid deposits.
+"""
+
+
+def months_lower_bound(income: int, current_saving: int, strategy: str, deposit: float) -> int:
+    """
+    Fewest months any overpayment rate can need for this strategy.
+    The first purchase does not depend on the rate. For the second, savings grow by at most the
+    whole surplus per month and the LTV falls no faster than when the whole surplus is overpaid.
+    """
+    if not strategy:
+        return 0
+    months, properties, saving = purchase_first_property(strategy[0], current_saving, income, None, deposit)
+    if len(strategy) == 1:
+        return months
+
+    current_property = properties[-1]
+    next_property = generate_property(strategy[1], deposit)
+    max_overpayment = calculate_overpayment(current_property, income)
+    if not max_overpayment or max_overpayment <= 0:
+        return months
+
+    deficit = costs(next_property, False, True) + next_property.mortgage.deposit - saving
+    months_saving = max(0, math.ceil(deficit / max_overpayment - 1e-9))
+    months_ltv = months_to_loan_to_value(current_property, 0.75, None, max_overpayment)
+    return months + max(months_saving, months_ltv)
+
+
+def find_optimal_strategy_pruned(
+    deposit_rates: list[float],
+    overpayment_rates: list[float],
+    strategy_codes: list[str],
+    income: int = 1800,
+    current_saving: int = 5000
+):
+    """
+    Returns the same 5-tuple as find_optimal_strategy plus a stats dict:
+    total scenarios, simulations run, completed, aborted over budget and skipped by the bound.
+    """
+    rows = []
+    for d, deposit in enumerate(deposit_rates):
+        for s, strategy in enumerate(strategy_codes):
+            bound = months_lower_bound(income, current_saving, strategy, deposit)
+            rows.append((bound, d, s))
+    # Most promising rows first so the budget tightens early
+    rows.sort()
+
+    stats = {"total": len(rows) * len(overpayment_rates), "simulated": 0, "completed": 0, "aborted": 0, "skipped": 0}
+    best = None  # (months, -net_assets, index, deposit, strategy, overpayment)
+
+    for bound, d, s in rows:
+        if best is not None and bound > best[0]:
+            stats["skipped"] += len(overpayment_rates)
+            continue
+        for o, overpayment in enumerate(overpayment_rates):
+            budget = best[0] if best is not None else None
+            months, net_assets, _ = test_strategy(
+                income=income,
+                current_saving=current_saving,
+                overpayment_pct=overpayment,
+                strategy=strategy_codes[s],
+                deposit=deposit_rates[d],
+                history_mode="off",
+                max_months=budget
+            )
+            stats["simulated"] += 1
+            if net_assets is None:
+                stats["aborted"] += 1
+                continue
+            stats["completed"] += 1
+
+            index = (d * len(strategy_codes) + s) * len(overpayment_rates) + o
+            result = (months, -net_assets, index, deposit_rates[d], strategy_codes[s], overpayment)
+            if best is None or result[:3] < best[:3]:
+                best = result
+
+    stats["pruned"] = stats["total"] - stats["completed"]
+    if best is None:
+        return (float('inf'), None, None, None, float('-inf')), stats
+
+    months, neg_assets, _, deposit, strategy, overpayment = best
+    return (months, strategy, overpayment, deposit, -neg_assets), stats
+
+
+def refine(evaluate, bounds: list[tuple], tolerance: float, coarse_points: int = 11, keep: int = 3):
+    """
+    Minimises evaluate(*point) over the box bounds (one (low, high) pair per dimension).
+    Evaluates a coarse grid, then keeps halving the step and evaluating the neighbours of the
+    keep best points until every step is at most tolerance. Returns (point, score, scores),
+    where scores maps every evaluated point to its score.
+    """
+    steps = [(high - low) / (coarse_points - 1) for low, high in bounds]
+    scores = {}
+
+    def score(point):
+        point = tuple(round(min(max(x, low), high), 12) for x, (low, high) in zip(point, bounds))
+        if point not in scores:
+            scores[point] = evaluate(*point)
+
+    axes = [
+        [low + i * step for i in range(coarse_points)] if step else [low]
+        for (low, high), step in zip(bounds, steps)
+    ]
+    for point in product(*axes):
+        score(point)
+
+    while any(step > tolerance for step in steps):
+        steps = [step / 2 if step > tolerance else step for step in steps]
+        best = sorted(scores, key=lambda point: (scores[point], point))[:keep]
+        for point in best:
+            offsets = [(-step, 0, step) if step else (0,) for step in steps]
+            for offset in product(*offsets):
+                score(tuple(x + dx for x, dx in zip(point, offset)))
+
+    best = min(scores, key=lambda point: (scores[point], point))
+    return best, scores[best], scores
+
+
+def find_optimal_strategy_adaptive(
+    deposit_rates: list[float],
+    strategy_codes: list[str],
+    income: int = 1800,
+    current_saving: int = 5000,
+    tolerance: float = 0.001,
+    overpayment_range: tuple = (0.0, 1.0),
+    coarse_points: int = 11,
+    keep: int = 3
+):
+    """
+    Returns the same 5-tuple as find_optimal_strategy plus a stats dict with the number of
+    test_strategy evaluations. overpayment_pct is searched continuously to tolerance for every
+    deposit in deposit_rates and strategy in strategy_codes.
+    """
+    def evaluate(strategy, deposit):
+        def objective(overpayment):
+            months, net_assets, _ = test_strategy(
+                income=income,
+                current_saving=current_saving,
+                overpayment_pct=overpayment,
+                strategy=strategy,
+                deposit=deposit,
+                history_mode="off"
+            )
+            return months, -net_assets
+        return objective
+
+    stats = {"evaluations": 0}
+    best = None  # ((months, -net_assets), overpayment, deposit, strategy)
+
+    for deposit in deposit_rates:
+        for strategy in strategy_codes:
+            (overpayment,), score, scores = refine(
+                evaluate(strategy, deposit), [overpayment_range], tolerance, coarse_points, keep
+            )
+            stats["evaluations"] += len(scores)
+            if best is None or score < best[0]:
+                best = (score, overpayment, deposit, strategy)
+
+    if best is None:
+        return (float('inf'), None, None, None, float('-inf')), stats
+
+    (months, neg_assets), overpayment, deposit, strategy = best
+    return (months, strategy, overpayment, deposit, -neg_assets), stats
@@ -0,0 +1,329 @@
+import sys
+import os
+import math
+import json
+import time
+import queue
+import argparse
+import threading
+import socketserver
+from collections import OrderedDict, deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.batch import simulate_batch
+from strategies.simulation import generate_property
+from utils.saving import costs
+from utils.overpayments import calculate_expenses
+
+"""
+Long-lived local simulation service.
+Requests are queued on a MicroBatcher. Its worker thread takes the first waiting request,
+collects whatever else arrives within a short window (up to max_batch) and evaluates all of
+them with one strategies.batch.simulate_batch call, whose results match test_strategy exactly.
+Repeat scenarios are answered from an in-memory LRU cache without waiting for a batch.
+Inputs are validated before they are queued, and every batch runs with a month budget, so no
+request can keep the worker busy for long; a scenario over the budget gets an error.
+
+HTTP API (localhost TCP, or a Unix socket with --unix):
+    POST /simulate   {"income", "current_saving", "overpayment_pct", "strategy", "deposit"}, or a
+                     list of them -> {"months": ..., "net_assets": ...} (or a list)
+    GET  /metrics    request, batch and cache counters, throughput and latency percentiles
+    GET  /health
+"""
+
+FIELDS = ("income", "current_saving", "overpayment_pct", "strategy", "deposit")
+LATENCY_WINDOW = 10000  # latencies kept for the percentiles
+MAX_MONTHS = 1200  # month budget of every simulation
+MAX_PROPERTIES = 20
+
+
+def scenario_key(request: dict) -> tuple:
+    """Validated, normalised (income, current_saving, overpayment_pct, strategy, deposit)."""
+    missing = [name for name in FIELDS if name not in request]
+    if missing:
+        raise ValueError(f"missing fields: {', '.join(missing)}")
+    strategy = str(request["strategy"])
+    if not 0 < len(strategy) <= MAX_PROPERTIES or set(strategy) - {"F", "H"}:
+        raise ValueError(f"strategy must be 1 to {MAX_PROPERTIES} of F and H")
+    key = (
+        float(request["income"]),
+        float(request["current_saving"]),
+        float(request["overpayment_pct"]),
+        strategy,
+        float(request["deposit"]),
+    )
+    income, current_saving, overpayment_pct, _, deposit = key
+    if not all(math.isfinite(x) for x in (income, current_saving, overpayment_pct, deposit)):
+        raise ValueError("income, current_saving, overpayment_pct and deposit must be finite")
+    if income < 0 or current_saving < 0:
+        raise ValueError("income and current_saving must not be negative")
+    if not 0 <= overpayment_pct <= 1:
+        raise ValueError("overpayment_pct must be between 0 and 1")
+    if not 0 < deposit < 1:
+        raise ValueError("deposit must be between 0 and 1")
+    if income <= 1000:
+        first = generate_property(strategy[0], deposit)
+        if current_saving < costs(first, True, True) + first.mortgage.deposit:
+            raise ValueError("income does not cover rent")  # the saving phase would never end
+    # Every property but the last is lived in while saving for the next; simulate_batch
+    # refuses the whole batch if one scenario's income is below that home's expenses.
+    for prop_type in set(strategy[:-1]):
+        if income < calculate_expenses(generate_property(prop_type, deposit)):
+            raise ValueError(f"income does not cover the expenses of {prop_type}")
+    return key
+
+
+def percentile(values: list, p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+class MicroBatcher:
+    def __init__(
+        self,
+        window: float = 0.005,
+        max_batch: int = 4096,
+        cache_size: int = 100000,
+        max_months: int = MAX_MONTHS
+    ):
+        self.window = window
+        self.max_batch = max_batch
+        self.max_months = max_months
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self.started = time.perf_counter()
+        self.counters = {"requests": 0, "cache_hits": 0, "batches": 0, "simulated": 0, "errors": 0}
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, request: dict) -> Future:
+        """Future of (months, net_assets) for one scenario."""
+        future = Future()
+        started = time.perf_counter()
+        with self._lock:
+            self.counters["requests"] += 1
+        try:
+            key = scenario_key(request)
+        except (TypeError, ValueError) as error:
+            self._finish(future, started, error=error)
+            return future
+
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self.counters["cache_hits"] += 1
+        if result is not None:
+            self._finish(future, started, result)
+        else:
+            self._queue.put((key, future, started))
+        return future
+
+    def close(self):
+        self._queue.put(None)
+        self._worker.join()
+
+    def _finish(self, future: Future, started: float, result=None, error=None):
+        with self._lock:
+            self._latencies.append(time.perf_counter() - started)
+            if error is not None:
+                self.counters["errors"] += 1
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _collect(self, first) -> list:
+        """first plus everything that arrives within the window, up to max_batch."""
+        batch = [first]
+        deadline = time.perf_counter() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # let _run see the shutdown after this batch
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = self._collect(item)
+            try:
+                self._evaluate(batch)
+            except Exception as error:
+                # Never leave a caller waiting on a future the worker has given up on
+                for _, future, started in batch:
+                    if not future.done():
+                        self._finish(future, started, error=error)
+
+    def _simulate(self, keys: list[tuple]) -> dict:
+        """Results (or errors) per key; a failing batch is retried one scenario at a time."""
+        incomes, savings, rates, strategies, deposits = zip(*keys)
+        try:
+            months, net_assets = simulate_batch(
+                incomes, savings, rates, list(strategies), deposits, max_months=self.max_months
+            )
+        except Exception as error:
+            if len(keys) == 1:
+                return {keys[0]: error}
+            results = {}
+            for key in keys:
+                results.update(self._simulate([key]))
+            return results
+
+        results = {}
+        for key, m, a in zip(keys, months, net_assets):
+            if math.isnan(a):
+                results[key] = ValueError(f"strategy needs more than {self.max_months} months")
+            else:
+                results[key] = (int(m), float(a))
+        return results
+
+    def _evaluate(self, batch: list[tuple]):
+        keys = list(dict.fromkeys(key for key, _, _ in batch))
+        results = self._simulate(keys)
+        with self._lock:
+            self.counters["batches"] += 1
+            self.counters["simulated"] += len(keys)
+            for key, result in results.items():
+                if not isinstance(result, Exception):
+                    self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        for key, future, started in batch:
+            result = results[key]
+            if isinstance(result, Exception):
+                self._finish(future, started, error=result)
+            else:
+                self._finish(future, started, result)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            counters = dict(self.counters)
+            latencies = list(self._latencies)
+            cache_size = len(self._cache)
+        uptime = time.perf_counter() - self.started
+        counters.update({
+            "cache_size": cache_size,
+            "uptime_s": uptime,
+            "throughput_rps": counters["requests"] / uptime if uptime else 0.0,
+            "mean_batch_size": counters["simulated"] / counters["batches"] if counters["batches"] else 0.0,
+            "latency_ms": {f"p{p}": percentile(latencies, p) * 1000 for p in (50, 95, 99)},
+        })
+        return counters
+
+
+class SimulationHandler(BaseHTTPRequestHandler):
+    batcher: MicroBatcher = None  # set by make_server
+    timeout_s = 60
+
+    def _reply(self, status: int, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self._reply(200, self.batcher.metrics())
+        elif self.path == "/health":
+            self._reply(200, {"status": "ok"})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/simulate":
+            self._reply(404, {"error": "not found"})
+            return
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except ValueError:
+            self._reply(400, {"error": "body must be JSON"})
+            return
+        requests = payload if isinstance(payload, list) else [payload]
+        if not all(isinstance(request, dict) for request in requests):
+            self._reply(400, {"error": "expected an object or a list of objects"})
+            return
+
+        futures = [self.batcher.submit(request) for request in requests]
+        deadline = time.monotonic() + self.timeout_s
+        results = []
+        for future in futures:
+            try:
+                months, net_assets = future.result(timeout=max(0, deadline - time.monotonic()))
+                results.append({"months": months, "net_assets": net_assets})
+            except (TypeError, ValueError) as error:
+                results.append({"error": str(error)})
+            except FutureTimeoutError:
+                self._reply(503, {"error": f"no result within {self.timeout_s} s"})
+                return
+            except Exception as error:
+                self._reply(500, {"error": str(error)})
+                return
+        status = 200 if any("error" not in r for r in results) or not results else 422
+        self._reply(status, results if isinstance(payload, list) else results[0])
+
+    def address_string(self):
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        pass  # the /metrics endpoint replaces per-request logging
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def make_server(batcher: MicroBatcher, host: str = "127.0.0.1", port: int = 8765, unix_path: str = None):
+    """HTTP server bound to localhost (or a Unix socket) that answers through batcher."""
+    handler = type("BoundSimulationHandler", (SimulationHandler,), {"batcher": batcher})
+    if unix_path:
+        if os.path.exists(unix_path):
+            os.remove(unix_path)
+        return UnixHTTPServer(unix_path, handler)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--window-ms", type=float, default=5.0, help="time to wait for more requests per batch")
+    parser.add_argument("--max-batch", type=int, default=4096)
+    args = parser.parse_args()
+
+    batcher = MicroBatcher(window=args.window_ms / 1000, max_batch=args.max_batch)
+    server = make_server(batcher, args.host, args.port, args.unix)
+    print(f"Serving on {args.unix or f'http://{args.host}:{server.server_port}'}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
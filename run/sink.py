@@ -0,0 +1,201 @@
+import sys
+import os
+import csv
+import json
+import glob
+from itertools import islice
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.simulation import test_strategy
+from strategies.cache import model_fingerprint
+from run.sweep import iter_grid
+
+"""
+Streaming sink for sweep results.
+Scenarios flow through a generator pipeline (grid -> simulation -> chunked writer) and every
+summary row is written to disk in fixed-size part files, so memory stays at one chunk however
+big the grid is. Histories can optionally be written next to each part as JSON lines.
+
+Parts are numbered and written atomically (temporary file, then rename), and scenarios are
+written in grid order, so an interrupted sweep resumes by counting the rows already on disk
+and skipping that many scenarios. A manifest of the sweep (grid axes, household, history and
+model version) is written when it starts, and resuming into a directory whose manifest does
+not match is refused rather than mixing two sweeps.
+"""
+
+MANIFEST = "manifest.json"
+
+FIELDS = ["index", "deposit", "strategy", "overpayment_pct", "income", "current_saving", "months", "net_assets"]
+FIELD_TYPES = {
+    "index": int,
+    "deposit": float,
+    "strategy": str,
+    "overpayment_pct": float,
+    "income": float,
+    "current_saving": float,
+    "months": int,
+    "net_assets": float,
+}
+
+
+def simulate_scenarios(scenarios, income: int, current_saving: int, include_history: bool = False):
+    """Yields one summary row per (index, deposit, strategy, overpayment) scenario."""
+    history_mode = "list" if include_history else "off"
+    for index, deposit, strategy, overpayment in scenarios:
+        months, net_assets, history = test_strategy(
+            income=income,
+            current_saving=current_saving,
+            overpayment_pct=overpayment,
+            strategy=strategy,
+            deposit=deposit,
+            history_mode=history_mode
+        )
+        row = {
+            "index": index,
+            "deposit": deposit,
+            "strategy": strategy,
+            "overpayment_pct": overpayment,
+            "income": income,
+            "current_saving": current_saving,
+            "months": months,
+            "net_assets": net_assets,
+        }
+        if include_history:
+            row["history"] = history
+        yield row
+
+
+def sweep_manifest(
+    deposit_rates: list[float],
+    overpayment_rates: list[float],
+    strategy_codes: list[str],
+    income: int,
+    current_saving: int,
+    include_history: bool
+) -> dict:
+    """Everything that determines the rows of a sweep, in a JSON-comparable form."""
+    return {
+        "deposit_rates": list(deposit_rates),
+        "overpayment_rates": list(overpayment_rates),
+        "strategy_codes": list(strategy_codes),
+        "income": income,
+        "current_saving": current_saving,
+        "include_history": include_history,
+        "model": model_fingerprint(),
+    }
+
+
+class ResultSink:
+    def __init__(self, directory: str, chunk_size: int = 10000):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        os.makedirs(directory, exist_ok=True)
+
+    def _parts(self) -> list[str]:
+        return sorted(glob.glob(os.path.join(self.directory, "part-*.csv")))
+
+    def completed_count(self) -> int:
+        """Number of scenarios already on disk."""
+        count = 0
+        for path in self._parts():
+            with open(path, newline="") as f:
+                count += sum(1 for _ in f) - 1  # minus header
+        return count
+
+    def read_manifest(self):
+        """The manifest written when the sweep started, or None."""
+        path = os.path.join(self.directory, MANIFEST)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def write_manifest(self, manifest: dict):
+        path = os.path.join(self.directory, MANIFEST)
+        with open(path + ".tmp", "w") as f:
+            json.dump(manifest, f)
+        os.replace(path + ".tmp", path)
+
+    def clear(self):
+        """Deletes every part and the manifest."""
+        for path in glob.glob(os.path.join(self.directory, "part-*")):
+            os.remove(path)
+        if os.path.exists(os.path.join(self.directory, MANIFEST)):
+            os.remove(os.path.join(self.directory, MANIFEST))
+
+    def _write_part(self, number: int, rows: list[dict]):
+        base = os.path.join(self.directory, f"part-{number:05d}")
+        if "history" in rows[0]:
+            with open(base + ".jsonl.tmp", "w") as f:
+                for row in rows:
+                    f.write(json.dumps({"index": row["index"], "history": row["history"]}) + "\n")
+            os.replace(base + ".jsonl.tmp", base + ".jsonl")
+
+        # The CSV part is written last; its presence marks the chunk as complete
+        with open(base + ".csv.tmp", "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(base + ".csv.tmp", base + ".csv")
+
+    def write(self, rows) -> int:
+        """Consumes a row generator, flushing every chunk_size rows. Returns rows written."""
+        number = len(self._parts())
+        written = 0
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == self.chunk_size:
+                self._write_part(number, chunk)
+                number += 1
+                written += len(chunk)
+                chunk = []
+        if chunk:
+            self._write_part(number, chunk)
+            written += len(chunk)
+        return written
+
+    def read(self):
+        """Yields every summary row on disk, in grid order."""
+        for path in self._parts():
+            with open(path, newline="") as f:
+                for row in csv.DictReader(f):
+                    yield {name: FIELD_TYPES[name](value) for name, value in row.items()}
+
+    def read_histories(self):
+        """Yields (index, history) for every scenario written with its history."""
+        for path in sorted(glob.glob(os.path.join(self.directory, "part-*.jsonl"))):
+            with open(path) as f:
+                for line in f:
+                    record = json.loads(line)
+                    yield record["index"], record["history"]
+
+
+def stream_sweep(
+    directory: str,
+    deposit_rates: list[float],
+    overpayment_rates: list[float],
+    strategy_codes: list[str],
+    income: int = 1800,
+    current_saving: int = 5000,
+    chunk_size: int = 10000,
+    include_history: bool = False,
+    resume: bool = True
+) -> dict:
+    """
+    Writes every scenario of the grid to directory, skipping those already written when resuming.
+    Raises ValueError when resuming into results of a different sweep; resume=False starts over.
+    """
+    sink = ResultSink(directory, chunk_size)
+    manifest = sweep_manifest(deposit_rates, overpayment_rates, strategy_codes, income, current_saving, include_history)
+    done = sink.completed_count() if resume else 0
+    if done and sink.read_manifest() != manifest:
+        raise ValueError(f"{directory} holds results of a different sweep")
+    if not done:
+        sink.clear()
+        sink.write_manifest(manifest)
+
+    scenarios = islice(iter_grid(deposit_rates, strategy_codes, overpayment_rates), done, None)
+    written = sink.write(simulate_scenarios(scenarios, income, current_saving, include_history))
+    return {"skipped": done, "written": written}
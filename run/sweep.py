@@ -0,0 +1,110 @@
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.simulation import test_strategy
+from utils import profiling
+
+"""
+Process-pool version of run.find_optimal_strategy.
+The deposit x strategy x overpayment grid is numbered in the same order as the serial
+triple loop, split into chunks and simulated across worker processes. Each worker returns
+the best result of its chunk and the chunks are reduced with the serial tie-break
+(fewest months, then highest net assets, then earliest in loop order), so the winner is
+identical to the serial path regardless of how the work was scheduled.
+When profiling is enabled each worker profiles its own chunks and the parent merges them.
+"""
+
+
+def iter_grid(deposit_rates: list[float], strategy_codes: list[str], overpayment_rates: list[float]):
+    """Yields (index, deposit, strategy, overpayment) in the serial loop order."""
+    index = 0
+    for deposit in deposit_rates:
+        for strategy in strategy_codes:
+            for overpayment in overpayment_rates:
+                yield index, deposit, strategy, overpayment
+                index += 1
+
+
+def chunk_grid(grid, chunk_size: int):
+    """Groups grid entries into lists of at most chunk_size."""
+    chunk = []
+    for entry in grid:
+        chunk.append(entry)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def result_key(result: tuple):
+    """Sort key for (index, months, net_assets, ...) results; the smallest key is the winner."""
+    index, months, net_assets = result[:3]
+    return months, -net_assets, index
+
+
+def run_chunk(chunk: list[tuple], income: int, current_saving: int):
+    """Simulates one chunk and returns its best (index, months, net_assets, deposit, strategy, overpayment)."""
+    best = None
+    for index, deposit, strategy, overpayment in chunk:
+        months, net_assets, _ = test_strategy(
+            income=income,
+            current_saving=current_saving,
+            overpayment_pct=overpayment,
+            strategy=strategy,
+            deposit=deposit,
+            history_mode="off"
+        )
+        result = (index, months, net_assets, deposit, strategy, overpayment)
+        if best is None or result_key(result) < result_key(best):
+            best = result
+    return best
+
+
+def profiled_chunk(chunk: list[tuple], income: int, current_saving: int):
+    """run_chunk under profiling; returns its result and the chunk's profiling.snapshot()."""
+    with profiling.profile():
+        best = run_chunk(chunk, income, current_saving)
+    return best, profiling.snapshot()
+
+
+def find_optimal_strategy_parallel(
+    deposit_rates: list[float],
+    overpayment_rates: list[float],
+    strategy_codes: list[str],
+    income: int = 1800,
+    current_saving: int = 5000,
+    processes: int = None,
+    chunk_size: int = None
+):
+    """
+    Parallel find_optimal_strategy. processes defaults to os.cpu_count(); chunk_size defaults
+    to roughly four chunks per worker. Returns the same tuple as the serial search.
+    """
+    processes = processes or os.cpu_count() or 1
+    total = len(deposit_rates) * len(strategy_codes) * len(overpayment_rates)
+    if total == 0:
+        return float('inf'), None, None, None, float('-inf')
+    chunk_size = chunk_size or max(1, -(-total // (processes * 4)))
+
+    chunks = chunk_grid(iter_grid(deposit_rates, strategy_codes, overpayment_rates), chunk_size)
+    if processes == 1:
+        results = [run_chunk(chunk, income, current_saving) for chunk in chunks]
+    else:
+        profile = profiling.enabled
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [
+                pool.submit(profiled_chunk if profile else run_chunk, chunk, income, current_saving)
+                for chunk in chunks
+            ]
+            results = [future.result() for future in futures]
+        if profile:
+            for _, worker_profile in results:
+                profiling.merge(worker_profile)
+            results = [best for best, _ in results]
+
+    _, months, net_assets, deposit, strategy, overpayment = min(results, key=result_key)
+    return months, strategy, overpayment, deposit, net_assets
@@ -0,0 +1,68 @@
+"""
+Unit tests for ParetoFrontier and pareto_frontier in investments.run.pareto (run/pareto.py)
+Covers: happy paths, edge cases.
+"""
+
+import random
+
+import pytest
+
+from investments.run.pareto import ParetoFrontier, pareto_frontier
+
+
+def brute_force(results):
+    return [
+        r for i, r in enumerate(results)
+        if not any(
+            (o[0] <= r[0] and o[1] >= r[1]) and (o[:2] != r[:2] or j < i)
+            for j, o in enumerate(results) if j != i
+        )
+    ]
+
+
+class TestParetoFrontier:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("seed", range(5))
+    def test_incremental_matches_sort_and_brute_force(self, seed):
+        """
+        Test that streaming, sorting and brute force agree on random results with ties.
+        """
+        rng = random.Random(seed)
+        results = [(rng.randint(30, 60), rng.randint(0, 40) * 1000.0, i) for i in range(300)]
+        frontier = ParetoFrontier()
+        for months, net_assets, i in results:
+            frontier.add(months, net_assets, i)
+        expected = sorted(brute_force(results))
+        assert [(m, a, i) for m, a, i in frontier] == expected
+        assert pareto_frontier(results) == expected
+        assert frontier.seen == len(results)
+
+    @pytest.mark.happy_path
+    def test_update_from_rows(self):
+        """
+        Test that dict rows are folded in and kept with their points.
+        """
+        rows = [
+            {"months": 40, "net_assets": 50000.0, "strategy": "FF"},
+            {"months": 36, "net_assets": 46000.0, "strategy": "FH"},
+            {"months": 41, "net_assets": 49000.0, "strategy": "HH"},
+        ]
+        frontier = ParetoFrontier().update(rows)
+        assert frontier.points() == [(36, 46000.0), (40, 50000.0)]
+        assert [row["strategy"] for _, _, row in frontier] == ["FH", "FF"]
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_new_point_replaces_dominated_ones(self):
+        """
+        Test that a point better on both axes removes everything it dominates.
+        """
+        frontier = ParetoFrontier()
+        for months, net_assets in [(40, 10.0), (45, 20.0), (50, 30.0)]:
+            frontier.add(months, net_assets)
+        assert frontier.add(40, 25.0)
+        assert frontier.points() == [(40, 25.0), (50, 30.0)]
+        assert not frontier.add(50, 30.0)
@@ -0,0 +1,153 @@
+"""
+Unit tests for extract_series, draw_chart and render_report in investments.run.plots (run/plots.py)
+Covers: happy paths, edge cases.
+"""
+
+import os
+import pytest
+import matplotlib
+import matplotlib.pyplot as plt
+
+# Use the Agg backend for matplotlib to avoid GUI issues during testing
+matplotlib.use("Agg")
+
+from investments.run.plots import (
+    REPORT_CHARTS,
+    draw_chart,
+    extract_series,
+    plot_equity_per_property,
+    plot_ltv_ratios,
+    plot_net_worth,
+    plot_property_value_vs_mortgage,
+    plot_savings_over_time,
+    render_report,
+    test_strategy as run_strategy,
+)
+
+@pytest.fixture(scope="module")
+def history():
+    """A real history from the simulation that owns more than one property."""
+    _, _, history = run_strategy(1800, 5000, 0.75, "FFF", 0.05)
+    return history
+
+def plotted(plot, history, mocker):
+    """Runs one of the plot_* helpers and returns the (x, y) of every line it drew."""
+    plt.close("all")
+    mocker.patch("matplotlib.pyplot.show")
+    plot(history)
+    lines = [(list(line.get_xdata()), list(line.get_ydata())) for line in plt.gca().lines]
+    plt.close("all")
+    return lines
+
+def drawn(name, history):
+    """Draws one report chart and returns the (x, y) of every line on it."""
+    ax = draw_chart(name, extract_series(history)).axes[0]
+    return [(list(line.get_xdata()), list(line.get_ydata())) for line in ax.lines]
+
+class TestExtractSeries:
+
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("chart, plot", [
+        ("savings", plot_savings_over_time),
+        ("property_value_vs_mortgage", plot_property_value_vs_mortgage),
+        ("ltv_ratios", plot_ltv_ratios),
+        ("net_worth", plot_net_worth),
+        ("equity", plot_equity_per_property),
+    ])
+    def test_charts_match_plot_helpers(self, history, mocker, chart, plot):
+        """
+        Test that every report chart draws the same lines as the matching plot_* helper.
+        """
+        expected = plotted(plot, history, mocker)
+        assert expected
+        assert drawn(chart, history) == expected
+
+    @pytest.mark.happy_path
+    def test_series_cover_every_property(self, history):
+        """
+        Test that each property gets its own series starting from the month it was bought.
+        """
+        series = extract_series(history)
+        assert len(series["properties"]) == len(history[-1]["properties"]) > 1
+        for i, data in series["properties"].items():
+            first_month = next(entry["month"] for entry in history if len(entry["properties"]) > i)
+            assert data["months"][0] == first_month
+        assert series["months"] == [entry["month"] for entry in history]
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_empty_history(self):
+        """
+        Test that an empty history gives empty series.
+        """
+        assert extract_series([]) == {"months": [], "savings": [], "net_worth": [], "properties": {}}
+
+    @pytest.mark.edge_case
+    def test_unknown_chart_raises(self, history):
+        """
+        Test that draw_chart rejects a chart that is not in REPORT_CHARTS.
+        """
+        with pytest.raises(ValueError):
+            draw_chart("pie", extract_series(history))
+
+class TestRenderReport:
+
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    def test_writes_every_chart_and_index(self, history, tmp_path):
+        """
+        Test that each scenario produces one file per chart plus a single index.html.
+        """
+        histories = {"first": history, "second": history[:10]}
+        index = render_report(histories, str(tmp_path), processes=1)
+
+        assert index == os.path.join(str(tmp_path), "index.html")
+        expected = {f"{name}_{chart}.png" for name in histories for chart in REPORT_CHARTS}
+        assert set(os.listdir(tmp_path)) == expected | {"index.html"}
+        with open(index) as f:
+            content = f.read()
+        for filename in expected:
+            assert f'src="{filename}"' in content
+
+    @pytest.mark.happy_path
+    def test_pool_matches_serial(self, history, tmp_path):
+        """
+        Test that rendering in a process pool writes the same files and index as processes=1.
+        """
+        histories = {"first": history, "second": history[:10]}
+        serial = tmp_path / "serial"
+        pooled = tmp_path / "pooled"
+        render_report(histories, str(serial), processes=1)
+        render_report(histories, str(pooled), processes=2)
+
+        assert sorted(os.listdir(serial)) == sorted(os.listdir(pooled))
+        for filename in os.listdir(serial):
+            assert (serial / filename).read_bytes() == (pooled / filename).read_bytes()
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    @pytest.mark.parametrize("name", ["../escape", "a/b", "..", ""])
+    def test_rejects_names_outside_directory(self, history, tmp_path, name):
+        """
+        Test that scenario names that would write outside the report directory are rejected
+        before anything is written.
+        """
+        directory = tmp_path / "report"
+        with pytest.raises(ValueError):
+            render_report({"ok": history, name: history}, str(directory), processes=1)
+        assert not directory.exists()
+
+    @pytest.mark.edge_case
+    def test_escapes_names_in_index(self, history, tmp_path):
+        """
+        Test that scenario names are HTML-escaped in the index.
+        """
+        index = render_report({"a<b>&c": history[:5]}, str(tmp_path), processes=1)
+        with open(index) as f:
+            content = f.read()
+        assert "<th>a&lt;b&gt;&amp;c</th>" in content
@@ -0,0 +1,50 @@
+"""
+Unit tests for find_optimal_strategy_batch in investments.run.run (run/run.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.run.run import find_optimal_strategy, find_optimal_strategy_batch
+
+
+class TestFindOptimalStrategyBatch:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    def test_matches_serial_winner(self):
+        """
+        Test that the vectorised grid picks the serial loop's winner.
+        """
+        deposits = [0.05, 0.10]
+        overpayments = [i / 20 for i in range(21)]
+        strategies = ["HH", "FF", "HF", "FH"]
+        expected = find_optimal_strategy(deposits, overpayments, strategies)
+        assert find_optimal_strategy_batch(deposits, overpayments, strategies) == expected
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_ties_keep_first_in_loop_order(self):
+        """
+        Test that exact ties from repeated grid values resolve to the first scenario, as in the serial loop.
+        """
+        deposits = [0.10, 0.05, 0.10]
+        overpayments = [1.0, 0.0, 0.3, 1.0]
+        strategies = ["FF", "HF", "FF"]
+        expected = find_optimal_strategy(deposits, overpayments, strategies)
+        assert find_optimal_strategy_batch(deposits, overpayments, strategies) == expected
+
+    @pytest.mark.edge_case
+    @pytest.mark.parametrize("deposits, overpayments, strategies", [
+        ([0.05, 0.10], [], ["FF"]),
+        ([], [0.5], ["FF"]),
+        ([0.10], [0.5], []),
+    ])
+    def test_empty_grid(self, deposits, overpayments, strategies):
+        """
+        Test that an empty grid returns the serial loop's initial values.
+        """
+        result = find_optimal_strategy_batch(deposits, overpayments, strategies)
+        assert result == (float('inf'), None, None, None, float('-inf'))
+        assert result == find_optimal_strategy(deposits, overpayments, strategies)
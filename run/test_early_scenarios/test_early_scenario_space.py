@@ -0,0 +1,74 @@
+"""
+Unit tests for ScenarioSpace in investments.run.scenarios (run/scenarios.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.run.scenarios import ScenarioSpace, run_scenario
+from investments.strategies.simulation import test_strategy as run_strategy
+
+
+class TestScenarioSpace:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    def test_indexing_matches_enumeration(self):
+        """
+        Test that decoding an index gives the scenario enumerated at that position.
+        """
+        space = ScenarioSpace(income=[1500, 1800], current_saving=range(0, 3000, 1000), overpayment_pct=[0.0, 0.5])
+        scenarios = list(space)
+        assert len(scenarios) == space.size == 2 * 3 * 2 * 4 * 2
+        assert [space[i] for i in range(space.size)] == scenarios
+        assert space[-1] == scenarios[-1]
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("workers", [1, 3, 7])
+    def test_shards_cover_space_in_order(self, workers):
+        """
+        Test that the shards of all workers concatenate to the whole space.
+        """
+        space = ScenarioSpace(income=[1500, 1800, 2100], overpayment_pct=[0.0, 0.25, 0.5])
+        shards = [scenario for worker in range(workers) for scenario in space.shard(worker, workers)]
+        assert shards == list(space)
+
+    @pytest.mark.happy_path
+    def test_latin_hypercube_uses_every_stratum(self):
+        """
+        Test that with n equal to an axis length every value of that axis is used once.
+        """
+        space = ScenarioSpace(income=range(1500, 2500, 100), overpayment_pct=[i / 10 for i in range(10)])
+        scenarios = space.latin_hypercube(10, seed=1)
+        assert sorted(s.income for s in scenarios) == list(range(1500, 2500, 100))
+        assert sorted(s.overpayment_pct for s in scenarios) == [i / 10 for i in range(10)]
+
+    @pytest.mark.happy_path
+    def test_default_market_matches_test_strategy(self):
+        """
+        Test that the default price scale and interest rate reproduce test_strategy.
+        """
+        space = ScenarioSpace(overpayment_pct=[0.3])
+        for scenario in space:
+            expected = run_strategy(1800, 5000, 0.3, scenario.strategy, scenario.deposit, history_mode="off")
+            assert run_scenario(scenario) == expected[:2]
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_huge_space_is_not_materialised(self):
+        """
+        Test that size, indexing and sampling work on a space far too big to list.
+        """
+        space = ScenarioSpace(income=range(10 ** 6), current_saving=range(10 ** 6))
+        assert space.size == 10 ** 12 * 2 * 4 * 101
+        assert space[space.size - 1].income == 10 ** 6 - 1
+        assert len(set(space.sample(50, seed=0))) == 50
+
+    @pytest.mark.edge_case
+    def test_unknown_axis_raises(self):
+        """
+        Test that misspelled axes are rejected.
+        """
+        with pytest.raises(ValueError):
+            ScenarioSpace(incomes=[1800])
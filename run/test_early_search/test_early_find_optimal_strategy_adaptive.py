@@ -0,0 +1,70 @@
+"""
+Unit tests for find_optimal_strategy_adaptive in investments.run.search (run/search.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.run.search import find_optimal_strategy_adaptive, test_strategy as run_strategy
+
+DEPOSITS = [0.05, 0.10]
+STRATEGIES = ["HH", "FF", "HF", "FH"]
+GRID = [i / 100 for i in range(101)]
+
+
+def grid_optimum(income, current_saving):
+    """find_optimal_strategy's result on the 1% grid for any income and savings."""
+    best = None
+    for deposit in DEPOSITS:
+        for strategy in STRATEGIES:
+            for overpayment in GRID:
+                months, net_assets, _ = run_strategy(income, current_saving, overpayment, strategy, deposit, history_mode="off")
+                if best is None or (months, -net_assets) < (best[0], -best[4]):
+                    best = (months, strategy, overpayment, deposit, net_assets)
+    return best
+
+
+class TestFindOptimalStrategyAdaptive:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("income, current_saving", [(1800, 5000), (2500, 0)])
+    def test_at_least_as_good_as_the_grid_in_fewer_evaluations(self, income, current_saving):
+        """
+        Test that a 0.1% search beats or equals the 1% grid while simulating less than the grid.
+        """
+        result, stats = find_optimal_strategy_adaptive(DEPOSITS, STRATEGIES, income, current_saving, tolerance=0.001)
+        expected = grid_optimum(income, current_saving)
+        assert (result[0], -result[4]) <= (expected[0], -expected[4])
+        assert stats["evaluations"] < len(DEPOSITS) * len(STRATEGIES) * len(GRID)
+
+    @pytest.mark.happy_path
+    def test_result_is_a_real_scenario(self):
+        """
+        Test that the reported months and net assets are those of the reported scenario.
+        """
+        (months, strategy, overpayment, deposit, net_assets), _ = find_optimal_strategy_adaptive(DEPOSITS, STRATEGIES)
+        assert deposit in DEPOSITS
+        assert 0.0 <= overpayment <= 1.0
+        assert run_strategy(1800, 5000, overpayment, strategy, deposit, history_mode="off")[:2] == (months, net_assets)
+
+    @pytest.mark.happy_path
+    def test_evaluations_grow_with_resolution(self):
+        """
+        Test that the evaluation count is the coarse grid plus the refinement rounds.
+        """
+        _, coarse = find_optimal_strategy_adaptive([0.10], ["FF"], tolerance=0.1)
+        _, fine = find_optimal_strategy_adaptive([0.10], ["FF"], tolerance=0.001)
+        assert coarse["evaluations"] == 11
+        assert coarse["evaluations"] < fine["evaluations"] <= 11 + 7 * 3 * 2
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_no_strategies(self):
+        """
+        Test that an empty search returns find_optimal_strategy's initial values.
+        """
+        result, stats = find_optimal_strategy_adaptive(DEPOSITS, [])
+        assert result == (float('inf'), None, None, None, float('-inf'))
+        assert stats["evaluations"] == 0
@@ -0,0 +1,118 @@
+"""
+Unit tests for find_optimal_strategy_pruned and months_lower_bound in investments.run.search (run/search.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.run.search import find_optimal_strategy_pruned, months_lower_bound, test_strategy as run_strategy
+
+
+def exhaustive(deposit_rates, overpayment_rates, strategy_codes, income, current_saving):
+    """find_optimal_strategy's loop and tie-break for any income and savings."""
+    best = None
+    for deposit in deposit_rates:
+        for strategy in strategy_codes:
+            for overpayment in overpayment_rates:
+                months, net_assets, _ = run_strategy(
+                    income, current_saving, overpayment, strategy, deposit, history_mode="off"
+                )
+                if best is None or months < best[0] or (months == best[0] and net_assets > best[4]):
+                    best = (months, strategy, overpayment, deposit, net_assets)
+    return best
+
+
+class TestFindOptimalStrategyPruned:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("income, current_saving", [(1800, 5000), (1500, 20000), (2500, 0), (4000, 50000)])
+    def test_matches_exhaustive_search(self, income, current_saving):
+        """
+        Test that pruning returns the exhaustive optimum while skipping simulations.
+        """
+        deposits = [0.05, 0.10]
+        overpayments = [i / 20 for i in range(21)]
+        strategies = ["HH", "FF", "HF", "FH"]
+        result, stats = find_optimal_strategy_pruned(deposits, overpayments, strategies, income, current_saving)
+        assert result == exhaustive(deposits, overpayments, strategies, income, current_saving)
+        assert stats["total"] == stats["completed"] + stats["aborted"] + stats["skipped"]
+        assert stats["pruned"] > 0
+
+    @pytest.mark.happy_path
+    def test_three_property_strategies(self):
+        """
+        Test that the bound from the first two purchases is safe for longer strategies.
+        """
+        deposits = [0.05, 0.10]
+        overpayments = [i / 10 for i in range(11)]
+        strategies = ["FFF", "FHF", "HFH", "FF"]
+        result, _ = find_optimal_strategy_pruned(deposits, overpayments, strategies, 2200, 10000)
+        assert result == exhaustive(deposits, overpayments, strategies, 2200, 10000)
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("strategy", ["F", "HH", "FH", "FHF"])
+    @pytest.mark.parametrize("deposit", [0.05, 0.10])
+    def test_lower_bound_holds_for_every_rate(self, strategy, deposit):
+        """
+        Test that no overpayment rate finishes in fewer months than months_lower_bound.
+        """
+        bound = months_lower_bound(1800, 5000, strategy, deposit)
+        months = [run_strategy(1800, 5000, i / 50, strategy, deposit, history_mode="off")[0] for i in range(51)]
+        assert bound <= min(months)
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_ties_keep_first_in_loop_order(self):
+        """
+        Test that repeated scenarios, which tie exactly, resolve to the first in loop order.
+        """
+        deposits = [0.10, 0.05, 0.10]
+        overpayments = [0.3, 0.0, 0.3, 1.0]
+        strategies = ["FF", "HF", "FF"]
+        result, _ = find_optimal_strategy_pruned(deposits, overpayments, strategies)
+        assert result == exhaustive(deposits, overpayments, strategies, 1800, 5000)
+
+    @pytest.mark.edge_case
+    def test_empty_grid(self):
+        """
+        Test that an empty grid returns find_optimal_strategy's initial values.
+        """
+        result, stats = find_optimal_strategy_pruned([0.05], [], ["FF"])
+        assert result == (float('inf'), None, None, None, float('-inf'))
+        assert stats["total"] == 0
+
+
+class TestMaxMonths:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("history_mode", ["list", "off", "lazy"])
+    @pytest.mark.parametrize("max_months", [3, 20, 40])
+    def test_abandons_run_over_budget(self, history_mode, max_months):
+        """
+        Test that a run needing more months returns (months > max_months, None, history).
+        """
+        months, _, _ = run_strategy(1800, 5000, 0.5, "FF", 0.1, history_mode="off")
+        assert months > 40
+        aborted, net_assets, history = run_strategy(
+            1800, 5000, 0.5, "FF", 0.1, history_mode=history_mode, max_months=max_months
+        )
+        assert aborted > max_months
+        assert net_assets is None
+        if history_mode == "off":
+            assert history is None
+        else:
+            assert len(history) <= max_months
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_budget_equal_to_months_completes(self):
+        """
+        Test that a run finishing exactly on the budget returns its normal result.
+        """
+        expected = run_strategy(1800, 5000, 0.5, "FF", 0.1)
+        assert run_strategy(1800, 5000, 0.5, "FF", 0.1, max_months=expected[0]) == expected
+        assert run_strategy(1800, 5000, 0.5, "FF", 0.1, max_months=expected[0] - 1)[1] is None
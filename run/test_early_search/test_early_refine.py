@@ -0,0 +1,41 @@
+"""
+Unit tests for refine in investments.run.search (run/search.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.run.search import refine
+
+
+class TestRefine:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    def test_finds_minimum_to_tolerance(self):
+        """
+        Test that a single-dimension minimum is located to within the tolerance.
+        """
+        point, score, scores = refine(lambda x: abs(x - 0.3137), [(0.0, 1.0)], 0.001)
+        assert abs(point[0] - 0.3137) <= 0.001
+        assert len(scores) < 100
+
+    @pytest.mark.happy_path
+    def test_two_dimensions(self):
+        """
+        Test that both dimensions are refined.
+        """
+        point, _, _ = refine(lambda x, y: (x - 0.42) ** 2 + (y - 0.07) ** 2, [(0.0, 1.0), (0.05, 0.2)], 0.001)
+        assert abs(point[0] - 0.42) <= 0.001
+        assert abs(point[1] - 0.07) <= 0.001
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_fixed_dimension_is_not_searched(self):
+        """
+        Test that a zero-width range stays at its value and points stay inside the bounds.
+        """
+        point, _, scores = refine(lambda x, y: -x, [(0.0, 1.0), (0.1, 0.1)], 0.01)
+        assert point == (1.0, 0.1)
+        assert all(0.0 <= x <= 1.0 and y == 0.1 for x, y in scores)
@@ -0,0 +1,196 @@
+"""
+Unit tests for MicroBatcher and make_server in investments.run.service (run/service.py)
+Covers: happy paths, edge cases.
+"""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from investments.run import service
+from investments.run.service import MicroBatcher, make_server
+from investments.strategies.simulation import test_strategy as run_strategy
+
+
+def scenario(pct, strategy="FF"):
+    return {"income": 1800, "current_saving": 5000, "overpayment_pct": pct, "strategy": strategy, "deposit": 0.1}
+
+
+def post(server, body: bytes):
+    """(status, JSON body) of a POST to /simulate."""
+    request = urllib.request.Request(f"http://127.0.0.1:{server.server_port}/simulate", data=body)
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+@pytest.fixture
+def batcher():
+    batcher = MicroBatcher(window=0.05)
+    yield batcher
+    batcher.close()
+
+
+class TestMicroBatcher:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    def test_concurrent_requests_share_a_batch(self, batcher):
+        """
+        Test that requests submitted together are evaluated in one batch with exact results.
+        """
+        rates = [i / 10 for i in range(11)]
+        futures = [batcher.submit(scenario(pct, strategy)) for pct in rates for strategy in ("FF", "HF")]
+        results = [future.result(timeout=10) for future in futures]
+        expected = [run_strategy(1800, 5000, pct, strategy, 0.1)[:2] for pct in rates for strategy in ("FF", "HF")]
+        assert results == expected
+        assert batcher.metrics()["batches"] == 1
+
+    @pytest.mark.happy_path
+    def test_repeat_query_served_from_cache(self, batcher):
+        """
+        Test that a repeated scenario is answered from the cache without another batch.
+        """
+        first = batcher.submit(scenario(0.5)).result(timeout=10)
+        assert batcher.submit(scenario(0.5)).result(timeout=10) == first
+        metrics = batcher.metrics()
+        assert metrics["cache_hits"] == 1
+        assert metrics["batches"] == 1
+        assert metrics["latency_ms"]["p50"] >= 0
+
+    @pytest.mark.happy_path
+    def test_http_round_trip(self, batcher):
+        """
+        Test that the localhost HTTP endpoint returns the simulation result.
+        """
+        server = make_server(batcher, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            request = urllib.request.Request(
+                f"http://127.0.0.1:{server.server_port}/simulate", data=json.dumps(scenario(0.3)).encode()
+            )
+            with urllib.request.urlopen(request, timeout=10) as response:
+                body = json.loads(response.read())
+        finally:
+            server.shutdown()
+            server.server_close()
+        months, net_assets, _ = run_strategy(1800, 5000, 0.3, "FF", 0.1)
+        assert body == {"months": months, "net_assets": net_assets}
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_failing_scenario_does_not_fail_its_batch(self, batcher, monkeypatch):
+        """
+        Test that an invalid scenario gets an error while the rest of its batch succeeds
+        in a single simulate_batch call, without falling back to one call per scenario.
+        """
+        calls = []
+        simulate_batch = service.simulate_batch
+
+        def counting(incomes, *args, **kwargs):
+            calls.append(len(incomes))
+            return simulate_batch(incomes, *args, **kwargs)
+        monkeypatch.setattr(service, "simulate_batch", counting)
+
+        # Buys the first flat outright, then cannot pay its expenses while saving for the second
+        bad = dict(scenario(0.5), income=300, current_saving=100000)
+        futures = [
+            batcher.submit(scenario(0.2)),
+            batcher.submit(bad),
+            batcher.submit(scenario(0.4, "HF")),
+            batcher.submit({"income": 1800}),
+        ]
+        assert futures[0].result(timeout=10) == run_strategy(1800, 5000, 0.2, "FF", 0.1)[:2]
+        assert futures[2].result(timeout=10) == run_strategy(1800, 5000, 0.4, "HF", 0.1)[:2]
+        with pytest.raises(ValueError, match="expenses"):
+            futures[1].result(timeout=10)
+        with pytest.raises(ValueError):
+            futures[3].result(timeout=10)
+        assert calls == [2]
+
+    @pytest.mark.edge_case
+    @pytest.mark.parametrize("change", [
+        {"deposit": float("inf")},
+        {"deposit": float("nan")},
+        {"deposit": 1e300},
+        {"deposit": 0},
+        {"income": float("inf")},
+        {"current_saving": -1},
+        {"overpayment_pct": 1.5},
+        {"strategy": "F" * 21},
+        {"income": 300, "current_saving": 100000},
+        {"income": 150, "current_saving": 100000, "strategy": "HF"},
+    ])
+    def test_rejects_out_of_range_values(self, batcher, change):
+        """
+        Test that non-finite or out-of-range inputs are refused before they reach the worker.
+        """
+        future = batcher.submit(dict(scenario(0.5), **change))
+        assert future.done()
+        with pytest.raises(ValueError):
+            future.result()
+
+    @pytest.mark.edge_case
+    @pytest.mark.parametrize("change", [
+        {"income": 1000.1, "current_saving": 0},  # saves 10p a month while renting
+        {"income": 325.5, "current_saving": 25000},  # 50p a month over the flat's expenses
+    ])
+    def test_slow_scenarios_stop_at_the_month_budget(self, batcher, change):
+        """
+        Test that a scenario needing more than max_months gets an error quickly.
+        """
+        started = time.perf_counter()
+        with pytest.raises(ValueError, match="more than"):
+            batcher.submit(dict(scenario(0.5), **change)).result(timeout=10)
+        assert time.perf_counter() - started < 5
+        assert batcher.submit(scenario(0.5)).result(timeout=10) == run_strategy(1800, 5000, 0.5, "FF", 0.1)[:2]
+
+    @pytest.mark.edge_case
+    def test_worker_survives_unexpected_errors(self, batcher, monkeypatch):
+        """
+        Test that any exception reaches the batch's futures and the worker keeps serving.
+        """
+        def broken(*args, **kwargs):
+            raise RuntimeError("engine failed")
+        monkeypatch.setattr(service, "simulate_batch", broken)
+        with pytest.raises(RuntimeError):
+            batcher.submit(scenario(0.1)).result(timeout=10)
+
+        monkeypatch.setattr(batcher, "_simulate", broken)
+        with pytest.raises(RuntimeError):
+            batcher.submit(scenario(0.2)).result(timeout=10)
+
+        monkeypatch.undo()
+        assert batcher.submit(scenario(0.3)).result(timeout=10) == run_strategy(1800, 5000, 0.3, "FF", 0.1)[:2]
+
+    @pytest.mark.edge_case
+    def test_http_errors(self, batcher, monkeypatch):
+        """
+        Test that invalid JSON values get 422 and a simulation past the timeout gets 503.
+        """
+        server = make_server(batcher, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            body = json.dumps(scenario(0.5)).replace("0.1}", "Infinity}").encode()
+            status, reply = post(server, body)
+            assert status == 422
+            assert "finite" in reply["error"]
+
+            simulate_batch = service.simulate_batch
+            def slow(*args, **kwargs):
+                time.sleep(0.5)
+                return simulate_batch(*args, **kwargs)
+            monkeypatch.setattr(service, "simulate_batch", slow)
+            monkeypatch.setattr(server.RequestHandlerClass, "timeout_s", 0.05)
+            status, reply = post(server, json.dumps(scenario(0.7)).encode())
+            assert status == 503
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,112 @@
+"""
+Unit tests for stream_sweep and ResultSink in investments.run.sink (run/sink.py)
+Covers: happy paths, edge cases.
+"""
+
+import os
+
+import pytest
+
+from investments.run.sink import MANIFEST, ResultSink, stream_sweep, test_strategy as run_strategy
+
+DEPOSITS = [0.05, 0.10]
+OVERPAYMENTS = [0.0, 0.5, 1.0]
+STRATEGIES = ["FF", "HF"]
+
+
+def expected_rows(income=1800, current_saving=5000):
+    rows = []
+    for deposit in DEPOSITS:
+        for strategy in STRATEGIES:
+            for overpayment in OVERPAYMENTS:
+                months, net_assets, _ = run_strategy(income, current_saving, overpayment, strategy, deposit)
+                rows.append((len(rows), deposit, strategy, overpayment, months, net_assets))
+    return rows
+
+
+def summary(rows):
+    return [
+        (r["index"], r["deposit"], r["strategy"], r["overpayment_pct"], r["months"], r["net_assets"])
+        for r in rows
+    ]
+
+
+class TestStreamSweep:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    def test_writes_grid_in_chunks(self, tmp_path):
+        """
+        Test that the grid is split into chunk_size parts and read back in grid order.
+        """
+        stats = stream_sweep(str(tmp_path), DEPOSITS, OVERPAYMENTS, STRATEGIES, chunk_size=5)
+        assert stats == {"skipped": 0, "written": 12}
+        parts = sorted(name for name in os.listdir(tmp_path) if name.endswith(".csv"))
+        assert parts == ["part-00000.csv", "part-00001.csv", "part-00002.csv"]
+        sink = ResultSink(str(tmp_path))
+        assert sink.completed_count() == 12
+        assert summary(sink.read()) == expected_rows()
+
+    @pytest.mark.happy_path
+    def test_resumes_after_last_complete_part(self, tmp_path):
+        """
+        Test that an interrupted sweep only simulates the scenarios missing from disk.
+        """
+        stream_sweep(str(tmp_path), DEPOSITS, OVERPAYMENTS, STRATEGIES, chunk_size=5)
+        os.remove(tmp_path / "part-00002.csv")  # interrupted before the last chunk landed
+        stats = stream_sweep(str(tmp_path), DEPOSITS, OVERPAYMENTS, STRATEGIES, chunk_size=5)
+        assert stats == {"skipped": 10, "written": 2}
+        assert summary(ResultSink(str(tmp_path)).read()) == expected_rows()
+
+    @pytest.mark.happy_path
+    def test_histories_are_written_next_to_parts(self, tmp_path):
+        """
+        Test that include_history stores each scenario's history under its index.
+        """
+        stream_sweep(str(tmp_path), [0.10], [0.5], ["FF"], include_history=True)
+        (index, history), = ResultSink(str(tmp_path)).read_histories()
+        assert index == 0
+        assert history == run_strategy(1800, 5000, 0.5, "FF", 0.10)[2]
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    @pytest.mark.parametrize("change", [
+        {"income": 2500},
+        {"current_saving": 10000},
+        {"overpayment_rates": [0.0, 0.25, 0.5, 0.75, 1.0]},
+        {"strategy_codes": ["HF", "FF"]},
+        {"include_history": True},
+    ])
+    def test_refuses_to_resume_a_different_sweep(self, tmp_path, change):
+        """
+        Test that resuming with other axes, household or history setting leaves the results alone.
+        """
+        stream_sweep(str(tmp_path), DEPOSITS, OVERPAYMENTS, STRATEGIES, chunk_size=5)
+        os.remove(tmp_path / "part-00002.csv")
+        arguments = {"deposit_rates": DEPOSITS, "overpayment_rates": OVERPAYMENTS, "strategy_codes": STRATEGIES}
+        arguments.update(change)
+        with pytest.raises(ValueError):
+            stream_sweep(str(tmp_path), chunk_size=5, **arguments)
+        assert summary(ResultSink(str(tmp_path)).read()) == expected_rows()[:10]
+
+    @pytest.mark.edge_case
+    def test_refuses_parts_without_manifest(self, tmp_path):
+        """
+        Test that results of unknown origin are never resumed.
+        """
+        stream_sweep(str(tmp_path), DEPOSITS, OVERPAYMENTS, STRATEGIES)
+        os.remove(tmp_path / MANIFEST)
+        with pytest.raises(ValueError):
+            stream_sweep(str(tmp_path), DEPOSITS, OVERPAYMENTS, STRATEGIES)
+
+    @pytest.mark.edge_case
+    def test_fresh_sweep_replaces_a_different_one(self, tmp_path):
+        """
+        Test that resume=False discards the old results and manifest.
+        """
+        stream_sweep(str(tmp_path), DEPOSITS, [0.0, 0.25, 0.5, 0.75, 1.0], STRATEGIES, income=2500, chunk_size=5)
+        stats = stream_sweep(str(tmp_path), DEPOSITS, OVERPAYMENTS, STRATEGIES, chunk_size=5, resume=False)
+        assert stats == {"skipped": 0, "written": 12}
+        assert summary(ResultSink(str(tmp_path)).read()) == expected_rows()
+        assert stream_sweep(str(tmp_path), DEPOSITS, OVERPAYMENTS, STRATEGIES) == {"skipped": 12, "written": 0}
@@ -0,0 +1,86 @@
+"""
+Unit tests for find_optimal_strategy_parallel in investments.run.sweep (run/sweep.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.run.run import find_optimal_strategy, MONTHLY_INCOME, INITIAL_SAVINGS
+from investments.run.sweep import find_optimal_strategy_parallel, iter_grid, profiling
+
+DEPOSITS = [0.05, 0.10]
+STRATEGIES = ["HH", "FF", "HF", "FH"]
+OVERPAYMENTS = [i / 20 for i in range(21)]
+
+
+class TestFindOptimalStrategyParallel:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("processes, chunk_size", [(1, None), (2, None), (2, 1), (3, 7)])
+    def test_matches_serial_winner(self, processes, chunk_size):
+        """
+        Test that the winner is the serial loop's however the grid is split across workers.
+        """
+        expected = find_optimal_strategy(DEPOSITS, OVERPAYMENTS, STRATEGIES)
+        result = find_optimal_strategy_parallel(
+            DEPOSITS, OVERPAYMENTS, STRATEGIES,
+            income=MONTHLY_INCOME, current_saving=INITIAL_SAVINGS, processes=processes, chunk_size=chunk_size
+        )
+        assert result == expected
+
+    @pytest.mark.happy_path
+    def test_grid_follows_serial_loop_order(self):
+        """
+        Test that grid indices number scenarios deposit-major, overpayment fastest.
+        """
+        grid = list(iter_grid([0.05, 0.1], ["HH", "FF"], [0.0, 1.0]))
+        assert grid[0] == (0, 0.05, "HH", 0.0)
+        assert grid[1] == (1, 0.05, "HH", 1.0)
+        assert grid[-1] == (7, 0.1, "FF", 1.0)
+
+    @pytest.mark.happy_path
+    def test_profile_merges_worker_counters(self):
+        """
+        Test that profiling a pooled sweep counts the workers' months and step() calls,
+        the same as profiling it in one process.
+        """
+        def profiled(processes):
+            with profiling.profile():
+                result = find_optimal_strategy_parallel(
+                    DEPOSITS, OVERPAYMENTS, STRATEGIES,
+                    income=MONTHLY_INCOME, current_saving=INITIAL_SAVINGS, processes=processes
+                )
+            return result, profiling.counters(), {row["function"]: row["calls"] for row in profiling.trace.timing_report()}
+
+        serial = profiled(1)
+        pooled = profiled(2)
+        assert serial[1]["step_calls"] > 0
+        assert pooled == serial
+        assert not profiling.enabled
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_ties_keep_first_in_loop_order(self):
+        """
+        Test that equal results are resolved towards the earliest scenario, as in the serial loop.
+        """
+        # Repeated rates and strategies give identical results at different grid indices
+        overpayments = [1.0, 0.99, 1.0]
+        expected = find_optimal_strategy([0.10], overpayments, ["FF", "FF"])
+        for chunk_size in (1, 2):
+            result = find_optimal_strategy_parallel(
+                [0.10], overpayments, ["FF", "FF"],
+                income=MONTHLY_INCOME, current_saving=INITIAL_SAVINGS, processes=2, chunk_size=chunk_size
+            )
+            assert result == expected
+
+    @pytest.mark.edge_case
+    def test_empty_grid(self):
+        """
+        Test that an empty grid returns the serial loop's initial values.
+        """
+        assert find_optimal_strategy_parallel([], OVERPAYMENTS, STRATEGIES) == find_optimal_strategy(
+            [], OVERPAYMENTS, STRATEGIES
+        )
@@ -0,0 +1,183 @@
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from strategies.simulation import generate_property
+from utils.saving import costs
+from utils.overpayments import calculate_expenses
+from utils.repayment import annuity_factor, EPSILON
+
+"""
+Vectorised version of strategies.simulation.test_strategy.
+Every scenario of a grid is advanced together as NumPy arrays (savings, principal, LTV and
+phase per scenario), so widening the grid adds array length instead of Python loop iterations.
+The arithmetic mirrors the scalar engine operation for operation, so months_passed and
+total_net_assets match test_strategy exactly.
+"""
+
+
+def _phase_constants(prop_type: str, deposit: float) -> tuple:
+    """Per-property constants used by the batched phase loops, taken from the scalar model."""
+    prop = generate_property(prop_type, deposit)
+    numerator, denominator = annuity_factor(prop.mortgage.interest_rate, prop.mortgage.mortgage_length)
+    return (
+        prop.property_value,
+        prop.mortgage.mortgage_principal,
+        prop.mortgage.interest_rate / 12,
+        numerator,
+        denominator,
+        calculate_expenses(prop),
+        costs(prop, True, True) + prop.mortgage.deposit,  # first purchase
+        costs(prop, False, True) + prop.mortgage.deposit,  # later purchases
+    )
+
+
+def _gather_constants(strategies: list[str], deposits: np.ndarray, idx: np.ndarray, phase: int) -> list[np.ndarray]:
+    """Builds one array per phase constant for the scenarios in idx."""
+    cache = {}
+    rows = []
+    for i in idx:
+        key = (strategies[i][phase], float(deposits[i]))
+        if key not in cache:
+            cache[key] = _phase_constants(*key)
+        rows.append(cache[key])
+    return [np.array(column, dtype=float) for column in zip(*rows)]
+
+
+def _within_budget(active: np.ndarray, idx: np.ndarray, months: np.ndarray, max_months: int, aborted: np.ndarray):
+    """Marks the active scenarios of idx that have no months left as aborted; returns the others."""
+    over = active & (months[idx] >= max_months)
+    aborted[idx[over]] = True
+    return active & ~over
+
+
+def simulate_batch(income, current_saving, overpayment_pct, strategy: list[str], deposit, max_months: int = None):
+    """
+    Simulates many scenarios at once. income, current_saving, overpayment_pct and deposit
+    may be scalars or arrays broadcastable to len(strategy).
+    Returns (months_passed, total_net_assets) arrays, one entry per scenario. As with
+    test_strategy, a scenario needing more than max_months is abandoned: its months are
+    max_months + 1 and its net assets NaN.
+    Raises ValueError when income cannot cover rent or the expenses of a property.
+    """
+    strategies = list(strategy)
+    n = len(strategies)
+    income = np.broadcast_to(np.asarray(income, dtype=float), n)
+    saving = np.array(np.broadcast_to(np.asarray(current_saving, dtype=float), n))
+    overpayment_pct = np.broadcast_to(np.asarray(overpayment_pct, dtype=float), n)
+    deposits = np.broadcast_to(np.asarray(deposit, dtype=float), n)
+    lengths = np.array([len(s) for s in strategies], dtype=int)
+
+    months = np.zeros(n, dtype=np.int64)
+    aborted = np.zeros(n, dtype=bool)
+    equity = np.zeros(n)  # equity of properties that are no longer being paid down
+    value = np.zeros(n)
+    principal = np.zeros(n)
+    rate = np.zeros(n)
+    pay_num = np.zeros(n)
+    pay_den = np.ones(n)
+    expenses = np.zeros(n)
+
+    for phase in range(lengths.max(initial=0)):
+        idx = np.flatnonzero((lengths > phase) & ~aborted)
+        if idx.size == 0:
+            break
+        (next_value, next_principal, next_rate, next_num, next_den,
+         next_expenses, first_cost, later_cost) = _gather_constants(strategies, deposits, idx, phase)
+
+        if phase == 0:
+            # Saving while renting until the first property is affordable
+            renting = income[idx] - 1000
+            sav = saving[idx]
+            mon = months[idx]
+            active = sav < first_cost
+            if (active & (renting <= 0)).any() and max_months is None:
+                raise ValueError("income does not cover rent")
+            if max_months is not None:
+                active &= mon < max_months
+            while active.any():
+                sav = np.where(active, sav + renting, sav)
+                mon = mon + active
+                active = sav < first_cost
+                if max_months is not None:
+                    active &= mon < max_months
+            saving[idx] = sav - first_cost
+            months[idx] = mon
+            over = sav < first_cost
+            aborted[idx[over]] = True
+        else:
+            max_overpayment = income[idx] - expenses[idx]
+            if (max_overpayment < 0).any():
+                raise ValueError("overpayment is negative: increase income")
+
+            required = later_cost
+            active = ((saving[idx] - required) < 0) | (principal[idx] / value[idx] > 0.75)
+            if max_months is not None:
+                active = _within_budget(active, idx, months, max_months, aborted)
+            # Scenarios that already bought their next property drop out of the working set
+            while active.any():
+                live = idx[active]
+                req = required[active]
+                max_op = max_overpayment[active]
+                sav = saving[live]
+                P = principal[live]
+
+                ltv = P / value[live]
+                split_overpay = np.floor(max_op * overpayment_pct[live])
+                overpay = np.where(
+                    ltv < 0.75, 0.0, np.where(sav > req, max_op, split_overpay)
+                )
+                saved = np.where(
+                    ltv < 0.75, max_op, np.where(sav > req, 0.0, max_op - split_overpay)
+                )
+                sav = sav + saved
+
+                fixed_payment = P * pay_num[live] / pay_den[live]
+                interest = np.round(P * rate[live] + EPSILON)
+                principal_payment = np.minimum(fixed_payment + overpay - interest, P)
+                stepped = np.maximum(0, P - principal_payment)
+
+                principal[live] = np.where(P > 0, stepped, P)
+                saving[live] = sav
+                months[live] += 1
+                active[active] = ((sav - req) < 0) | (principal[live] / value[live] > 0.75)
+                if max_months is not None:
+                    active = _within_budget(active, idx, months, max_months, aborted)
+
+            saving[idx] = saving[idx] - required
+            equity[idx] = equity[idx] + (value[idx] - principal[idx])
+
+        value[idx] = next_value
+        principal[idx] = next_principal
+        rate[idx] = next_rate
+        pay_num[idx] = next_num
+        pay_den[idx] = next_den
+        expenses[idx] = next_expenses
+
+    owned = lengths > 0
+    equity[owned] = equity[owned] + (value[owned] - principal[owned])
+    net_assets = equity + saving
+    if aborted.any():
+        months[aborted] = max_months + 1
+        net_assets[aborted] = np.nan
+    return months, net_assets
+
+
+def simulate_grid(income, current_saving, deposit_rates: list[float], strategy_codes: list[str], overpayment_rates: list[float]):
+    """
+    Runs every (deposit, strategy, overpayment) combination in one batch.
+    Returns (months_passed, total_net_assets) shaped (deposits, strategies, overpayments).
+    """
+    shape = (len(deposit_rates), len(strategy_codes), len(overpayment_rates))
+    deposit_grid, strategy_grid, overpayment_grid = np.meshgrid(
+        np.asarray(deposit_rates, dtype=float),
+        np.arange(len(strategy_codes)),
+        np.asarray(overpayment_rates, dtype=float),
+        indexing="ij",
+    )
+    strategies = [strategy_codes[i] for i in strategy_grid.ravel()]
+    months, net_assets = simulate_batch(
+        income, current_saving, overpayment_grid.ravel(), strategies, deposit_grid.ravel()
+    )
+    return months.reshape(shape), net_assets.reshape(shape)
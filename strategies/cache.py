@@ -0,0 +1,139 @@
+import sys
+import os
+import json
+import hashlib
+from functools import lru_cache
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from strategies.simulation import test_strategy
+
+"""
+Persistent on-disk cache of test_strategy results.
+Entries are content addressed: the key is a SHA-256 of the scenario parameters and of a
+fingerprint of the model source (property constants, generate_property, costs, repayment and
+overpayment rules), so editing any of those files starts a fresh key space and stale results
+are never returned. Old entries then simply age out.
+
+Each entry is one JSON file (floats round-trip exactly), written atomically. Reads refresh the
+file's mtime, and once the cache grows past max_bytes the least recently used entries are
+deleted.
+"""
+
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "investments")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_FILES = (
+    "properties.py",
+    "strategies/simulation.py",
+    "utils/saving.py",
+    "utils/repayment.py",
+    "utils/overpayments.py",
+)
+CACHED_HISTORY_MODES = ("list", "off")
+
+
+@lru_cache(maxsize=None)
+def model_fingerprint() -> str:
+    """Hash of the source files that determine a simulation's result."""
+    digest = hashlib.sha256()
+    for name in MODEL_FILES:
+        with open(os.path.join(ROOT, name), "rb") as f:
+            digest.update(name.encode() + b"\0" + f.read() + b"\0")
+    return digest.hexdigest()
+
+
+def scenario_key(
+    income: int,
+    current_saving: int,
+    overpayment_pct: float,
+    strategy: str,
+    deposit: float,
+    history_mode: str = "list",
+    max_months: int = None
+) -> str:
+    params = [income, current_saving, overpayment_pct, strategy, deposit, history_mode, max_months]
+    payload = json.dumps([model_fingerprint(), params])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, directory: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or DEFAULT_DIRECTORY
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self.size = sum(os.path.getsize(path) for path, _ in self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key[2:] + ".json")
+
+    def _entries(self):
+        """Yields (path, mtime) for every entry on disk."""
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json"):
+                    yield entry.path, entry.stat().st_mtime
+
+    def get(self, key: str):
+        """The cached (months, net_assets, history), or None."""
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                months, net_assets, history = json.load(f)
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return months, net_assets, history
+
+    def put(self, key: str, result):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps(list(result))
+        with open(path + ".tmp", "w") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Deletes least recently used entries until the cache fits in max_bytes."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        self.size = sum(os.path.getsize(path) for path, _ in entries)
+        for path, _ in entries:
+            if self.size <= self.max_bytes:
+                break
+            size = os.path.getsize(path)
+            os.remove(path)
+            self.size -= size
+
+    def clear(self):
+        for path, _ in list(self._entries()):
+            os.remove(path)
+        self.size = 0
+
+    def test_strategy(
+        self,
+        income: int,
+        current_saving: int,
+        overpayment_pct: float,
+        strategy: str,
+        deposit: float,
+        history_mode: str = "list",
+        max_months: int = None
+    ):
+        """test_strategy, answered from the cache when the same scenario has been run before."""
+        if history_mode not in CACHED_HISTORY_MODES:
+            return test_strategy(income, current_saving, overpayment_pct, strategy, deposit, history_mode, max_months)
+
+        key = scenario_key(income, current_saving, overpayment_pct, strategy, deposit, history_mode, max_months)
+        result = self.get(key)
+        if result is None:
+            result = test_strategy(income, current_saving, overpayment_pct, strategy, deposit, history_mode, max_months)
+            self.put(key, result)
+        return result
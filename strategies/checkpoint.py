@@ -0,0 +1,81 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from strategies.simulation import move_forward_n_months, net_assets, new_history
+
+"""
+Checkpointed simulation that reuses shared strategy prefixes.
+The state after every purchase is snapshotted in a trie rooted at (deposit, income, savings).
+Buying the first property does not depend on overpayment_pct, so "HF", "HH" and "H..." share
+one first-phase node for every rate; later purchases do depend on the rate, so their edges are
+keyed on (property type, overpayment_pct). Each distinct path is simulated once, however many
+strategies or grid points pass through it.
+"""
+
+
+class Snapshot:
+    __slots__ = ("months_passed", "properties", "current_saving", "history", "children")
+
+    def __init__(self, months_passed: int, properties: list, current_saving: float, history):
+        self.months_passed = months_passed
+        self.properties = properties
+        self.current_saving = current_saving
+        self.history = history
+        self.children = {}
+
+    def resume(self):
+        """Copies of the snapshotted state that the next phase is free to modify."""
+        properties = [p.clone() for p in self.properties]
+        history = self.history.copy() if self.history is not None else None
+        return properties, history
+
+
+class StrategyTrie:
+    def __init__(self, history_mode: str = "off"):
+        self.history_mode = history_mode
+        self.roots = {}
+        self.phases_simulated = 0
+        self.phases_reused = 0
+
+    def _root(self, income: int, current_saving: int, deposit: float) -> Snapshot:
+        key = (deposit, income, current_saving)
+        if key not in self.roots:
+            self.roots[key] = Snapshot(0, [], current_saving, new_history(self.history_mode))
+        return self.roots[key]
+
+    def run(self, income: int, current_saving: int, overpayment_pct: float, strategy: str, deposit: float):
+        """Same arguments and result as test_strategy, computing only the phases not seen before."""
+        node = self._root(income, current_saving, deposit)
+
+        for depth, prop_type in enumerate(strategy):
+            # The first purchase is the same for every overpayment rate
+            edge = prop_type if depth == 0 else (prop_type, overpayment_pct)
+            child = node.children.get(edge)
+            if child is None:
+                properties, history = node.resume()
+                months_passed, properties, saving = move_forward_n_months(
+                    income,
+                    node.current_saving,
+                    overpayment_pct,
+                    prop_type,
+                    properties,
+                    node.months_passed,
+                    history,
+                    deposit,
+                )
+                child = Snapshot(months_passed, properties, saving, history)
+                node.children[edge] = child
+                self.phases_simulated += 1
+            else:
+                self.phases_reused += 1
+            node = child
+
+        properties, history = node.resume()
+        return node.months_passed, net_assets(properties, node.current_saving), history
+
+    def clear(self):
+        """Drops every snapshot."""
+        self.roots = {}
+        self.phases_simulated = 0
+        self.phases_reused = 0
@@ -0,0 +1,253 @@
+import sys
+import os
+import math
+import heapq
+import itertools
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from strategies.simulation import generate_property, net_assets
+from utils.saving import costs, months_to_save
+from utils.overpayments import calculate_overpayment
+from utils.repayment import step, calculate_fixed_monthly_payment, annuity_factor, first_month_below
+
+"""
+Event-driven version of test_strategy.
+Between state changes every month of a phase is the same: the allocation between saving and
+overpaying only changes when the LTV drops below 0.75, when savings pass the amount needed
+for the next property, or when the mortgage is paid off. The simulation keeps a priority
+queue of events and, for the current regime, schedules the month each of those will happen;
+the state is then advanced straight to the earliest one and the regime is re-planned.
+
+In the default closed-form mode a jump costs O(1): savings grow linearly and the principal
+follows x_{t+1} = g * x_t - overpay with g = 1 + r - (payment factor), whose solution and
+crossing times are geometric (utils.repayment.first_month_below). This leaves out the
+monthly rounding of interest, so months and net assets are close to test_strategy rather
+than equal. With exact=True the same schedule is followed, but jumps are made month by month
+with the scalar engine's arithmetic and stop as soon as the regime really changes, which
+reproduces test_strategy exactly.
+
+Other events, e.g. a remortgage or the end of a fixed rate, can be added with schedule(); an
+event's action receives the simulation and may change it, after which the regime is
+re-planned.
+"""
+
+PURCHASE = "purchase"
+LTV_THRESHOLD = "ltv_threshold"
+SAVINGS_TARGET = "savings_target"
+PAYOFF = "payoff"
+HORIZON = "horizon"
+SCHEDULED = "scheduled"
+
+TARGET_LTV = 0.75
+RENT = 1000
+
+# Regimes of saving_vs_overpayment_allocation
+SAVE_ALL = "save"  # LTV below 0.75
+OVERPAY_ALL = "overpay"  # savings already cover the next property
+SPLIT = "split"
+
+
+class EventSimulation:
+    def __init__(
+        self,
+        income: int,
+        current_saving: int,
+        overpayment_pct: float,
+        strategy: str,
+        deposit: float,
+        exact: bool = False,
+        horizon: int = None
+    ):
+        self.income = income
+        self.saving = current_saving
+        self.overpayment_pct = overpayment_pct
+        self.strategy = strategy
+        self.deposit = deposit
+        self.exact = exact
+        self.horizon = horizon
+
+        self.month = 0
+        self.properties = []
+        self.log = []  # (month, kind) of every event handled
+        self._queue = []
+        self._order = itertools.count()
+        self._plan_version = 0
+        if horizon is not None:
+            self.schedule(horizon, None, HORIZON)
+
+    # ------------------- Scheduling -------------------
+
+    def schedule(self, month: int, action, kind: str = SCHEDULED):
+        """Runs action(simulation) at the start of month (before that month's allocation)."""
+        heapq.heappush(self._queue, (month, next(self._order), kind, None, action))
+
+    def _schedule_planned(self, months_ahead: int, kind: str):
+        heapq.heappush(self._queue, (self.month + months_ahead, next(self._order), kind, self._plan_version, None))
+
+    @property
+    def next_property(self):
+        return generate_property(self.strategy[len(self.properties)], self.deposit)
+
+    def _required(self) -> float:
+        prop = self.next_property
+        return costs(prop, not self.properties, True) + prop.mortgage.deposit
+
+    def _regime(self, required: float) -> str:
+        current = self.properties[-1]
+        if current.mortgage.mortgage_principal / current.property_value < TARGET_LTV:
+            return SAVE_ALL
+        if self.saving > required:
+            return OVERPAY_ALL
+        return SPLIT
+
+    def _ready(self, required: float) -> bool:
+        if not self.properties:
+            return self.saving >= required
+        current = self.properties[-1]
+        return not (self.saving - required < 0 or current.mortgage.mortgage_principal / current.property_value > TARGET_LTV)
+
+    def _allocation(self, regime: str, max_overpayment: float) -> tuple:
+        """(saved, overpaid) each month of a regime, as in saving_vs_overpayment_allocation."""
+        if regime == SAVE_ALL:
+            return max_overpayment, 0
+        if regime == OVERPAY_ALL:
+            return 0, max_overpayment
+        overpayment_applied = math.floor(max_overpayment * self.overpayment_pct)
+        return max_overpayment - overpayment_applied, overpayment_applied
+
+    def _plan(self):
+        """Schedules the events that end the current regime."""
+        self._plan_version += 1
+        required = self._required()
+        if self._ready(required):
+            self._schedule_planned(0, PURCHASE)
+            return
+
+        if not self.properties:
+            renting = self.income - RENT
+            if renting > 0:
+                self._schedule_planned(months_to_save(self.saving, renting, required), PURCHASE)
+            return
+
+        current = self.properties[-1]
+        max_overpayment = calculate_overpayment(current, self.income)
+        if max_overpayment is None:
+            raise ValueError("overpayment is negative: increase income")
+        regime = self._regime(required)
+        saved, overpaid = self._allocation(regime, max_overpayment)
+
+        if saved > 0:
+            self._schedule_planned(max(1, months_to_save(self.saving, saved, required)), SAVINGS_TARGET)
+        growth = self._growth(current)
+        principal = current.mortgage.mortgage_principal
+        if regime != SAVE_ALL:
+            months = first_month_below(principal, TARGET_LTV * current.property_value, growth, overpaid)
+            if months is not None:
+                self._schedule_planned(max(1, months), LTV_THRESHOLD)
+        if principal > 0:
+            months = first_month_below(principal, 0, growth, overpaid)
+            if months is not None:
+                self._schedule_planned(max(1, months), PAYOFF)
+
+    # ------------------- Advancing -------------------
+
+    @staticmethod
+    def _growth(prop) -> float:
+        """g in x_{t+1} = g * x_t - overpay when the payment is recalculated from the principal."""
+        numerator, denominator = annuity_factor(prop.mortgage.interest_rate, prop.mortgage.mortgage_length)
+        return 1 + prop.mortgage.interest_rate / 12 - numerator / denominator
+
+    def _advance(self, months: int):
+        """Moves the state forward by months, or in exact mode until the regime changes if sooner."""
+        if months <= 0:
+            return
+        if not self.properties:
+            if not self.exact:
+                self.saving += months * (self.income - RENT)
+                self.month += months
+                return
+            required = self._required()
+            for advanced in range(months):
+                if self._ready(required):
+                    return
+                self.month += 1
+                self.saving += self.income - RENT
+            return
+
+        current = self.properties[-1]
+        max_overpayment = calculate_overpayment(current, self.income)
+        required = self._required()
+        regime = self._regime(required)
+        saved, overpaid = self._allocation(regime, max_overpayment)
+
+        if self.exact:
+            for advanced in range(months):
+                if self._ready(required) or self._regime(required) != regime:
+                    return
+                self.month += 1
+                self.saving += saved
+                step(current, calculate_fixed_monthly_payment(current), overpaid)
+            return
+
+        mortgage = current.mortgage
+        growth = self._growth(current)
+        principal = mortgage.mortgage_principal
+        if principal > 0:
+            if growth == 1:
+                principal = principal - months * overpaid
+            else:
+                fixed_point = overpaid / (growth - 1)
+                principal = fixed_point + growth ** months * (principal - fixed_point)
+            mortgage.mortgage_principal = max(0, principal)
+        self.saving += months * saved
+        self.month += months
+        return
+
+    def _buy(self):
+        prop = self.next_property
+        self.saving -= self._required()
+        self.properties.append(prop)
+
+    # ------------------- Running -------------------
+
+    def run(self):
+        """Returns (months_passed, total_net_assets), or (months, None) if the horizon came first."""
+        self._plan()
+        while len(self.properties) < len(self.strategy):
+            if not self._queue:
+                raise ValueError("strategy never completes: savings or balance stop moving")
+            month, _, kind, version, action = heapq.heappop(self._queue)
+            if version is not None and version != self._plan_version:
+                continue  # planned under a regime that has since ended
+
+            self._advance(month - self.month)
+            if self.month < month:
+                # Exact mode found the regime change earlier than planned
+                if version is None:
+                    heapq.heappush(self._queue, (month, next(self._order), kind, version, action))
+                self._plan()
+                continue
+            self.log.append((self.month, kind))
+            if kind == HORIZON:
+                return self.month, None
+            if action is not None:
+                action(self)
+            if kind == PURCHASE and self._ready(self._required()):
+                self._buy()
+            if len(self.properties) < len(self.strategy):
+                self._plan()
+
+        return self.month, net_assets(self.properties, self.saving)
+
+
+def simulate_events(
+    income: int,
+    current_saving: int,
+    overpayment_pct: float,
+    strategy: str,
+    deposit: float,
+    exact: bool = False,
+    horizon: int = None
+):
+    """test_strategy without history, advanced from event to event. Returns (months_passed, total_net_assets)."""
+    return EventSimulation(income, current_saving, overpayment_pct, strategy, deposit, exact, horizon).run()
@@ -0,0 +1,186 @@
+import numpy as np
+
+"""
+Columnar alternative to the list-of-dicts history built by strategies.simulation.append_history.
+Months, savings and per-property value/principal/LTV live in preallocated NumPy arrays that
+grow geometrically, so recording a month costs a few array writes instead of new dicts.
+Indexing or iterating a HistoryRecorder yields the same dict shape as the list history,
+so run/plots.py can consume either.
+"""
+
+
+class HistoryRecorder:
+    def __init__(self, capacity: int = 64, max_properties: int = 2):
+        self._size = 0
+        self.month = np.empty(capacity, dtype=np.int64)
+        self.savings = np.empty(capacity)
+        self.n_properties = np.empty(capacity, dtype=np.int64)
+        self.value = np.empty((capacity, max_properties))
+        self.principal = np.empty((capacity, max_properties))
+        self.ltv = np.empty((capacity, max_properties))
+
+    def _grow(self, rows: int, columns: int):
+        """Doubles capacity (rows) and property slots (columns) as needed."""
+        capacity, width = self.value.shape
+        new_capacity = max(capacity * 2, rows) if rows > capacity else capacity
+        new_width = max(width * 2, columns) if columns > width else width
+
+        for name in ("month", "savings", "n_properties"):
+            old = getattr(self, name)
+            new = np.empty(new_capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+        for name in ("value", "principal", "ltv"):
+            old = getattr(self, name)
+            new = np.empty((new_capacity, new_width))
+            new[:self._size, :width] = old[:self._size]
+            setattr(self, name, new)
+
+    def append(self, month_number: int, current_saving: float, properties: list):
+        """Records one month; same arguments as append_history."""
+        i = self._size
+        count = len(properties)
+        if i >= self.month.shape[0] or count > self.value.shape[1]:
+            self._grow(i + 1, count)
+
+        self.month[i] = month_number
+        self.savings[i] = current_saving
+        self.n_properties[i] = count
+        for j, p in enumerate(properties):
+            self.value[i, j] = p.property_value
+            self.principal[i, j] = p.mortgage.mortgage_principal
+            self.ltv[i, j] = p.mortgage.mortgage_principal / p.property_value
+        self._size = i + 1
+
+    def copy(self):
+        """Independent recorder holding the same months."""
+        new = HistoryRecorder.__new__(HistoryRecorder)
+        new._size = self._size
+        for name in ("month", "savings", "n_properties", "value", "principal", "ltv"):
+            setattr(new, name, getattr(self, name).copy())
+        return new
+
+    def __len__(self):
+        return self._size
+
+    def record(self, i: int) -> dict:
+        """Builds the append_history dict for row i."""
+        return {
+            "month": int(self.month[i]),
+            "savings": float(self.savings[i]),
+            "properties": [
+                {
+                    "value": float(self.value[i, j]),
+                    "mortgage_principal": float(self.principal[i, j]),
+                    "ltv": round(float(self.ltv[i, j]), 4)
+                }
+                for j in range(self.n_properties[i])
+            ]
+        }
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.record(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("history index out of range")
+        return self.record(index)
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self.record(i)
+
+    def to_list(self) -> list[dict]:
+        """Materialises the whole history in the list-of-dicts shape."""
+        return list(self)
+
+
+class SavingRun:
+    """
+    Months in which a fixed amount is saved and no property is owned, as a range-backed sequence.
+    Month first_month + i has savings base_saving + (i + 1) * per_month; records are only built
+    when indexed or iterated.
+    """
+    __slots__ = ("first_month", "base_saving", "per_month", "count")
+
+    def __init__(self, first_month: int, base_saving: float, per_month: float, count: int):
+        self.first_month = first_month
+        self.base_saving = base_saving
+        self.per_month = per_month
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def record(self, i: int) -> dict:
+        return {
+            "month": self.first_month + i,
+            "savings": self.base_saving + (i + 1) * self.per_month,
+            "properties": []
+        }
+
+
+class LazyHistory:
+    """
+    List-like history whose saving-only stretches are SavingRuns instead of materialised dicts.
+    Other months are appended as dicts, as with the list history. Indexing, slicing and
+    iterating yield the same records as the list history, and it compares equal to one.
+    """
+    def __init__(self):
+        self._segments = []  # SavingRun or list of dicts
+        self._size = 0
+
+    def append(self, record: dict):
+        if not self._segments or not isinstance(self._segments[-1], list):
+            self._segments.append([])
+        self._segments[-1].append(record)
+        self._size += 1
+
+    def extend_saving_run(self, run: SavingRun):
+        if run.count:
+            self._segments.append(run)
+            self._size += run.count
+
+    def copy(self):
+        new = LazyHistory()
+        new._segments = [list(s) if isinstance(s, list) else s for s in self._segments]
+        new._size = self._size
+        return new
+
+    def __len__(self):
+        return self._size
+
+    def _record(self, index: int) -> dict:
+        for segment in self._segments:
+            if index < len(segment):
+                return segment[index] if isinstance(segment, list) else segment.record(index)
+            index -= len(segment)
+        raise IndexError("history index out of range")
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("history index out of range")
+        return self._record(index)
+
+    def __iter__(self):
+        for segment in self._segments:
+            if isinstance(segment, list):
+                yield from segment
+            else:
+                for i in range(segment.count):
+                    yield segment.record(i)
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def to_list(self) -> list[dict]:
+        """Materialises the whole history in the list-of-dicts shape."""
+        return list(self)
@@ -0,0 +1,207 @@
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from strategies.simulation import generate_property
+from utils.saving import costs_array
+from utils.overpayments import MAINTENANCE_RATE, FLAT_SERVICE_CHARGE
+from utils.repayment import EPSILON, annuity_factor
+
+"""
+Monte Carlo version of test_strategy with stochastic interest rates and house prices.
+Thousands of seeded paths are drawn up front and advanced together, one vectorised month at a
+time, through the same allocation, payment and interest rounding rules as the scalar engine:
+- the mortgage rate of every property is its generate_property rate plus a shared
+  mean-reverting shock (variable-rate mortgages), floored at RATE_FLOOR;
+- house prices follow a geometric random walk, applied to owned properties (LTV, expenses,
+  equity) and to the price, deposit and stamp duty of the next purchase.
+With zero volatility and drift the paths reproduce test_strategy.
+"""
+
+RATE_FLOOR = 0.0001
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def draw_paths(
+    n_paths: int,
+    horizon: int,
+    seed: int = None,
+    rate_volatility: float = 0.01,
+    rate_reversion: float = 0.5,
+    price_drift: float = 0.03,
+    price_volatility: float = 0.05
+):
+    """
+    Returns (rate_shock, price_index), each shaped (n_paths, horizon + 1) with month 0 first.
+    Rate shocks are an annualised Ornstein-Uhlenbeck process starting at 0; the price index is
+    geometric Brownian motion starting at 1. Parameters are annual.
+    """
+    rng = np.random.default_rng(seed)
+    dt = 1 / 12
+
+    rate_shock = np.zeros((n_paths, horizon + 1))
+    rate_noise = rng.standard_normal((n_paths, horizon)) * rate_volatility * np.sqrt(dt)
+    for t in range(horizon):
+        rate_shock[:, t + 1] = rate_shock[:, t] * (1 - rate_reversion * dt) + rate_noise[:, t]
+
+    log_returns = (price_drift - price_volatility ** 2 / 2) * dt \
+        + price_volatility * np.sqrt(dt) * rng.standard_normal((n_paths, horizon))
+    price_index = np.ones((n_paths, horizon + 1))
+    price_index[:, 1:] = np.exp(np.cumsum(log_returns, axis=1))
+    return rate_shock, price_index
+
+
+def simulate_paths(
+    income: int,
+    current_saving: int,
+    overpayment_pct: float,
+    strategy: str,
+    deposit: float,
+    rate_shock: np.ndarray,
+    price_index: np.ndarray
+):
+    """
+    Runs one strategy over every path. Returns (months, net_assets) per path; paths that do not
+    finish the strategy within the horizon get NaN for both.
+    Raises ValueError, as strategies.batch does, when income cannot cover a property's expenses.
+    """
+    n_paths, steps = price_index.shape
+    horizon = steps - 1
+    templates = [generate_property(prop_type, deposit) for prop_type in strategy]
+    n_props = len(templates)
+
+    phase = np.zeros(n_paths, dtype=int)  # properties bought so far
+    saving = np.full(n_paths, float(current_saving))
+    months = np.full(n_paths, np.nan)
+    net_assets = np.full(n_paths, np.nan)
+    # Per owned property: value at a price index of 1, and mortgage principal
+    value_units = np.zeros((n_paths, n_props))
+    principal = np.zeros((n_paths, n_props))
+
+    def next_required(k, idx, t):
+        """Savings needed to buy property k on paths idx at month t."""
+        template = templates[k]
+        value = template.property_value * price_index[idx, t]
+        first_time = k == 0
+        return costs_array(value, first_time, True) + value * deposit
+
+    for t in range(horizon + 1):
+        # Purchases at month t; several can happen in the same month
+        for _ in range(n_props + 1):
+            open_idx = np.flatnonzero(phase < n_props)
+            ready = np.zeros(open_idx.size, dtype=bool)
+            for k in np.unique(phase[open_idx]):
+                in_phase = phase[open_idx] == k
+                idx = open_idx[in_phase]
+                required = next_required(k, idx, t)
+                if k == 0:
+                    ok = saving[idx] >= required
+                else:
+                    value = value_units[idx, k - 1] * price_index[idx, t]
+                    ok = ~(((saving[idx] - required) < 0) | (principal[idx, k - 1] / value > 0.75))
+                saving[idx[ok]] = saving[idx[ok]] - required[ok]
+                ready[np.flatnonzero(in_phase)[ok]] = True
+            buy = open_idx[ready]
+            if buy.size == 0:
+                break
+            for k in np.unique(phase[buy]):
+                idx = buy[phase[buy] == k]
+                value = templates[k].property_value * price_index[idx, t]
+                value_units[idx, k] = templates[k].property_value
+                principal[idx, k] = value - value * deposit
+            phase[buy] += 1
+
+        finished = (phase == n_props) & np.isnan(months)
+        if finished.any():
+            idx = np.flatnonzero(finished)
+            months[idx] = t
+            equity = np.zeros(idx.size)
+            for k in range(n_props):
+                equity = equity + (value_units[idx, k] * price_index[idx, t] - principal[idx, k])
+            net_assets[idx] = equity + saving[idx]
+        if t == horizon:
+            break
+
+        # Advance one month
+        renting = np.flatnonzero(phase == 0)
+        saving[renting] = saving[renting] + (income - 1000)
+
+        for k in range(1, n_props):
+            idx = np.flatnonzero(phase == k)
+            if idx.size == 0:
+                continue
+            current = templates[k - 1]
+            value = value_units[idx, k - 1] * price_index[idx, t]
+            service_charge = FLAT_SERVICE_CHARGE / 12 if current.is_flat else 0
+            max_overpayment = income - (value * MAINTENANCE_RATE / 12 + service_charge)
+            if (max_overpayment < 0).any():
+                raise ValueError("overpayment is negative: increase income")
+            required = next_required(k, idx, t)
+
+            P = principal[idx, k - 1]
+            sav = saving[idx]
+            ltv = P / value
+            split_overpay = np.floor(max_overpayment * overpayment_pct)
+            overpay = np.where(ltv < 0.75, 0.0, np.where(sav > required, max_overpayment, split_overpay))
+            saved = np.where(ltv < 0.75, max_overpayment, np.where(sav > required, 0.0, max_overpayment - split_overpay))
+            saving[idx] = sav + saved
+
+            base_rate = current.mortgage.interest_rate
+            rate = np.maximum(base_rate + rate_shock[idx, t], RATE_FLOOR)
+            r = rate / 12
+            n = current.mortgage.mortgage_length * 12
+            growth = (1 + r) ** n
+            # NumPy's power can differ from Python's by an ulp; use the scalar factor where the
+            # rate is unshocked so deterministic paths match test_strategy exactly
+            numerator, denominator = annuity_factor(base_rate, current.mortgage.mortgage_length)
+            unshocked = rate == base_rate
+            numerator = np.where(unshocked, numerator, r * growth)
+            denominator = np.where(unshocked, denominator, growth - 1)
+            fixed_payment = P * numerator / denominator
+            interest = np.round(P * r + EPSILON)
+            principal_payment = np.minimum(fixed_payment + overpay - interest, P)
+            principal[idx, k - 1] = np.where(P > 0, np.maximum(0, P - principal_payment), P)
+
+    return months, net_assets
+
+
+def summarise(months: np.ndarray, net_assets: np.ndarray, percentiles=PERCENTILES) -> dict:
+    """Probability of finishing the strategy and percentiles of months and net assets on the paths that did."""
+    hit = ~np.isnan(months)
+    summary = {"paths": int(months.size), "hit_probability": float(hit.mean()) if months.size else 0.0}
+    for name, values in (("months", months[hit]), ("net_assets", net_assets[hit])):
+        if values.size:
+            summary[name] = {p: float(v) for p, v in zip(percentiles, np.percentile(values, percentiles))}
+            summary[name]["mean"] = float(values.mean())
+        else:
+            summary[name] = None
+    return summary
+
+
+def run_monte_carlo(
+    income: int,
+    current_saving: int,
+    overpayment_pct: float,
+    strategy: str,
+    deposit: float,
+    n_paths: int = 10000,
+    horizon: int = 480,
+    seed: int = 0,
+    **path_params
+) -> dict:
+    """Draws paths (seeded, so reproducible), simulates the strategy on all of them and summarises."""
+    rate_shock, price_index = draw_paths(n_paths, horizon, seed, **path_params)
+    months, net_assets = simulate_paths(
+        income, current_saving, overpayment_pct, strategy, deposit, rate_shock, price_index
+    )
+    return summarise(months, net_assets)
+
+
+if __name__ == "__main__":
+    summary = run_monte_carlo(1800, 5000, 0.75, "FF", 0.1, n_paths=5000, seed=42)
+    print(f"Paths:                 {summary['paths']}")
+    print(f"Probability of goal:   {summary['hit_probability']:.1%}")
+    if summary["months"]:
+        print("Months to goal:        " + ", ".join(f"p{p}={v:.0f}" for p, v in summary["months"].items() if p != "mean"))
+        print("Net assets at goal:    " + ", ".join(f"p{p}=£{v:,.0f}" for p, v in summary["net_assets"].items() if p != "mean"))
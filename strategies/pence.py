@@ -0,0 +1,159 @@
+import sys
+import os
+from functools import lru_cache
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from strategies.simulation import generate_property
+from utils.money import (
+    PPM,
+    to_pence,
+    share_ppm,
+    costs_pence,
+    property_terms,
+    monthly_payment_pence,
+    step_pence,
+    step_pence_array,
+)
+
+"""
+Integer-pence version of test_strategy, with a scalar and a batched engine.
+Both follow the same strategy rules as strategies.simulation with the exact kernels of
+utils.money: amounts are pence, the LTV tests compare 4 * principal with 3 * value, and the
+overpaid share is floor(max_overpayment * ppm / 10^6). Results are integer pence and the two
+engines return identical values for every scenario. They are not expected to match the float
+engine to the penny, since interest is rounded to the penny here rather than to the pound.
+"""
+
+RENT = to_pence(1000)
+
+
+@lru_cache(maxsize=None)
+def phase_terms(prop_type: str, deposit: float) -> tuple:
+    """property_terms plus the savings needed to buy the property as a first or later purchase."""
+    prop = generate_property(prop_type, deposit)
+    terms = property_terms(prop)
+    deposit_pence = terms[0] - terms[1]
+    first_cost = costs_pence(terms[0], True, True) + deposit_pence
+    later_cost = costs_pence(terms[0], False, True) + deposit_pence
+    return terms + (first_cost, later_cost)
+
+
+def test_strategy_pence(income: int, current_saving: int, overpayment_pct: float, strategy: str, deposit: float):
+    """
+    Returns (months_passed, total_net_assets) with net assets in pence.
+    Raises ValueError when income cannot cover rent or the expenses of a property.
+    """
+    income = to_pence(income)
+    saving = to_pence(current_saving)
+    ppm = share_ppm(overpayment_pct)
+    months = 0
+    equity = 0
+    current = None
+
+    for prop_type in strategy:
+        terms = phase_terms(prop_type, deposit)
+        first_cost, required = terms[5], terms[6]
+
+        if current is None:
+            if saving < first_cost:
+                if income <= RENT:
+                    raise ValueError("income does not cover rent")
+                # Saving while renting is a fixed amount per month, so jump to the purchase month
+                renting_months = -((saving - first_cost) // (income - RENT))
+                months += renting_months
+                saving += renting_months * (income - RENT)
+            saving -= first_cost
+            current = terms
+            continue
+
+        value, principal, rate_bp, factor, expenses = current[:5]
+        max_overpayment = income - expenses
+        if max_overpayment < 0:
+            raise ValueError("overpayment is negative: increase income")
+        split_overpay = max_overpayment * ppm // PPM
+
+        while saving - required < 0 or 4 * principal > 3 * value:
+            months += 1
+            if 4 * principal < 3 * value:
+                saving += max_overpayment
+                overpay = 0
+            elif saving > required:
+                overpay = max_overpayment
+            else:
+                saving += max_overpayment - split_overpay
+                overpay = split_overpay
+            payment = monthly_payment_pence(principal, factor)
+            principal = step_pence(principal, payment, overpay, rate_bp)
+
+        saving -= required
+        equity += value - principal
+        current = terms
+
+    if current is not None:
+        equity += current[0] - current[1]
+    return months, equity + saving
+
+
+def simulate_batch_pence(income, current_saving, overpayment_pct, strategy: list[str], deposit):
+    """
+    test_strategy_pence over many scenarios at once as int64 arrays; arguments broadcast like
+    strategies.batch.simulate_batch. Returns (months_passed, total_net_assets) arrays.
+    """
+    strategies = list(strategy)
+    n = len(strategies)
+    income = np.array([to_pence(x) for x in np.broadcast_to(np.asarray(income, dtype=float), n)], dtype=np.int64)
+    saving = np.array([to_pence(x) for x in np.broadcast_to(np.asarray(current_saving, dtype=float), n)], dtype=np.int64)
+    ppm = np.array([share_ppm(x) for x in np.broadcast_to(np.asarray(overpayment_pct, dtype=float), n)], dtype=np.int64)
+    deposits = np.broadcast_to(np.asarray(deposit, dtype=float), n)
+    lengths = np.array([len(s) for s in strategies], dtype=int)
+
+    months = np.zeros(n, dtype=np.int64)
+    equity = np.zeros(n, dtype=np.int64)
+    current = np.zeros((5, n), dtype=np.int64)  # value, principal, rate_bp, factor, expenses
+
+    for phase in range(lengths.max(initial=0)):
+        idx = np.flatnonzero(lengths > phase)
+        terms = np.array(
+            [phase_terms(strategies[i][phase], float(deposits[i])) for i in idx], dtype=np.int64
+        ).reshape(-1, 7).T
+        first_cost, required = terms[5], terms[6]
+
+        if phase == 0:
+            short = saving[idx] < first_cost
+            renting = income[idx] - RENT
+            if (short & (renting <= 0)).any():
+                raise ValueError("income does not cover rent")
+            renting_months = np.where(short, -((saving[idx] - first_cost) // np.where(short, renting, 1)), 0)
+            months[idx] += renting_months
+            saving[idx] = saving[idx] + renting_months * renting - first_cost
+        else:
+            value, principal, rate_bp, factor, expenses = current[:, idx]
+            max_overpayment = income[idx] - expenses
+            if (max_overpayment < 0).any():
+                raise ValueError("overpayment is negative: increase income")
+            split_overpay = max_overpayment * ppm[idx] // PPM
+            sav = saving[idx]
+            mon = months[idx]
+
+            active = ((sav - required) < 0) | (4 * principal > 3 * value)
+            while active.any():
+                below = 4 * principal < 3 * value
+                ahead = sav > required
+                saved = np.where(below, max_overpayment, np.where(ahead, 0, max_overpayment - split_overpay))
+                overpay = np.where(below, 0, np.where(ahead, max_overpayment, split_overpay))
+                payment = monthly_payment_pence(principal, factor)
+                sav = np.where(active, sav + saved, sav)
+                principal = np.where(active, step_pence_array(principal, payment, overpay, rate_bp), principal)
+                mon = mon + active
+                active = ((sav - required) < 0) | (4 * principal > 3 * value)
+
+            saving[idx] = sav - required
+            months[idx] = mon
+            equity[idx] += value - principal
+
+        current[:, idx] = terms[:5]
+
+    owned = lengths > 0
+    equity[owned] += current[0, owned] - current[1, owned]
+    return months, equity + saving
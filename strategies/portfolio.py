@@ -0,0 +1,107 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from properties import Property
+from strategies.simulation import (
+    generate_property,
+    purchase_first_property,
+    owning_months,
+    run_phase,
+    new_history,
+)
+from utils.lettings import calculate_profit
+
+"""
+Portfolio simulation for strategies with any number of properties.
+The investor always lives in the newest property and overpays it as in test_strategy. When
+they move on, the previous home is let out: it is remortgaged to an interest-only buy-to-let
+(Property.convert_to_buy_to_let, possible because the move only happens at <= 75% LTV), the
+released equity goes into savings, and its rental profit from utils.lettings.calculate_profit
+is paid into savings every month from then on.
+
+A let property's interest-only balance never changes, so its equity and rental profit are
+folded into two running totals when it is let. Each month then costs the same however many
+properties are let, which keeps 10+ property strategies cheap.
+"""
+
+BUY_TO_LET_INTEREST_ONLY = 0  # mortgage_length that calculate_profit treats as interest-only
+
+
+class Portfolio:
+    """Living property plus aggregated totals for every property that is no longer lived in."""
+    __slots__ = ("home", "let_properties", "let_equity", "rental_profit")
+
+    def __init__(self):
+        self.home = None
+        self.let_properties = []
+        self.let_equity = 0
+        self.rental_profit = 0
+
+    def properties(self) -> list[Property]:
+        return self.let_properties + ([self.home] if self.home is not None else [])
+
+    def move_into(self, new_home: Property, let_out: bool, self_manage: bool) -> float:
+        """Moves into new_home; returns the equity released by letting the old home out."""
+        released = 0
+        old_home = self.home
+        if old_home is not None:
+            if let_out:
+                principal_before = old_home.mortgage.mortgage_principal
+                if old_home.convert_to_buy_to_let(BUY_TO_LET_INTEREST_ONLY):
+                    released = old_home.mortgage.mortgage_principal - principal_before
+                    profit, _ = calculate_profit(old_home, self_manage)
+                    self.rental_profit += profit
+            self.let_equity += old_home.property_value - old_home.mortgage.mortgage_principal
+            self.let_properties.append(old_home)
+        self.home = new_home
+        return released
+
+    def net_assets(self, current_saving: float) -> float:
+        total = self.let_equity
+        if self.home is not None:
+            total += self.home.property_value - self.home.mortgage.mortgage_principal
+        return total + current_saving
+
+
+def simulate_portfolio(
+    income: int,
+    current_saving: int,
+    overpayment_pct: float,
+    strategy: str,
+    deposit: float,
+    let_out: bool = True,
+    self_manage: bool = False,
+    history_mode: str = "off",
+    max_months: int = None,
+    price_scale: float = 1.0,
+    interest_rate: float = None
+):
+    """
+    Simulates a strategy of any length. Returns (months_passed, total_net_assets, history) like
+    test_strategy, including its max_months, price_scale and interest_rate. With let_out=False
+    earlier homes are simply kept, as test_strategy does, and the results match it exactly.
+    """
+    history = new_history(history_mode)
+    portfolio = Portfolio()
+    months_passed = 0
+
+    for prop_type in strategy:
+        if portfolio.home is None:
+            months_passed, properties, current_saving = purchase_first_property(
+                prop_type, current_saving, income, history, deposit, max_months, price_scale, interest_rate
+            )
+        else:
+            next_prop = generate_property(prop_type, deposit, price_scale, interest_rate)
+            months_passed, properties, current_saving = run_phase(
+                owning_months(
+                    income, current_saving, overpayment_pct, next_prop, portfolio.properties(),
+                    months_passed, max_months, portfolio.rental_profit
+                ),
+                history
+            )
+        if max_months is not None and months_passed > max_months:
+            return months_passed, None, history
+        current_saving += portfolio.move_into(properties[-1], let_out, self_manage)
+
+    return months_passed, portfolio.net_assets(current_saving), history
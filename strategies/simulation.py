@@ -1,12 +1,15 @@
 import sys
 import os
 import math
+from typing import Callable, Iterator
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from properties import Property
-from utils.saving import costs
+from utils.saving import costs, months_to_save
 from utils.repayment import step, calculate_fixed_monthly_payment
 from utils.overpayments import calculate_overpayment
+from strategies.history import HistoryRecorder, LazyHistory, SavingRun
+from utils import trace, profiling
 
 """
 Strategy Steps:
@@ -17,12 +20,18 @@ Strategy Steps:
    - If the LTV of the current property reaches 75%, prioritize saving over overpaying.
 """
 
-def generate_property(next_property: str, deposit: float) -> Property:
-    """Creates a Property object with pre-defined values based on the property type."""
+def generate_property(next_property: str, deposit: float, price_scale: float = 1.0, interest_rate: float = None) -> Property:
+    """
+    Creates a Property object with pre-defined values based on the property type.
+    price_scale multiplies the property value; interest_rate replaces the 2025 rate when given.
+    """
     is_flat = next_property == "F"
     property_value = 150000 if is_flat else 220000
+    if price_scale != 1.0:
+        property_value = property_value * price_scale
     deposit_amount = property_value * deposit
-    interest_rate = 0.06 if deposit == 0.05 else 0.05  # Simulating 2025 rates
+    if interest_rate is None:
+        interest_rate = 0.06 if deposit == 0.05 else 0.05  # Simulating 2025 rates
 
     return Property(
         property_value=property_value,
@@ -33,6 +42,7 @@ def generate_property(next_property: str, deposit: float) -> Property:
         interest_rate=interest_rate,
     )
 
+@trace.timed
 def saving_vs_overpayment_allocation(
     max_overpayment: int,
     current_property: Property,
@@ -53,9 +63,33 @@ def saving_vs_overpayment_allocation(
         saving = max_overpayment - overpayment_applied
         return saving, overpayment_applied
 
-def append_history(history: list, month_number: int, current_saving: int, properties: list[Property]):
-    """Stores monthly progress in the history log."""
-    history.append({
+# Integer-valued amounts below this add up exactly in floats as well as ints
+EXACT_INTEGER_LIMIT = 2 ** 53
+
+def new_history(history_mode: str):
+    """
+    Creates the history container for a run: "list" (dicts), "columnar" (HistoryRecorder),
+    "lazy" (LazyHistory, saving-only months built on demand) or "off".
+    """
+    if history_mode == "list":
+        return []
+    if history_mode == "columnar":
+        return HistoryRecorder()
+    if history_mode == "lazy":
+        return LazyHistory()
+    if history_mode == "off":
+        return None
+    raise ValueError(f"Unknown history mode: {history_mode}")
+
+def exact_integer(amount) -> bool:
+    """True for an int or integer-valued float whose sums with others like it are exact."""
+    if isinstance(amount, float):
+        return amount.is_integer() and abs(amount) < EXACT_INTEGER_LIMIT
+    return isinstance(amount, int)
+
+def month_record(month_number: int, current_saving: int, properties: list[Property]) -> dict:
+    """One month of progress in the history dict shape."""
+    return {
         "month": month_number,
         "savings": current_saving,
         "properties": [
@@ -66,8 +100,19 @@ def append_history(history: list, month_number: int, current_saving: int, proper
             }
             for p in properties
         ]
-    })
+    }
 
+@trace.timed
+def append_history(history, month_number: int, current_saving: int, properties: list[Property]):
+    """Stores monthly progress in the history log."""
+    if history is None:
+        return
+    if isinstance(history, HistoryRecorder):
+        history.append(month_number, current_saving, properties)
+        return
+    history.append(month_record(month_number, current_saving, properties))
+
+@trace.timed
 def move_forward_one_month(
     income: int,
     current_saving: int,
@@ -93,57 +138,104 @@ def move_forward_one_month(
 
     return properties, current_saving
 
-def purchase_first_property(
-    next_property: str,
-    current_saving: int,
-    income: int,
-    history: list,
-    deposit: float
-):
-    """Simulates saving until the first property is affordable."""
-    income_while_renting = income - 1000
-    new_property = generate_property(next_property, deposit)
-    total_cost = costs(new_property, True, True) + new_property.mortgage.deposit
+def first_purchase(next_property: str, deposit: float, price_scale: float = 1.0, interest_rate: float = None):
+    """The first property and the savings needed to buy it."""
+    new_property = generate_property(next_property, deposit, price_scale, interest_rate)
+    return new_property, costs(new_property, True, True) + new_property.mortgage.deposit
 
+def renting_months(new_property: Property, total_cost: float, current_saving: int, income: int, max_months: int = None):
+    """
+    Saving while renting until total_cost is reached, one month at a time.
+    Yields (months, properties, current_saving) after every month and returns the same
+    result as purchase_first_property.
+    """
+    income_while_renting = income - 1000
     months = 0
     properties = []
 
     while current_saving < total_cost:
-        current_saving += income_while_renting
         months += 1
+        if max_months is not None and months > max_months:
+            return months, properties, current_saving
+        current_saving += income_while_renting
+        yield months, properties, current_saving
+
+    return months, [new_property], current_saving - total_cost
+
+def run_phase(phase, history):
+    """Runs a phase generator to the end, recording every month it yields; returns its result."""
+    while True:
+        try:
+            months, properties, current_saving = next(phase)
+        except StopIteration as stop:
+            return stop.value
         append_history(history, months, current_saving, properties)
 
-    current_saving -= total_cost
-    properties = [new_property]
+@trace.timed
+def purchase_first_property(
+    next_property: str,
+    current_saving: int,
+    income: int,
+    history: list,
+    deposit: float,
+    max_months: int = None,
+    price_scale: float = 1.0,
+    interest_rate: float = None
+):
+    """
+    Simulates saving until the first property is affordable.
+    Stops early, without buying, once more than max_months have passed.
+    """
+    income_while_renting = income - 1000
+    new_property, total_cost = first_purchase(next_property, deposit, price_scale, interest_rate)
+
+    # Renting adds the same amount every month, so when the sums are exact the purchase month is a
+    # division away; the skipped months are only recorded if the history can hold them lazily.
+    if (history is None or isinstance(history, LazyHistory)) and income_while_renting > 0 and \
+            exact_integer(current_saving) and exact_integer(income_while_renting):
+        months = months_to_save(current_saving, income_while_renting, total_cost)
+        aborted = max_months is not None and months > max_months
+        if aborted:
+            months = max_months + 1
+        if history is not None:
+            history.extend_saving_run(SavingRun(1, current_saving, income_while_renting, months - aborted))
+        if months - aborted:
+            current_saving += (months - aborted) * income_while_renting
+        if aborted:
+            return months, [], current_saving
+        return months, [new_property], current_saving - total_cost
 
-    return months, properties, current_saving
+    return run_phase(renting_months(new_property, total_cost, current_saving, income, max_months), history)
 
 def balance_after_property_purchase(next_property: Property, current_saving: int) -> float:
     """Returns the balance after purchasing a property."""
     total_cost = costs(next_property, False, True) + next_property.mortgage.deposit
     return current_saving - total_cost
 
-def move_forward_n_months(
+def owning_months(
     income: int,
     current_saving: int,
     overpayment_pct: float,
-    next_property: str,
+    next_prop: Property,
     properties: list[Property],
     months_passed: int,
-    history: list,
-    deposit: float
+    max_months: int = None,
+    extra_saving: float = 0
 ):
-    """Simulates months of progress until the next property is affordable."""
-    if not properties:
-        return purchase_first_property(next_property, current_saving, income, history, deposit)
-
-    next_prop = generate_property(next_property, deposit)
+    """
+    Saving and overpaying until next_prop is affordable and the current LTV is at most 0.75,
+    one month at a time. Yields (months_passed, properties, current_saving) after every month
+    and returns the same result as move_forward_n_months.
+    extra_saving is paid into savings at the end of every month (e.g. rental profit).
+    """
     current_property = properties[-1]
 
     while balance_after_property_purchase(next_prop, current_saving) < 0 or \
           current_property.mortgage.mortgage_principal / current_property.property_value > 0.75:
 
         months_passed += 1
+        if max_months is not None and months_passed > max_months:
+            return months_passed, properties, current_saving
         properties, current_saving = move_forward_one_month(
             income,
             current_saving,
@@ -151,26 +243,85 @@ def move_forward_n_months(
             next_prop,
             properties,
             months_passed,
-            history,
+            None,
         )
+        if extra_saving:
+            current_saving += extra_saving
         current_property = properties[-1]
+        yield months_passed, properties, current_saving
 
     current_saving = balance_after_property_purchase(next_prop, current_saving)
     properties.append(next_prop)
 
     return months_passed, properties, current_saving
 
+@trace.timed
+def move_forward_n_months(
+    income: int,
+    current_saving: int,
+    overpayment_pct: float,
+    next_property: str,
+    properties: list[Property],
+    months_passed: int,
+    history: list,
+    deposit: float,
+    max_months: int = None,
+    price_scale: float = 1.0,
+    interest_rate: float = None
+):
+    """
+    Simulates months of progress until the next property is affordable.
+    Stops early, without buying, once more than max_months have passed.
+    """
+    if not properties:
+        result = purchase_first_property(
+            next_property, current_saving, income, history, deposit, max_months, price_scale, interest_rate
+        )
+        if profiling.enabled:
+            profiling.count_phase(0, result[0] if max_months is None else min(result[0], max_months))
+        return result
+
+    phase_start = months_passed
+    owned = len(properties)
+    next_prop = generate_property(next_property, deposit, price_scale, interest_rate)
+    result = run_phase(
+        owning_months(income, current_saving, overpayment_pct, next_prop, properties, months_passed, max_months),
+        history
+    )
+
+    if profiling.enabled:
+        months = result[0] if max_months is None else min(result[0], max_months)
+        profiling.count_phase(owned, months - phase_start)
+    return result
+
+def net_assets(properties: list[Property], current_saving: float) -> float:
+    """Equity in every property plus savings."""
+    total_net_assets = sum(p.property_value - p.mortgage.mortgage_principal for p in properties)
+    total_net_assets += current_saving
+    return total_net_assets
+
+@trace.timed
 def test_strategy(
     income: int,
     current_saving: int,
     overpayment_pct: float,
     strategy: str,
-    deposit: float
+    deposit: float,
+    history_mode: str = "list",
+    max_months: int = None,
+    price_scale: float = 1.0,
+    interest_rate: float = None
 ):
-    """Main simulation entry point for a 2-property strategy."""
+    """
+    Main simulation entry point for a 2-property strategy.
+    history_mode picks how monthly progress is kept: "list", "columnar", "lazy" or "off" (history is None).
+    With max_months set the run is abandoned as soon as it needs more months than that;
+    it then returns (months_passed, None, history) with months_passed > max_months.
+    price_scale and interest_rate change the market every property is bought in (see generate_property).
+    """
     months_passed = 0
     properties = []
-    history = []
+    history = new_history(history_mode)
 
     for prop_type in strategy:
         months_passed, properties, current_saving = move_forward_n_months(
@@ -182,12 +333,60 @@ def test_strategy(
             months_passed,
             history,
             deposit,
+            max_months,
+            price_scale,
+            interest_rate,
         )
+        if max_months is not None and months_passed > max_months:
+            return months_passed, None, history
 
-    total_net_assets = sum(p.property_value - p.mortgage.mortgage_principal for p in properties)
-    total_net_assets += current_saving
+    return months_passed, net_assets(properties, current_saving), history
+
+def iter_strategy(
+    income: int,
+    current_saving: int,
+    overpayment_pct: float,
+    strategy: str,
+    deposit: float,
+    stop_when: Callable[[dict], bool] = None,
+    max_months: int = None,
+    price_scale: float = 1.0,
+    interest_rate: float = None
+) -> Iterator[dict]:
+    """
+    Lazy test_strategy: yields one record per simulated month, in the history dict shape plus
+    "net_assets", so memory stays constant however long the run is.
+    The run stops after the first record for which stop_when(record) is true. The generator's
+    return value (e.g. through `yield from`) is (months_passed, total_net_assets) of the last state,
+    or (months_passed, None) when the run was abandoned over max_months, as in test_strategy.
+    """
+    months_passed = 0
+    properties = []
+
+    for prop_type in strategy:
+        if not properties:
+            new_property, total_cost = first_purchase(prop_type, deposit, price_scale, interest_rate)
+            phase = renting_months(new_property, total_cost, current_saving, income, max_months)
+        else:
+            next_prop = generate_property(prop_type, deposit, price_scale, interest_rate)
+            phase = owning_months(income, current_saving, overpayment_pct, next_prop, properties, months_passed, max_months)
+
+        while True:
+            try:
+                months_passed, properties, current_saving = next(phase)
+            except StopIteration as stop:
+                months_passed, properties, current_saving = stop.value
+                break
+            entry = month_record(months_passed, current_saving, properties)
+            entry["net_assets"] = net_assets(properties, current_saving)
+            yield entry
+            if stop_when is not None and stop_when(entry):
+                return months_passed, entry["net_assets"]
+
+        if max_months is not None and months_passed > max_months:
+            return months_passed, None
 
-    return months_passed, total_net_assets, history
+    return months_passed, net_assets(properties, current_saving)
 
 if __name__ == "__main__":
     income = 1800
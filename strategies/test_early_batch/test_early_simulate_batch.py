@@ -0,0 +1,97 @@
+"""
+Unit tests for simulate_batch in investments.strategies.batch (strategies/batch.py)
+Covers: happy paths, edge cases.
+"""
+
+import numpy as np
+import pytest
+
+from investments.strategies.batch import simulate_batch, simulate_grid
+from investments.strategies.simulation import test_strategy as run_strategy
+
+
+class TestSimulateBatch:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("strategy", ["HH", "FF", "HF", "FH", "F", "FHF"])
+    @pytest.mark.parametrize("deposit", [0.05, 0.10])
+    def test_matches_scalar_engine(self, strategy, deposit):
+        """
+        Test that every scenario returns exactly the scalar months and net assets.
+        """
+        rates = [i / 20 for i in range(21)]
+        months, net_assets = simulate_batch(1800, 5000, rates, [strategy] * len(rates), deposit)
+        for i, pct in enumerate(rates):
+            expected_months, expected_assets, _ = run_strategy(1800, 5000, pct, strategy, deposit)
+            assert months[i] == expected_months
+            assert net_assets[i] == expected_assets
+
+    @pytest.mark.happy_path
+    def test_mixed_income_and_savings(self):
+        """
+        Test that per-scenario income and savings arrays are honoured.
+        """
+        incomes = [1500, 1800, 2500]
+        savings = [20000, 5000, 0]
+        months, net_assets = simulate_batch(incomes, savings, 0.5, ["HF", "FH", "FF"], 0.1)
+        for i, strategy in enumerate(["HF", "FH", "FF"]):
+            expected = run_strategy(incomes[i], savings[i], 0.5, strategy, 0.1)
+            assert (months[i], net_assets[i]) == expected[:2]
+
+    @pytest.mark.happy_path
+    def test_grid_shape_follows_loop_order(self):
+        """
+        Test that simulate_grid lays results out as (deposit, strategy, overpayment).
+        """
+        months, net_assets = simulate_grid(1800, 5000, [0.05, 0.1], ["HH", "FF", "HF"], [0.0, 0.3, 1.0])
+        assert months.shape == (2, 3, 3)
+        expected = run_strategy(1800, 5000, 0.3, "HF", 0.05)
+        assert (months[0, 2, 1], net_assets[0, 2, 1]) == expected[:2]
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_empty_strategy_keeps_savings(self):
+        """
+        Test that an empty strategy string buys nothing and returns the starting savings.
+        """
+        months, net_assets = simulate_batch(1800, 5000, 0.5, [""], 0.1)
+        assert months[0] == 0
+        assert net_assets[0] == 5000
+
+    @pytest.mark.edge_case
+    def test_negative_overpayment_raises(self):
+        """
+        Test that an income below the property expenses is rejected.
+        """
+        with pytest.raises(ValueError):
+            simulate_batch(300, 100000, 0.5, ["FF"], 0.1)
+
+    @pytest.mark.edge_case
+    @pytest.mark.parametrize("max_months", [0, 5, 36, 60])
+    def test_month_budget_matches_scalar_engine(self, max_months):
+        """
+        Test that max_months abandons the same scenarios as test_strategy, with NaN net assets.
+        """
+        rates = [0.0, 0.5, 1.0]
+        strategies = ["FF", "HF", "FHF"]
+        cases = [(pct, strategy) for pct in rates for strategy in strategies]
+        months, net_assets = simulate_batch(1800, 5000, [c[0] for c in cases], [c[1] for c in cases], 0.1, max_months)
+        for i, (pct, strategy) in enumerate(cases):
+            expected_months, expected_assets, _ = run_strategy(
+                1800, 5000, pct, strategy, 0.1, history_mode="off", max_months=max_months
+            )
+            assert months[i] == expected_months
+            if expected_assets is None:
+                assert np.isnan(net_assets[i])
+            else:
+                assert net_assets[i] == expected_assets
+
+    @pytest.mark.edge_case
+    def test_income_below_rent_raises(self):
+        """
+        Test that an income that never saves towards the first property is rejected.
+        """
+        with pytest.raises(ValueError):
+            simulate_batch(1000, 0, 0.5, ["FF"], 0.1)
@@ -0,0 +1,55 @@
+"""
+Unit tests for ResultCache in investments.strategies.cache (strategies/cache.py)
+Covers: happy paths, edge cases.
+"""
+
+import os
+
+import pytest
+
+from investments.strategies import cache as cache_module
+from investments.strategies.cache import ResultCache, scenario_key
+from investments.strategies.simulation import test_strategy as run_strategy
+
+
+class TestResultCache:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("history_mode", ["list", "off"])
+    def test_cached_result_matches_simulation(self, tmp_path, history_mode):
+        """
+        Test that a cache hit returns exactly what the simulation returned.
+        """
+        cache = ResultCache(str(tmp_path))
+        expected = run_strategy(1800, 5000, 0.37, "HF", 0.05, history_mode=history_mode)
+        assert cache.test_strategy(1800, 5000, 0.37, "HF", 0.05, history_mode=history_mode) == expected
+        assert ResultCache(str(tmp_path)).test_strategy(1800, 5000, 0.37, "HF", 0.05, history_mode=history_mode) == expected
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    @pytest.mark.happy_path
+    def test_model_change_invalidates_keys(self, monkeypatch):
+        """
+        Test that a different model fingerprint gives a different key.
+        """
+        key = scenario_key(1800, 5000, 0.5, "FF", 0.1)
+        monkeypatch.setattr(cache_module, "model_fingerprint", lambda: "changed")
+        assert scenario_key(1800, 5000, 0.5, "FF", 0.1) != key
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_evicts_least_recently_used(self, tmp_path):
+        """
+        Test that the cache stays under max_bytes by dropping the oldest entries.
+        """
+        cache = ResultCache(str(tmp_path), max_bytes=10 ** 9)
+        for age, pct in enumerate((0.1, 0.2, 0.3)):
+            cache.test_strategy(1800, 5000, pct, "FF", 0.1)
+            path = cache._path(scenario_key(1800, 5000, pct, "FF", 0.1, "list"))
+            os.utime(path, (1000 + age, 1000 + age))
+        cache.max_bytes = cache.size - 1
+        cache.evict()
+        assert cache.size <= cache.max_bytes
+        assert cache.get(scenario_key(1800, 5000, 0.1, "FF", 0.1, "list")) is None
+        assert cache.get(scenario_key(1800, 5000, 0.3, "FF", 0.1, "list")) is not None
@@ -0,0 +1,81 @@
+"""
+Unit tests for StrategyTrie in investments.strategies.checkpoint (strategies/checkpoint.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.strategies.checkpoint import StrategyTrie
+from investments.strategies.simulation import test_strategy as run_strategy
+
+
+class TestStrategyTrie:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("history_mode", ["off", "list"])
+    def test_matches_test_strategy(self, history_mode):
+        """
+        Test that every run returns test_strategy's months, net assets and history.
+        """
+        trie = StrategyTrie(history_mode)
+        for deposit in (0.05, 0.10):
+            for strategy in ("HH", "HF", "FH", "FF", "FHF"):
+                for pct in (0.0, 0.25, 0.5, 1.0):
+                    expected = run_strategy(1800, 5000, pct, strategy, deposit, history_mode=history_mode)
+                    assert trie.run(1800, 5000, pct, strategy, deposit) == expected
+
+    @pytest.mark.happy_path
+    def test_shares_prefixes(self):
+        """
+        Test that the first purchase is simulated once per type and later phases once per rate.
+        """
+        trie = StrategyTrie()
+        for pct in (0.2, 0.8):
+            for strategy in ("HH", "HF"):
+                trie.run(1800, 5000, pct, strategy, 0.1)
+        # H once, then HH and HF at each rate
+        assert trie.phases_simulated == 1 + 4
+        assert trie.phases_reused == 3
+
+        trie.run(1800, 5000, 0.8, "HF", 0.1)
+        assert trie.phases_simulated == 5
+        assert trie.phases_reused == 5
+
+    @pytest.mark.happy_path
+    def test_longer_strategy_extends_prefix(self):
+        """
+        Test that a strategy extending a cached one only simulates its new phase.
+        """
+        trie = StrategyTrie("list")
+        trie.run(1800, 5000, 0.5, "FH", 0.1)
+        result = trie.run(1800, 5000, 0.5, "FHF", 0.1)
+        assert trie.phases_simulated == 3
+        assert trie.phases_reused == 2
+        assert result == run_strategy(1800, 5000, 0.5, "FHF", 0.1)
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_returned_history_is_a_copy(self):
+        """
+        Test that changing a returned history does not leak into later runs.
+        """
+        trie = StrategyTrie("list")
+        _, _, history = trie.run(1800, 5000, 0.5, "FF", 0.1)
+        history.clear()
+        assert trie.run(1800, 5000, 0.5, "FF", 0.1) == run_strategy(1800, 5000, 0.5, "FF", 0.1)
+
+    @pytest.mark.edge_case
+    def test_roots_are_separate_per_setup(self):
+        """
+        Test that different income, savings or deposit never share a snapshot.
+        """
+        trie = StrategyTrie()
+        trie.run(1800, 5000, 0.5, "FF", 0.1)
+        trie.run(2000, 5000, 0.5, "FF", 0.1)
+        trie.run(1800, 6000, 0.5, "FF", 0.05)
+        assert len(trie.roots) == 3
+        assert trie.phases_reused == 0
+        trie.clear()
+        assert trie.roots == {} and trie.phases_simulated == 0
@@ -0,0 +1,59 @@
+"""
+Unit tests for simulate_events in investments.strategies.events (strategies/events.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.strategies.events import EventSimulation, simulate_events, PURCHASE, HORIZON
+from investments.strategies.simulation import test_strategy as run_strategy
+
+
+class TestSimulateEvents:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("strategy", ["HH", "FF", "HF", "FH", "F", "FHF"])
+    @pytest.mark.parametrize("deposit", [0.05, 0.10])
+    def test_exact_mode_matches_scalar_engine(self, strategy, deposit):
+        """
+        Test that exact mode returns exactly the scalar months and net assets.
+        """
+        for pct in [i / 10 for i in range(11)]:
+            expected = run_strategy(1800, 5000, pct, strategy, deposit, history_mode="off")
+            assert simulate_events(1800, 5000, pct, strategy, deposit, exact=True) == expected[:2]
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("strategy", ["HH", "FF", "HF", "FH"])
+    def test_closed_form_is_close(self, strategy):
+        """
+        Test that closed-form jumps land within a month of the scalar engine.
+        """
+        for pct in [i / 10 for i in range(11)]:
+            months, _, _ = run_strategy(1800, 5000, pct, strategy, 0.1, history_mode="off")
+            assert abs(simulate_events(1800, 5000, pct, strategy, 0.1)[0] - months) <= 1
+
+    @pytest.mark.happy_path
+    def test_work_scales_with_events_not_months(self):
+        """
+        Test that a long multi-property strategy is handled in a few events per phase.
+        """
+        simulation = EventSimulation(2500, 5000, 0.5, "FHFHFHFH", 0.1)
+        months, net_assets = simulation.run()
+        assert months > 100
+        assert len(simulation.log) < 6 * 8
+        assert [kind for _, kind in simulation.log].count(PURCHASE) == 8
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_scheduled_event_runs_and_horizon_stops(self):
+        """
+        Test that a scheduled action runs at its month and the horizon ends an unfinished run.
+        """
+        seen = []
+        simulation = EventSimulation(1800, 5000, 0.5, "FF", 0.1, horizon=30)
+        simulation.schedule(20, lambda sim: seen.append((sim.month, len(sim.properties))))
+        assert simulation.run() == (30, None)
+        assert seen == [(20, 1)]
+        assert simulation.log[-1] == (30, HORIZON)
@@ -0,0 +1,70 @@
+"""
+Unit tests for HistoryRecorder in investments.strategies.history (strategies/history.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.strategies.simulation import HistoryRecorder, generate_property, test_strategy as run_strategy
+
+
+class TestHistoryRecorder:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("strategy", ["FF", "HF", "FHF"])
+    def test_matches_list_history(self, strategy):
+        """
+        Test that a columnar run returns the same results and records as the list history.
+        """
+        months, net_assets, history = run_strategy(1800, 5000, 0.4, strategy, 0.1)
+        columnar = run_strategy(1800, 5000, 0.4, strategy, 0.1, history_mode="columnar")
+        assert columnar[:2] == (months, net_assets)
+        assert isinstance(columnar[2], HistoryRecorder)
+        assert len(columnar[2]) == len(history)
+        assert columnar[2].to_list() == history
+        assert columnar[2][-1] == history[-1]
+        assert columnar[2][10:20] == history[10:20]
+
+    @pytest.mark.happy_path
+    def test_grows_past_capacity_and_width(self):
+        """
+        Test that rows and property slots beyond the initial allocation keep earlier records.
+        """
+        recorder = HistoryRecorder(capacity=2, max_properties=1)
+        properties = [generate_property(t, 0.1) for t in "FHFH"]
+        for month in range(1, 10):
+            recorder.append(month, month * 100.0, properties[:min(month, 4)])
+
+        assert len(recorder) == 9
+        assert recorder.month.shape[0] >= 9
+        assert recorder.value.shape[1] >= 4
+        assert [r["month"] for r in recorder] == list(range(1, 10))
+        assert recorder[0]["properties"] == [{"value": 150000, "mortgage_principal": 135000, "ltv": 0.9}]
+        assert [p["value"] for p in recorder[8]["properties"]] == [150000, 220000, 150000, 220000]
+        assert recorder[8]["savings"] == 900.0
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_copy_is_independent(self):
+        """
+        Test that appending to a copy leaves the original unchanged.
+        """
+        recorder = HistoryRecorder(capacity=1)
+        recorder.append(1, 10.0, [])
+        clone = recorder.copy()
+        clone.append(2, 20.0, [generate_property("F", 0.1)])
+        assert len(recorder) == 1
+        assert clone[1]["properties"][0]["value"] == 150000
+
+    @pytest.mark.edge_case
+    def test_index_out_of_range(self):
+        """
+        Test that indexing past the end raises IndexError.
+        """
+        recorder = HistoryRecorder()
+        recorder.append(1, 0.0, [])
+        with pytest.raises(IndexError):
+            recorder[1]
+        assert recorder[-1]["month"] == 1
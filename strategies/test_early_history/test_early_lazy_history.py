@@ -0,0 +1,50 @@
+"""
+Unit tests for LazyHistory in investments.strategies.history (strategies/history.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.strategies.simulation import LazyHistory, SavingRun, test_strategy as run_strategy
+
+
+class TestLazyHistory:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("strategy", ["FF", "HF", "FHF"])
+    def test_matches_list_history(self, strategy):
+        """
+        Test that a lazy run returns the same results and records as the list history.
+        """
+        months, net_assets, history = run_strategy(1800, 5000, 0.4, strategy, 0.1)
+        lazy = run_strategy(1800, 5000, 0.4, strategy, 0.1, history_mode="lazy")
+        assert lazy[:2] == (months, net_assets)
+        assert isinstance(lazy[2], LazyHistory)
+        assert lazy[2] == history
+        assert lazy[2][5] == history[5]
+        assert lazy[2][-1] == history[-1]
+        assert lazy[2][10:20] == history[10:20]
+
+    @pytest.mark.happy_path
+    def test_saving_run_builds_records_on_demand(self):
+        """
+        Test that a saving run yields month and savings without storing records.
+        """
+        history = LazyHistory()
+        history.extend_saving_run(SavingRun(1, 5000, 800, 3))
+        history.append({"month": 4, "savings": 0, "properties": []})
+        assert len(history) == 4
+        assert [r["savings"] for r in history] == [5800, 6600, 7400, 0]
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_index_out_of_range(self):
+        """
+        Test that indexing past the end raises IndexError.
+        """
+        history = LazyHistory()
+        history.extend_saving_run(SavingRun(1, 0, 100, 2))
+        with pytest.raises(IndexError):
+            history[2]
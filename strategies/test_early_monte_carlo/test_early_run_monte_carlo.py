@@ -0,0 +1,70 @@
+"""
+Unit tests for run_monte_carlo and simulate_paths in investments.strategies.monte_carlo (strategies/monte_carlo.py)
+Covers: happy paths, edge cases.
+"""
+
+import numpy as np
+import pytest
+
+from investments.strategies.monte_carlo import draw_paths, run_monte_carlo, simulate_paths
+from investments.strategies.simulation import test_strategy as run_strategy
+
+
+class TestRunMonteCarlo:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("strategy", ["HH", "FF", "HF", "FH"])
+    @pytest.mark.parametrize("overpayment_pct", [0.0, 0.4, 1.0])
+    def test_flat_paths_match_scalar_engine(self, strategy, overpayment_pct):
+        """
+        Test that paths without volatility or drift reproduce test_strategy exactly.
+        """
+        rate_shock, price_index = draw_paths(2, 200, seed=0, rate_volatility=0, price_drift=0, price_volatility=0)
+        months, net_assets = simulate_paths(1800, 5000, overpayment_pct, strategy, 0.05, rate_shock, price_index)
+        expected_months, expected_assets, _ = run_strategy(1800, 5000, overpayment_pct, strategy, 0.05)
+        assert months.tolist() == [expected_months] * 2
+        assert net_assets.tolist() == [expected_assets] * 2
+
+    @pytest.mark.happy_path
+    def test_same_seed_is_reproducible(self):
+        """
+        Test that the same seed gives the same summary and a different seed does not.
+        """
+        first = run_monte_carlo(1800, 5000, 0.5, "FF", 0.1, n_paths=500, horizon=240, seed=7)
+        second = run_monte_carlo(1800, 5000, 0.5, "FF", 0.1, n_paths=500, horizon=240, seed=7)
+        other = run_monte_carlo(1800, 5000, 0.5, "FF", 0.1, n_paths=500, horizon=240, seed=8)
+        assert first == second
+        assert first != other
+        assert 0 <= first["hit_probability"] <= 1
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_short_horizon_misses_goal(self):
+        """
+        Test that paths which cannot finish within the horizon are reported as misses.
+        """
+        summary = run_monte_carlo(1800, 5000, 0.5, "FF", 0.1, n_paths=100, horizon=12, seed=1)
+        assert summary["hit_probability"] == 0.0
+        assert summary["months"] is None
+        assert summary["net_assets"] is None
+
+    @pytest.mark.edge_case
+    def test_unfinished_paths_are_nan(self):
+        """
+        Test that simulate_paths marks unfinished paths with NaN.
+        """
+        rate_shock, price_index = draw_paths(10, 5, seed=3)
+        months, net_assets = simulate_paths(1800, 5000, 0.5, "HH", 0.1, rate_shock, price_index)
+        assert np.isnan(months).all()
+        assert np.isnan(net_assets).all()
+
+    @pytest.mark.edge_case
+    def test_negative_overpayment_raises(self):
+        """
+        Test that an income below the property expenses is rejected, as by the batch engine.
+        """
+        rate_shock, price_index = draw_paths(4, 60, seed=2)
+        with pytest.raises(ValueError):
+            simulate_paths(300, 100000, 0.5, "FF", 0.1, rate_shock, price_index)
@@ -0,0 +1,60 @@
+"""
+Unit tests for test_strategy_pence in investments.strategies.pence (strategies/pence.py)
+Covers: happy paths, edge cases.
+"""
+
+import numpy as np
+import pytest
+
+from investments.strategies.pence import simulate_batch_pence, test_strategy_pence as run_strategy_pence
+from investments.strategies.simulation import test_strategy as run_strategy
+from investments.utils.money import costs_pence
+from investments.utils.saving import purchase_fees, stamp_duty_for_value
+
+
+class TestStrategyPence:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("strategy", ["HH", "FF", "HF", "FH", "F", "FHF"])
+    @pytest.mark.parametrize("deposit", [0.05, 0.10])
+    def test_batch_is_bit_identical(self, strategy, deposit):
+        """
+        Test that the batched engine returns exactly the scalar engine's integers.
+        """
+        rates = [i / 20 for i in range(21)] + [0.333]
+        months, net_assets = simulate_batch_pence(1800, 5000, rates, [strategy] * len(rates), deposit)
+        for i, pct in enumerate(rates):
+            assert run_strategy_pence(1800, 5000, pct, strategy, deposit) == (months[i], net_assets[i])
+
+    @pytest.mark.happy_path
+    def test_close_to_float_engine(self):
+        """
+        Test that penny rounding of interest stays within a couple of months of the float engine.
+        """
+        months, net_assets = run_strategy_pence(1800, 5000, 0.5, "FF", 0.1)
+        float_months, _, _ = run_strategy(1800, 5000, 0.5, "FF", 0.1, history_mode="off")
+        assert isinstance(net_assets, int)
+        assert abs(months - float_months) <= 2
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("value", [100000, 249999, 250000, 600000, 925000, 1200000, 2000000])
+    def test_costs_match_float_costs(self, value):
+        """
+        Test that purchase costs in pence equal the float costs for whole-pound values.
+        """
+        expected = round((purchase_fees(True) + stamp_duty_for_value(False, value)) * 100)
+        assert costs_pence(value * 100, False, True) == expected
+        assert costs_pence(np.array([value * 100]), False, True)[0] == expected
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_income_below_expenses_raises(self):
+        """
+        Test that an income too low to cover the property's expenses raises ValueError.
+        """
+        with pytest.raises(ValueError):
+            run_strategy_pence(300, 100000, 0.5, "FF", 0.1)
+        with pytest.raises(ValueError):
+            simulate_batch_pence(300, 100000, 0.5, ["FF"], 0.1)
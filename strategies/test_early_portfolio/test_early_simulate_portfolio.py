@@ -0,0 +1,154 @@
+"""
+Unit tests for simulate_portfolio and Portfolio in investments.strategies.portfolio (strategies/portfolio.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.strategies.portfolio import (
+    BUY_TO_LET_INTEREST_ONLY,
+    Portfolio,
+    calculate_profit,
+    generate_property,
+    simulate_portfolio,
+)
+from investments.strategies.simulation import test_strategy as run_strategy
+from investments.utils.overpayments import calculate_overpayment
+from investments.utils.saving import costs
+
+
+def let_flat_profit():
+    """Monthly rental profit of a flat let out on an interest-only buy-to-let."""
+    flat = generate_property("F", 0.1)
+    flat.mortgage.mortgage_principal = 112500  # a home is only let at 75% LTV or below
+    assert flat.convert_to_buy_to_let(BUY_TO_LET_INTEREST_ONLY)
+    return calculate_profit(flat)[0]
+
+
+class TestSimulatePortfolio:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("strategy", ["F", "HH", "FF", "HF", "FH", "FHF", "FFFF"])
+    @pytest.mark.parametrize("overpayment_pct", [0.0, 0.5, 1.0])
+    @pytest.mark.parametrize("deposit", [0.05, 0.10])
+    def test_keeping_homes_matches_test_strategy(self, strategy, overpayment_pct, deposit):
+        """
+        Test that let_out=False returns exactly test_strategy's months, net assets and history.
+        """
+        expected = run_strategy(1800, 5000, overpayment_pct, strategy, deposit)
+        result = simulate_portfolio(1800, 5000, overpayment_pct, strategy, deposit, let_out=False, history_mode="list")
+        assert result == expected
+
+    @pytest.mark.happy_path
+    def test_released_equity_goes_into_savings(self):
+        """
+        Test that letting the first home moves its released equity from the property into savings.
+        """
+        home = generate_property("F", 0.1)
+        home.mortgage.mortgage_principal = 105000  # 70% LTV
+        portfolio = Portfolio()
+        portfolio.move_into(home, True, False)
+        released = portfolio.move_into(generate_property("F", 0.1), True, False)
+
+        assert released == 112500 - 105000  # remortgaged to 75% LTV
+        assert portfolio.let_equity == 150000 - 112500
+        assert portfolio.rental_profit == let_flat_profit()
+        # A strategy that ends on the move has the same net assets either way
+        kept = simulate_portfolio(1800, 5000, 0.5, "FF", 0.1, let_out=False)
+        let = simulate_portfolio(1800, 5000, 0.5, "FF", 0.1, let_out=True)
+        assert let[0] == kept[0]
+        assert let[1] == pytest.approx(kept[1])
+
+    @pytest.mark.happy_path
+    def test_rental_profit_is_saved_every_month(self):
+        """
+        Test that every month after the first let adds the rental profit to the month's saving.
+        """
+        _, _, history = simulate_portfolio(1800, 5000, 0.0, "FFF", 0.1, history_mode="list")
+        profit = let_flat_profit()
+        max_overpayment = calculate_overpayment(generate_property("F", 0.1), 1800)
+        required = costs(generate_property("F", 0.1), False, True) + 15000
+
+        letting = [r for r in history if len(r["properties"]) == 2]
+        assert len(letting) > 1
+        for before, after in zip(letting, letting[1:]):
+            # With overpayment_pct 0 everything is saved until the savings cover the next flat
+            saved = 0 if before["savings"] > required else max_overpayment
+            assert after["savings"] - before["savings"] == pytest.approx(saved + profit)
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("strategy", ["F" * 10, "FH" * 6])
+    def test_long_strategies(self, strategy):
+        """
+        Test that 10+ property strategies finish, and sooner when earlier homes are let out.
+        """
+        kept = simulate_portfolio(1800, 5000, 0.5, strategy, 0.1, let_out=False)
+        let = simulate_portfolio(1800, 5000, 0.5, strategy, 0.1, history_mode="list")
+        assert kept[:2] == run_strategy(1800, 5000, 0.5, strategy, 0.1, history_mode="off")[:2]
+        assert let[0] < kept[0]
+        assert let[1] > 0
+        assert len(let[2]) == let[0]
+        assert len(let[2][-1]["properties"]) == len(strategy) - 1
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("price_scale, interest_rate", [(0.8, None), (1.2, 0.06), (1.0, 0.03)])
+    def test_market_matches_test_strategy(self, price_scale, interest_rate):
+        """
+        Test that price_scale and interest_rate reach every purchase as they do in test_strategy.
+        """
+        expected = run_strategy(
+            1800, 5000, 0.5, "FHF", 0.1, price_scale=price_scale, interest_rate=interest_rate
+        )
+        result = simulate_portfolio(
+            1800, 5000, 0.5, "FHF", 0.1, let_out=False, history_mode="list",
+            price_scale=price_scale, interest_rate=interest_rate
+        )
+        assert result == expected
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_home_above_75_ltv_is_not_remortgaged(self):
+        """
+        Test that a home above 75% LTV is kept on its mortgage and earns no rental profit.
+        """
+        portfolio = Portfolio()
+        portfolio.move_into(generate_property("F", 0.1), True, False)
+        assert portfolio.move_into(generate_property("H", 0.1), True, False) == 0
+        assert portfolio.rental_profit == 0
+        assert len(portfolio.properties()) == 2
+
+    @pytest.mark.edge_case
+    def test_empty_strategy_keeps_savings(self):
+        """
+        Test that an empty strategy buys nothing and returns the starting savings.
+        """
+        assert simulate_portfolio(1800, 5000, 0.5, "", 0.1) == (0, 5000, None)
+
+    @pytest.mark.edge_case
+    @pytest.mark.parametrize("max_months", [10, 50, 90])
+    def test_max_months_abandons_run(self, max_months):
+        """
+        Test that a strategy needing more than max_months is abandoned like test_strategy,
+        in the renting phase as well as the owning phases.
+        """
+        full = simulate_portfolio(1800, 5000, 0.5, "FFFF", 0.1)
+        assert full[0] > max_months
+        months, assets, history = simulate_portfolio(
+            1800, 5000, 0.5, "FFFF", 0.1, history_mode="list", max_months=max_months
+        )
+        assert months > max_months
+        assert assets is None
+        assert len(history) <= max_months
+        kept = simulate_portfolio(1800, 5000, 0.5, "FFFF", 0.1, let_out=False, max_months=max_months)
+        assert kept[1] is None
+        assert kept[0] == run_strategy(1800, 5000, 0.5, "FFFF", 0.1, history_mode="off", max_months=max_months)[0]
+
+    @pytest.mark.edge_case
+    def test_max_months_within_budget(self):
+        """
+        Test that a budget the strategy fits in changes nothing.
+        """
+        full = simulate_portfolio(1800, 5000, 0.5, "FFF", 0.1, history_mode="list")
+        assert simulate_portfolio(1800, 5000, 0.5, "FFF", 0.1, history_mode="list", max_months=full[0]) == full
@@ -0,0 +1,82 @@
+"""
+Unit tests for iter_strategy in investments.strategies.simulation (strategies/simulation.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.strategies.simulation import iter_strategy, test_strategy as run_strategy
+
+
+def drain(generator):
+    """All records of a generator and its return value."""
+    records = []
+    while True:
+        try:
+            records.append(next(generator))
+        except StopIteration as stop:
+            return records, stop.value
+
+
+class TestIterStrategy:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("strategy", ["FF", "HF", "FHF"])
+    @pytest.mark.parametrize("overpayment_pct", [0.0, 0.5, 1.0])
+    def test_matches_test_strategy(self, strategy, overpayment_pct):
+        """
+        Test that the records are the list history plus net assets, and the return value matches.
+        """
+        months, net_assets, history = run_strategy(1800, 5000, overpayment_pct, strategy, 0.1)
+        records, result = drain(iter_strategy(1800, 5000, overpayment_pct, strategy, 0.1))
+        assert result == (months, net_assets)
+        assert [{k: v for k, v in r.items() if k != "net_assets"} for r in records] == history
+        assert records[-1]["net_assets"] == records[-1]["savings"] + sum(
+            p["value"] - p["mortgage_principal"] for p in records[-1]["properties"]
+        )
+
+    @pytest.mark.happy_path
+    def test_market_arguments_match_test_strategy(self):
+        """
+        Test that price_scale and interest_rate are applied as in test_strategy.
+        """
+        months, net_assets, history = run_strategy(2200, 8000, 0.4, "HF", 0.05, price_scale=0.9, interest_rate=0.04)
+        records, result = drain(iter_strategy(2200, 8000, 0.4, "HF", 0.05, price_scale=0.9, interest_rate=0.04))
+        assert result == (months, net_assets)
+        assert [r["month"] for r in records] == [r["month"] for r in history]
+        assert records[-1]["savings"] == history[-1]["savings"]
+
+    @pytest.mark.happy_path
+    def test_stop_when_ends_the_run(self):
+        """
+        Test that the run stops after the first record meeting stop_when and returns its state.
+        """
+        records, result = drain(iter_strategy(
+            1800, 5000, 0.5, "FF", 0.1, stop_when=lambda r: len(r["properties"]) == 1 and r["properties"][0]["ltv"] < 0.85
+        ))
+        assert records[-1]["properties"][0]["ltv"] < 0.85
+        assert all(not r["properties"] or r["properties"][0]["ltv"] >= 0.85 for r in records[:-1])
+        assert result == (records[-1]["month"], records[-1]["net_assets"])
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    @pytest.mark.parametrize("max_months", [3, 30])
+    def test_max_months_abandons_the_run(self, max_months):
+        """
+        Test that a run over max_months stops after that month and returns (months, None).
+        """
+        months, _, _ = run_strategy(1800, 5000, 0.5, "FF", 0.1, history_mode="off", max_months=max_months)
+        records, result = drain(iter_strategy(1800, 5000, 0.5, "FF", 0.1, max_months=max_months))
+        assert result == (months, None)
+        assert records[-1]["month"] == max_months
+
+    @pytest.mark.edge_case
+    def test_stop_on_first_record(self):
+        """
+        Test that stop_when true from the start yields exactly one record.
+        """
+        records, result = drain(iter_strategy(1800, 5000, 0.5, "FF", 0.1, stop_when=lambda r: True))
+        assert len(records) == 1
+        assert result == (1, records[0]["net_assets"])
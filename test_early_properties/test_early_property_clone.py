@@ -0,0 +1,87 @@
+"""
+Unit tests for Property and Mortgage clone/reset in investments.properties (properties.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.properties import Mortgage, Property
+
+
+def flat_property():
+    return Property(property_value=150000, buy_to_let=False, mortgage_length=40, is_flat=True, deposit=15000, interest_rate=0.05)
+
+
+class TestPropertyClone:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    def test_clone_is_independent(self):
+        """
+        Test that changing a clone's mortgage leaves the original untouched.
+        """
+        original = flat_property()
+        clone = original.clone()
+        clone.mortgage.mortgage_principal = 100000
+        clone.mortgage.months_complete = 7
+        clone.property_value = 160000
+        assert original.mortgage.mortgage_principal == 135000
+        assert original.mortgage.months_complete == 0
+        assert original.property_value == 150000
+        assert clone.mortgage is not original.mortgage
+        assert clone.to_dict() != original.to_dict()
+
+    @pytest.mark.happy_path
+    def test_reset_restores_the_start(self):
+        """
+        Test that reset restores the initial principal and zeroes the term counters.
+        """
+        prop = flat_property()
+        prop.mortgage.mortgage_principal = 90000
+        prop.mortgage.years_complete = 3
+        prop.mortgage.months_complete = 5
+        assert prop.reset() is prop
+        assert prop.mortgage.mortgage_principal == prop.mortgage.mortgage_principal_init == 135000
+        assert prop.mortgage.years_complete == 0
+        assert prop.mortgage.months_complete == 0
+
+    @pytest.mark.happy_path
+    def test_to_dict_shape(self):
+        """
+        Test that to_dict gives the same dict as before the switch to slots.
+        """
+        assert flat_property().to_dict() == {
+            "property_value": 150000,
+            "buy_to_let": False,
+            "mortgage": {
+                "deposit": 15000,
+                "mortgage_principal_init": 135000,
+                "interest_rate": 0.05,
+                "mortgage_length": 40,
+                "years_complete": 0,
+                "months_complete": 0,
+                "mortgage_principal": 135000,
+            },
+        }
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_mortgage_clone_and_reset(self):
+        """
+        Test that Mortgage.clone copies every field and reset only touches the clone.
+        """
+        mortgage = Mortgage(15000, 135000, 0.05, 40, 2, 4, 120000)
+        clone = mortgage.clone()
+        assert clone == mortgage and clone is not mortgage
+        clone.reset()
+        assert (clone.mortgage_principal, clone.years_complete, clone.months_complete) == (135000, 0, 0)
+        assert (mortgage.mortgage_principal, mortgage.years_complete, mortgage.months_complete) == (120000, 2, 4)
+
+    @pytest.mark.edge_case
+    def test_slots_reject_new_attributes(self):
+        """
+        Test that Property no longer accepts attributes outside its slots.
+        """
+        with pytest.raises(AttributeError):
+            flat_property().nickname = "home"
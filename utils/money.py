@@ -0,0 +1,148 @@
+import sys
+import os
+from fractions import Fraction
+from functools import lru_cache
+from bisect import bisect_right
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from properties import Property
+from utils.saving import purchase_fees, stamp_duty_bases, STAMP_DUTY_RATES, STAMP_DUTY_THRESHOLDS
+from utils.overpayments import MAINTENANCE_RATE, FLAT_SERVICE_CHARGE
+
+"""
+Integer-pence versions of the repayment and saving kernels.
+Every amount is a whole number of pence and every rate an integer (basis points for interest,
+parts per million for the overpayment share), so each operation is exact integer arithmetic
+rounded half up. The same expressions work on Python ints and on int64 NumPy arrays and give
+identical results, so the scalar and batched engines built on them agree bit for bit.
+
+The one irrational quantity, the amortization factor r(1+r)^n / ((1+r)^n - 1), is computed
+exactly with fractions once per (rate, term) and stored as a fixed-point integer with
+FACTOR_BITS fractional bits. Principals up to 2^63 / factor (billions of pounds) fit in int64.
+"""
+
+PENCE_PER_POUND = 100
+BASIS_POINTS = 10000  # interest rates are held in basis points (0.05 -> 500)
+PPM = 1000000  # overpayment shares are held in parts per million
+FACTOR_BITS = 32
+MONTHLY_RATE_DIVISOR = 12 * BASIS_POINTS
+
+
+def to_pence(pounds: float) -> int:
+    return int(round(pounds * PENCE_PER_POUND))
+
+
+def to_pounds(pence: int) -> float:
+    return pence / PENCE_PER_POUND
+
+
+def rate_basis_points(interest_rate: float) -> int:
+    return int(round(interest_rate * BASIS_POINTS))
+
+
+def share_ppm(share: float) -> int:
+    return int(round(share * PPM))
+
+
+def divide(numerator, denominator: int):
+    """numerator / denominator rounded half up, for ints or int64 arrays (denominator > 0)."""
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+@lru_cache(maxsize=None)
+def payment_factor(rate_bp: int, mortgage_length: int) -> int:
+    """Amortization factor for a monthly payment, in fixed point with FACTOR_BITS bits."""
+    r = Fraction(rate_bp, MONTHLY_RATE_DIVISOR)
+    growth = (1 + r) ** (mortgage_length * 12)
+    factor = r * growth / (growth - 1)
+    return int(factor * 2 ** FACTOR_BITS + Fraction(1, 2))
+
+
+def monthly_payment_pence(principal, factor):
+    """Fixed monthly payment in pence for a principal in pence."""
+    return (principal * factor + (1 << (FACTOR_BITS - 1))) >> FACTOR_BITS
+
+
+def interest_pence(principal, rate_bp):
+    """One month of interest in pence, rounded half up to the penny."""
+    return divide(principal * rate_bp, MONTHLY_RATE_DIVISOR)
+
+
+def step_pence(principal: int, payment: int, overpay: int, rate_bp: int) -> int:
+    """utils.repayment.step in pence: returns the principal after one month."""
+    if principal <= 0:
+        return principal
+    principal_payment = min(payment + overpay - interest_pence(principal, rate_bp), principal)
+    return max(0, principal - principal_payment)
+
+
+def step_pence_array(principal: np.ndarray, payment: np.ndarray, overpay: np.ndarray, rate_bp: np.ndarray) -> np.ndarray:
+    """step_pence for int64 arrays."""
+    principal_payment = np.minimum(payment + overpay - interest_pence(principal, rate_bp), principal)
+    return np.where(principal > 0, np.maximum(0, principal - principal_payment), principal)
+
+
+def expenses_pence(value, is_flat: bool):
+    """utils.overpayments.calculate_expenses in pence."""
+    maintenance = divide(value * round(MAINTENANCE_RATE * BASIS_POINTS), 12 * BASIS_POINTS)
+    service_charge = FLAT_SERVICE_CHARGE * PENCE_PER_POUND // 12 if is_flat else 0
+    return maintenance + service_charge
+
+
+_STAMP_DUTY_THRESHOLDS = tuple(threshold * PENCE_PER_POUND for threshold in STAMP_DUTY_THRESHOLDS)
+_STAMP_DUTY_BASES = stamp_duty_bases(
+    lambda amount, rate: divide(amount * PENCE_PER_POUND * rate[0], rate[1])
+)
+
+
+def stamp_duty_pence(first_time_buy: bool, value: int) -> int:
+    """utils.saving.stamp_duty_for_value in pence."""
+    if first_time_buy:
+        return 0
+    band = bisect_right(_STAMP_DUTY_THRESHOLDS, value)
+    if band == 0:
+        numerator, denominator = STAMP_DUTY_RATES[0]
+        return divide(value * numerator, denominator)
+    numerator, denominator = STAMP_DUTY_RATES[band]
+    return divide((value - _STAMP_DUTY_THRESHOLDS[band - 1]) * numerator, denominator) + _STAMP_DUTY_BASES[band - 1]
+
+
+def stamp_duty_pence_array(first_time_buy: bool, values: np.ndarray) -> np.ndarray:
+    """stamp_duty_pence for an int64 array of values."""
+    values = np.asarray(values, dtype=np.int64)
+    if first_time_buy:
+        return np.zeros_like(values)
+    below = divide(values * STAMP_DUTY_RATES[0][0], STAMP_DUTY_RATES[0][1])
+    above = [
+        divide((values - threshold) * numerator, denominator) + base
+        for threshold, (numerator, denominator), base
+        in zip(_STAMP_DUTY_THRESHOLDS, STAMP_DUTY_RATES[1:], _STAMP_DUTY_BASES)
+    ]
+    return np.select(
+        [values < threshold for threshold in _STAMP_DUTY_THRESHOLDS],
+        [below] + above[:-1],
+        above[-1],
+    )
+
+
+def costs_pence(value, first_time_buy: bool, proffessional_moving_help: bool):
+    """utils.saving.costs in pence; value may be an int or an int64 array."""
+    fees = purchase_fees(proffessional_moving_help) * PENCE_PER_POUND
+    if isinstance(value, np.ndarray):
+        return fees + stamp_duty_pence_array(first_time_buy, value)
+    return fees + stamp_duty_pence(first_time_buy, value)
+
+
+def property_terms(property: Property) -> tuple:
+    """(value, principal, rate_bp, payment factor, monthly expenses) of a property, in pence."""
+    mortgage = property.mortgage
+    rate_bp = rate_basis_points(mortgage.interest_rate)
+    value = to_pence(property.property_value)
+    return (
+        value,
+        value - to_pence(mortgage.deposit),
+        rate_bp,
+        payment_factor(rate_bp, mortgage.mortgage_length),
+        expenses_pence(value, property.is_flat),
+    )
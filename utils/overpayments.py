@@ -2,24 +2,30 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from properties import Property
+from utils import trace
 
 """
 This file will decide how much money if able to be overpayed to overpaying a mortgage, or saving
 for a new deposit
 """
 
+# Will assume maintenance costs of 1% of property value per year
+MAINTENANCE_RATE = 0.01
+FLAT_SERVICE_CHARGE = 2400  # per year
+
 def calculate_expenses(property: Property):
-    # Will assume maintenance costs of 1% of property value per year
-    general_maintanence = property.property_value * 0.01 / 12
-    service_charge = 2400 / 12 if property.is_flat else 0
+    general_maintanence = property.property_value * MAINTENANCE_RATE / 12
+    service_charge = FLAT_SERVICE_CHARGE / 12 if property.is_flat else 0
     return general_maintanence + service_charge
 
+@trace.timed
 def calculate_overpayment(property: Property, income: int):
     total_maintenance = calculate_expenses(property)
     overpayment = income - total_maintenance
 
     if overpayment < 0:
-        print("overpayment is negative: increase income")
+        if trace.warning_on:
+            trace.event("overpayment.negative", trace.WARNING, income=income, expenses=total_maintenance)
         return
     
     return overpayment
@@ -0,0 +1,158 @@
+import os
+import sys
+import atexit
+from contextlib import contextmanager
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import trace
+
+"""
+Profiling hooks for test_strategy and the sweeps built on it.
+When enabled, every @trace.timed function is timed (calls, inclusive and self wall time per
+call stack), and the simulation counts the months it spends in each phase (phase 0 is saving
+for the first property, phase k is paying off property k while saving for property k + 1).
+step() calls come straight from the timing counters.
+
+    with profiling.profile():
+        find_optimal_strategy(...)
+    print(profiling.report())
+    profiling.write_collapsed("sweep.folded")  # flamegraph.pl / speedscope input
+
+Setting INVESTING_PROFILE enables profiling at import and prints the report on exit; a value
+other than "1" is also used as the path of the collapsed-stack export.
+Work done in other processes is profiled there and added with snapshot() and merge().
+When disabled, the simulation runs the undecorated functions and pays one flag check per phase.
+"""
+
+STEP_FUNCTION = "utils.repayment.step"
+
+enabled = False
+phase_months = {}  # phase index -> months simulated
+phase_runs = {}  # phase index -> phases simulated
+
+
+def enable():
+    global enabled
+    enabled = True
+    trace.enable_timing()
+
+
+def disable():
+    global enabled
+    enabled = False
+    trace.disable_timing()
+
+
+def reset():
+    phase_months.clear()
+    phase_runs.clear()
+    trace.reset_timings()
+
+
+def count_phase(phase: int, months: int):
+    """Records a phase that took months simulated months."""
+    phase_months[phase] = phase_months.get(phase, 0) + months
+    phase_runs[phase] = phase_runs.get(phase, 0) + 1
+
+
+@contextmanager
+def profile(fresh: bool = True):
+    """Profiles the enclosed block, starting from zeroed counters unless fresh is False."""
+    if fresh:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def snapshot() -> dict:
+    """Everything collected so far in a picklable form, for merge() in another process."""
+    return {
+        "phase_months": dict(phase_months),
+        "phase_runs": dict(phase_runs),
+        "timings": {name: tuple(stats) for name, stats in trace.timings.items()},
+        "stacks": dict(trace.stacks),
+    }
+
+
+def merge(other: dict):
+    """
+    Adds a snapshot() taken elsewhere, e.g. in a sweep worker, to the counters here.
+    Wall times of workers that ran side by side are summed, like CPU time.
+    """
+    for phase, months in other["phase_months"].items():
+        phase_months[phase] = phase_months.get(phase, 0) + months
+    for phase, runs in other["phase_runs"].items():
+        phase_runs[phase] = phase_runs.get(phase, 0) + runs
+    for name, (calls, seconds) in other["timings"].items():
+        stats = trace.timings.setdefault(name, [0, 0.0])
+        stats[0] += calls
+        stats[1] += seconds
+    for stack, seconds in other["stacks"].items():
+        trace.stacks[stack] = trace.stacks.get(stack, 0.0) + seconds
+
+
+def counters() -> dict:
+    """step() calls and months simulated, in total and per phase."""
+    step_stats = trace.timings.get(STEP_FUNCTION, [0, 0.0])
+    return {
+        "step_calls": step_stats[0],
+        "months": sum(phase_months.values()),
+        "phases": {
+            phase: {"runs": phase_runs[phase], "months": phase_months[phase]}
+            for phase in sorted(phase_months)
+        },
+    }
+
+
+def self_times() -> dict:
+    """Self wall time per function, summed over the call stacks it appears at the top of."""
+    totals = {}
+    for stack, seconds in trace.stacks.items():
+        totals[stack[-1]] = totals.get(stack[-1], 0.0) + seconds
+    return totals
+
+
+def report() -> str:
+    """Human-readable summary of the counters and per-function timings."""
+    stats = counters()
+    lines = [f"step() calls: {stats['step_calls']}", f"Months simulated: {stats['months']}"]
+    for phase, values in stats["phases"].items():
+        lines.append(f"  phase {phase}: {values['months']} months over {values['runs']} runs")
+
+    own = self_times()
+    lines.append(f"{'function':<60} {'calls':>10} {'total s':>10} {'self s':>10}")
+    for row in trace.timing_report():
+        if row["calls"]:
+            lines.append(
+                f"{row['function']:<60} {row['calls']:>10} {row['total_s']:>10.4f} "
+                f"{own.get(row['function'], 0.0):>10.4f}"
+            )
+    return "\n".join(lines)
+
+
+def collapsed_stacks() -> list[str]:
+    """Brendan Gregg's folded format: "outer;inner;leaf <self microseconds>" per call stack."""
+    return [
+        f"{';'.join(stack)} {round(seconds * 1e6)}"
+        for stack, seconds in sorted(trace.stacks.items())
+    ]
+
+
+def write_collapsed(path: str):
+    with open(path, "w") as f:
+        for line in collapsed_stacks():
+            f.write(line + "\n")
+
+
+def _report_at_exit(path: str):
+    sys.stderr.write(report() + "\n")
+    if path:
+        write_collapsed(path)
+
+
+if os.environ.get("INVESTING_PROFILE"):
+    enable()
+    atexit.register(_report_at_exit, "" if os.environ["INVESTING_PROFILE"] == "1" else os.environ["INVESTING_PROFILE"])
@@ -2,56 +2,105 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from properties import Property, flat
-import numpy as np
+from utils import trace
+import math
+from functools import lru_cache
 from typing import Tuple
 
+EPSILON = 0.00001
+# Largest amount calculate_interest can differ from the unrounded interest in one month,
+# plus a little headroom for float error in the payment arithmetic.
+ROUNDING_SLACK = 0.5 + EPSILON + 1e-6
+MAX_MONTHS = 1000  # safety cap (~83 years)
+PAYMENT_CACHE_SIZE = 65536
+
+@lru_cache(maxsize=None)
+def annuity_factor(interest_rate: float, mortgage_length: int) -> Tuple[float, float]:
+    """Numerator and denominator of the amortization formula; they only depend on rate and term."""
+    r = interest_rate / 12
+    n = mortgage_length * 12
+    growth = (1 + r) ** n
+    return r * growth, growth - 1
+
+@lru_cache(maxsize=PAYMENT_CACHE_SIZE)
+def monthly_payment(interest_rate: float, mortgage_length: int, principal: float) -> float:
+    """Fixed monthly payment for a principal, memoised with bounded LRU eviction."""
+    numerator, denominator = annuity_factor(interest_rate, mortgage_length)
+    return principal * numerator / denominator
+
+def payment_cache_info() -> dict:
+    """Hit/miss counters of the payment caches."""
+    payment = monthly_payment.cache_info()
+    factor = annuity_factor.cache_info()
+    return {
+        "hits": payment.hits,
+        "misses": payment.misses,
+        "size": payment.currsize,
+        "max_size": payment.maxsize,
+        "factor_hits": factor.hits,
+        "factor_misses": factor.misses,
+    }
+
+def clear_payment_cache():
+    """Empties the payment caches and resets their counters."""
+    monthly_payment.cache_clear()
+    annuity_factor.cache_clear()
+
+@trace.timed
 def calculate_fixed_monthly_payment(property: Property) -> float:
     """Calculate fixed monthly payment using standard amortization formula."""
-    r = property.mortgage.interest_rate / 12
-    n = property.mortgage.mortgage_length * 12
-    P = property.mortgage.mortgage_principal
-
-    return P * (r * (1 + r) ** n) / ((1 + r) ** n - 1)
+    return monthly_payment(
+        property.mortgage.interest_rate,
+        property.mortgage.mortgage_length,
+        property.mortgage.mortgage_principal,
+    )
 
 def calculate_interest_only_monthly_payment(property: Property) -> float:
     """Calculate monthly payment for interest-only mortgage."""
     return property.mortgage.mortgage_principal * (property.mortgage.interest_rate / 12)
 
+def round_interest(principal: float, monthly_interest_rate: float) -> int:
+    """Interest on principal for one month, rounded to the nearest pound."""
+    # epsilon applied to consistently round up when using number ending in 0.5.
+    # round() on a float rounds half to even like np.round, without the NumPy scalar overhead.
+    return round(principal * monthly_interest_rate + EPSILON)
+
 def calculate_interest(property: Property): 
     """Calculate monthly interest payment (rounded up)."""
-    epsilon = 0.00001
     monthly_interest_rate = property.mortgage.interest_rate / 12
+    return round_interest(property.mortgage.mortgage_principal, monthly_interest_rate)
 
-    # epsilon applied to consistently round up when using number ending in 0.5
-    return int(np.round(property.mortgage.mortgage_principal * monthly_interest_rate + epsilon))
-
+@trace.timed
 def step(property: Property, fixed_monthly_payment: float, overpay: int = 0) -> Property:
     """
     Simulate one month of mortgage repayment using a fixed monthly payment plus optional overpayment.
     Returns interest and principal paid for the month.
     """
-    if property.mortgage.mortgage_principal <= 0:
+    mortgage = property.mortgage
+    principal = mortgage.mortgage_principal
+    if principal <= 0:
         return property
 
-    interest = calculate_interest(property)
+    interest = round_interest(principal, mortgage.interest_rate / 12)
     total_payment = fixed_monthly_payment + overpay
     principal_payment = total_payment - interest
 
     # Clamp to remaining balance
-    principal_payment = min(principal_payment, property.mortgage.mortgage_principal)
+    principal_payment = min(principal_payment, principal)
 
-    remaining_balance = property.mortgage.mortgage_principal - principal_payment
+    remaining_balance = principal - principal_payment
     remaining_balance = max(0, remaining_balance)
 
     # Update mortgage state
-    property.mortgage.mortgage_principal = remaining_balance
-    if property.mortgage.months_complete == 11:
-        property.mortgage.years_complete += 1
-        property.mortgage.months_complete = 0
+    mortgage.mortgage_principal = remaining_balance
+    if mortgage.months_complete == 11:
+        mortgage.years_complete += 1
+        mortgage.months_complete = 0
     else:
-        property.mortgage.months_complete += 1
+        mortgage.months_complete += 1
     return property
 
+@trace.timed
 def multistep(property: Property, months: int, fixed_monthly_payment: float, overpay: int = 0):
     """Simulate multiple months of repayment."""
     for _ in range(months):
@@ -61,6 +110,7 @@ def multistep(property: Property, months: int, fixed_monthly_payment: float, ove
     
 
 
+@trace.timed
 def time_to_loan_to_value(property: Property, target_ltv: float, fixed_monthly_payment: float, overpay: int = 0) -> int:
     """
     Calculate how many months it takes to reach a given LTV (e.g., 0.75 = 75% loan-to-value).
@@ -74,21 +124,121 @@ def time_to_loan_to_value(property: Property, target_ltv: float, fixed_monthly_p
         step(property, fixed_monthly_payment, overpay)
         months += 1
 
-        if months > 1000:  # safety cap (~83 years)
-            print("Aborted after 1000 months.")
+        if months > MAX_MONTHS:
+            if trace.warning_on:
+                trace.event("repayment.aborted", trace.WARNING, months=MAX_MONTHS)
             break
 
     return months
 
-if __name__ == "__main__":
-    import copy
+def first_month_below(principal: float, threshold: float, growth: float, outflow: float):
+    """
+    First month t where x_t <= threshold for the recurrence x_{t+1} = growth * x_t - outflow,
+    x_0 = principal. Returns None if the balance never gets there.
+    """
+    if principal <= threshold:
+        return 0
+    if (growth - 1) * principal >= outflow:
+        return None  # balance is not falling
+
+    if growth == 1:
+        return math.ceil((principal - threshold) / outflow)
+
+    fixed_point = outflow / (growth - 1)
+    ratio = (threshold - fixed_point) / (principal - fixed_point)
+    if ratio <= 0:
+        return None  # converges to a balance above the threshold
+
+    def balance(t):
+        return fixed_point + growth ** t * (principal - fixed_point)
+
+    t = max(1, math.ceil(math.log(ratio) / math.log(growth)))
+    # The log estimate can be off by one either way through float error
+    while t > 1 and balance(t - 1) <= threshold:
+        t -= 1
+    while balance(t) > threshold:
+        t += 1
+    return t
+
+def _step_months_to_loan_to_value(
+    principal: float,
+    property_value: int,
+    monthly_interest_rate: float,
+    target_ltv: float,
+    fixed_monthly_payment: float,
+    overpay: float,
+    payment_factor: Tuple[float, float],
+) -> int:
+    """Exact month-by-month count, using the same arithmetic as step()."""
+    months = 0
+    while (principal / property_value) > target_ltv:
+        if principal <= 0:
+            break
+        if payment_factor is not None:
+            fixed_monthly_payment = principal * payment_factor[0] / payment_factor[1]
+        interest = round_interest(principal, monthly_interest_rate)
+        principal_payment = min(fixed_monthly_payment + overpay - interest, principal)
+        principal = max(0, principal - principal_payment)
+        months += 1
+        if months > MAX_MONTHS:
+            break
+    return months
+
+@trace.timed
+def months_to_loan_to_value(property: Property, target_ltv: float, fixed_monthly_payment: float = None, overpay: int = 0) -> int:
+    """
+    Closed-form version of time_to_loan_to_value that leaves the property untouched.
+    If fixed_monthly_payment is None the payment is recalculated from the remaining principal
+    every month, as move_forward_one_month does.
+
+    The balance follows x_{t+1} = a * x_t - c plus a rounding error of at most half a pound a month,
+    so the true balance lies between two geometric envelopes that can be inverted with a log.
+    When both envelopes cross the target in the same month that month is the answer; otherwise
+    the months are stepped exactly.
+    """
+    principal = property.mortgage.mortgage_principal
+    value = property.property_value
+    r = property.mortgage.interest_rate / 12
+    payment_factor = None
+    if fixed_monthly_payment is None:
+        payment_factor = annuity_factor(property.mortgage.interest_rate, property.mortgage.mortgage_length)
+        growth = 1 + r - payment_factor[0] / payment_factor[1]
+        outflow = overpay
+    else:
+        growth = 1 + r
+        outflow = fixed_monthly_payment + overpay
+
+    if principal / value <= target_ltv:
+        return 0
+
+    months = None
+    if target_ltv >= 0:
+        threshold = target_ltv * value
+        earliest = first_month_below(principal, threshold, growth, outflow + ROUNDING_SLACK)
+        if earliest is None or earliest > MAX_MONTHS:
+            months = MAX_MONTHS + 1
+        else:
+            latest = first_month_below(principal, threshold, growth, outflow - ROUNDING_SLACK)
+            if latest == earliest:
+                months = earliest
+
+    if months is None:
+        months = _step_months_to_loan_to_value(
+            principal, value, r, target_ltv, fixed_monthly_payment, overpay, payment_factor
+        )
+    if months > MAX_MONTHS and trace.warning_on:
+        trace.event("repayment.aborted", trace.WARNING, months=MAX_MONTHS)
+    return months
 
+if __name__ == "__main__":
     # Clone the property to avoid modifying global
-    prop = copy.deepcopy(flat)
+    prop = flat.clone()
 
     fixed_payment = calculate_fixed_monthly_payment(prop)
     maintenance = prop.property_value * 0.01 / 12
     overpay_amount = 1400 - fixed_payment - maintenance
 
+    print(f"Months to reach 75% LTV (solved): {months_to_loan_to_value(prop, 0.75, fixed_payment, overpay_amount)}")
+
     months = time_to_loan_to_value(prop, 0.75, fixed_payment, overpay_amount)
     print(f"Months to reach 75% LTV: {months}")
@@ -4,6 +4,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from properties import Property
 import copy
 import math
+from bisect import bisect_right
+import numpy as np
+from functools import lru_cache
+from utils import trace
 
 """
 This file will determine the amount of months it'll taketo reach a certain level of savings.
@@ -11,41 +15,93 @@ It will also take into account any upfront costs of purchasing a property.
 """
 
 def calculate_stamp_duty(first_time_buy: bool, property: Property):
+    return stamp_duty_for_value(first_time_buy, property.property_value)
+
+# Stamp duty for buyers who are not first time buyers: STAMP_DUTY_RATES[0] applies below
+# STAMP_DUTY_THRESHOLDS[0] and STAMP_DUTY_RATES[i + 1] from STAMP_DUTY_THRESHOLDS[i] upwards.
+# Rates are (numerator, denominator) so utils.money can apply them in exact integer arithmetic.
+STAMP_DUTY_THRESHOLDS = (250000, 925000, 1500000)
+STAMP_DUTY_RATES = ((3, 100), (8, 100), (13, 1000), (15, 100))
+
+def stamp_duty_bases(band_duty) -> tuple:
+    """
+    Duty already owed at each threshold, where band_duty(amount, rate) is the duty on amount at rate.
+    The duty owed at one threshold is carried into the next band twice.
+    """
+    bases = [band_duty(STAMP_DUTY_THRESHOLDS[0], STAMP_DUTY_RATES[0])]
+    for i in range(1, len(STAMP_DUTY_THRESHOLDS)):
+        width = STAMP_DUTY_THRESHOLDS[i] - STAMP_DUTY_THRESHOLDS[i - 1]
+        bases.append(bases[-1] + band_duty(width, STAMP_DUTY_RATES[i]) + bases[-1])
+    return tuple(bases)
+
+_STAMP_DUTY_RATES = tuple(numerator / denominator for numerator, denominator in STAMP_DUTY_RATES)
+_STAMP_DUTY_BASES = stamp_duty_bases(lambda amount, rate: amount * (rate[0] / rate[1]))
+
+def stamp_duty_for_value(first_time_buy: bool, property_value: float):
     if first_time_buy:
         return 0
-    if property.property_value < 250000:
-        return property.property_value * 0.03
-    
-    up_to250 = 250000 * 0.03
-    multiplier250 = 0.05 if first_time_buy else 0.08
-
-    if property.property_value < 925000:
-        return (property.property_value - 250000) * multiplier250 + up_to250
-    
-    up_to925 = up_to250 + (925000 - 250000) * multiplier250 + up_to250
-    multiplier925 = 0.1 if first_time_buy else 0.013
-
-    if property.property_value < 1500000:
-        return (property.property_value - 925000) * multiplier925 + up_to925
-    
-    up_to_1500000 = up_to925 + (1500000 - 925000) * multiplier925 + up_to925
-    multiplier1500000 = 0.12 if first_time_buy else 0.15
-
-    return (property.property_value - 1500000) * multiplier1500000 + up_to_1500000
-    
+    band = bisect_right(STAMP_DUTY_THRESHOLDS, property_value)
+    if band == 0:
+        return property_value * _STAMP_DUTY_RATES[0]
+    return (property_value - STAMP_DUTY_THRESHOLDS[band - 1]) * _STAMP_DUTY_RATES[band] + _STAMP_DUTY_BASES[band - 1]
+
+def calculate_stamp_duty_array(first_time_buy: bool, property_values) -> np.ndarray:
+    """calculate_stamp_duty for an array of property values."""
+    values = np.asarray(property_values, dtype=float)
+    if first_time_buy:
+        return np.zeros_like(values)
+
+    above = [
+        (values - threshold) * rate + base
+        for threshold, rate, base in zip(STAMP_DUTY_THRESHOLDS, _STAMP_DUTY_RATES[1:], _STAMP_DUTY_BASES)
+    ]
+    return np.select(
+        [values < threshold for threshold in STAMP_DUTY_THRESHOLDS],
+        [values * _STAMP_DUTY_RATES[0]] + above[:-1],
+        above[-1],
+    )
+
+def purchase_fees(proffessional_moving_help: bool) -> int:
+    """Fixed costs of buying, excluding stamp duty."""
+    mortgage_fees = 500	#£500 – £1,000 range
+    legal_conveyancing = 1200 #£800 – £1,600 range
+    survey = 500 #£400 – £600 range
+    moving = 200 if proffessional_moving_help else 100 #£100 – £300 range
+
+    return mortgage_fees + legal_conveyancing + survey + moving
+
+def costs_array(property_values, first_time_buy: bool, proffessional_moving_help: bool) -> np.ndarray:
+    """costs for an array of property values, for pricing many candidate properties at once."""
+    return purchase_fees(proffessional_moving_help) + calculate_stamp_duty_array(first_time_buy, property_values)
+
+@lru_cache(maxsize=4096)
+def cost_index(is_flat: bool, property_value: float, first_time_buy: bool, proffessional_moving_help: bool):
+    """Precomputed acquisition costs keyed on property type, value and buyer circumstances."""
+    return purchase_fees(proffessional_moving_help) + stamp_duty_for_value(first_time_buy, property_value)
+
 # In this model will assume if it's not a first time buy then
+@trace.timed
 def costs(
     property: Property,
     first_time_buy: bool,
     proffessional_moving_help: bool,
     ):
-    mortgage_fees = 500	#£500 – £1,000 range
-    legal_conveyancing = 1200 #£800 – £1,600 range
-    survey = 500 #£400 – £600 range
-    moving = 200 if proffessional_moving_help else 100 #£100 – £300 range
-    stamp_duty = calculate_stamp_duty(first_time_buy, property)
+    # The simulation asks for the same next property every month, so this is a table lookup
+    return cost_index(property.is_flat, property.property_value, first_time_buy, proffessional_moving_help)
 
-    return mortgage_fees + legal_conveyancing + survey + moving + stamp_duty
+def months_to_save(current_savings, saved_per_month, target) -> int:
+    """
+    Months of adding saved_per_month (> 0) until current_savings reaches target, 0 if it already has.
+    Exact: the float estimate is corrected against current_savings + months * saved_per_month.
+    """
+    if current_savings >= target:
+        return 0
+    months = max(1, math.ceil((target - current_savings) / saved_per_month))
+    while current_savings + months * saved_per_month < target:
+        months += 1
+    while months > 1 and current_savings + (months - 1) * saved_per_month >= target:
+        months -= 1
+    return months
 
 def time_till_purchase(
         current_savings: int, 
@@ -0,0 +1,52 @@
+"""
+Unit tests for profile in investments.utils.profiling (utils/profiling.py)
+Covers: happy paths, edge cases.
+"""
+
+import pytest
+
+from investments.strategies import simulation
+from investments.strategies.simulation import profiling
+
+
+class TestProfile:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    def test_counts_steps_and_phase_months(self):
+        """
+        Test that step() calls and months per phase add up to the simulated run.
+        """
+        with profiling.profile():
+            months, _, history = simulation.test_strategy(1800, 5000, 0.5, "FF", 0.1)
+        stats = profiling.counters()
+        assert stats["months"] == months == len(history)
+        assert stats["phases"][0]["runs"] == stats["phases"][1]["runs"] == 1
+        assert stats["step_calls"] == stats["phases"][1]["months"]
+
+    @pytest.mark.happy_path
+    def test_collapsed_stacks_nest_under_test_strategy(self):
+        """
+        Test that every exported stack starts at the outermost timed call.
+        """
+        with profiling.profile():
+            simulation.test_strategy(1800, 5000, 0.5, "HF", 0.05, history_mode="off")
+        lines = profiling.collapsed_stacks()
+        assert lines
+        for line in lines:
+            stack, micros = line.rsplit(" ", 1)
+            assert stack.split(";")[0].endswith("simulation.test_strategy")
+            assert int(micros) >= 0
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_disabled_after_block(self):
+        """
+        Test that leaving the block restores the undecorated functions.
+        """
+        original = simulation.move_forward_one_month
+        with profiling.profile():
+            assert simulation.move_forward_one_month is not original
+        assert simulation.move_forward_one_month is original
+        assert not profiling.enabled
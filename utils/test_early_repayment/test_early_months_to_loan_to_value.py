@@ -0,0 +1,92 @@
+"""
+Unit tests for months_to_loan_to_value in investments.utils.repayment (utils/repayment.py)
+Covers: happy paths, edge cases.
+"""
+
+import copy
+
+import pytest
+
+from investments.properties import Property
+from investments.utils.repayment import (
+    calculate_fixed_monthly_payment,
+    months_to_loan_to_value,
+    step,
+    time_to_loan_to_value,
+    trace,
+)
+
+
+def make_property(value=150000, deposit=0.1, interest_rate=0.05, mortgage_length=40):
+    return Property(
+        property_value=value,
+        buy_to_let=False,
+        mortgage_length=mortgage_length,
+        is_flat=True,
+        deposit=value * deposit,
+        interest_rate=interest_rate,
+    )
+
+
+class TestMonthsToLoanToValue:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("overpay", [0, 250, 731.5, 1500])
+    @pytest.mark.parametrize("target", [0.75, 0.5])
+    def test_matches_time_to_loan_to_value(self, overpay, target):
+        """
+        Test that the solved month equals the stepped month for a fixed payment.
+        """
+        prop = make_property()
+        fixed = calculate_fixed_monthly_payment(prop)
+        expected = time_to_loan_to_value(copy.deepcopy(prop), target, fixed, overpay)
+        assert months_to_loan_to_value(prop, target, fixed, overpay) == expected
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("overpay", [0, 400, 1099])
+    def test_matches_recalculated_payment(self, overpay):
+        """
+        Test the mode where the payment is recalculated from the principal every month.
+        """
+        prop = make_property(value=220000, deposit=0.05, interest_rate=0.06)
+        stepped = copy.deepcopy(prop)
+        expected = 0
+        while stepped.mortgage.mortgage_principal / stepped.property_value > 0.75:
+            step(stepped, calculate_fixed_monthly_payment(stepped), overpay)
+            expected += 1
+        assert months_to_loan_to_value(prop, 0.75, None, overpay) == expected
+
+    @pytest.mark.happy_path
+    def test_property_is_not_modified(self):
+        """
+        Test that solving leaves the mortgage state untouched.
+        """
+        prop = make_property()
+        before = prop.to_dict()
+        months_to_loan_to_value(prop, 0.75, calculate_fixed_monthly_payment(prop), 500)
+        assert prop.to_dict() == before
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_already_below_target(self):
+        """
+        Test that a property already under the target LTV needs zero months.
+        """
+        prop = make_property(deposit=0.3)
+        assert months_to_loan_to_value(prop, 0.75, calculate_fixed_monthly_payment(prop)) == 0
+
+    @pytest.mark.edge_case
+    def test_payment_below_interest_hits_cap(self):
+        """
+        Test that a payment that never reduces the balance stops at the safety cap.
+        """
+        prop = make_property()
+        collector = trace.Collector()
+        trace.configure(sink=collector)
+        try:
+            assert months_to_loan_to_value(prop, 0.75, 100) == 1001
+        finally:
+            trace.configure()
+        assert collector.named("repayment.aborted") == [{"event": "repayment.aborted", "level": "WARNING", "months": 1000}]
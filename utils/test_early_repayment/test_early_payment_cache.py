@@ -0,0 +1,79 @@
+"""
+Unit tests for monthly_payment, payment_cache_info, clear_payment_cache and round_interest
+in investments.utils.repayment (utils/repayment.py)
+Covers: happy paths, edge cases.
+"""
+
+import numpy as np
+import pytest
+
+from investments.utils.repayment import (
+    EPSILON,
+    annuity_factor,
+    clear_payment_cache,
+    monthly_payment,
+    payment_cache_info,
+    round_interest,
+)
+
+
+class TestPaymentCache:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    def test_counts_hits_and_misses(self):
+        """
+        Test that repeated payments are counted as hits and new principals as misses.
+        """
+        clear_payment_cache()
+        monthly_payment(0.05, 40, 135000)
+        monthly_payment(0.05, 40, 135000)
+        monthly_payment(0.05, 40, 134000)
+        info = payment_cache_info()
+        assert (info["hits"], info["misses"], info["size"]) == (1, 2, 2)
+        # Both misses needed the annuity factor, and the second found it cached
+        assert (info["factor_hits"], info["factor_misses"]) == (1, 1)
+
+    @pytest.mark.happy_path
+    def test_payment_matches_formula(self):
+        """
+        Test that the memoised payment is the amortization formula.
+        """
+        numerator, denominator = annuity_factor(0.06, 40)
+        assert monthly_payment(0.06, 40, 142500) == 142500 * numerator / denominator
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_clear_resets_counters(self):
+        """
+        Test that clearing empties both caches and zeroes every counter.
+        """
+        monthly_payment(0.05, 40, 135000)
+        monthly_payment(0.05, 40, 135000)
+        clear_payment_cache()
+        info = payment_cache_info()
+        assert info["hits"] == info["misses"] == info["size"] == 0
+        assert info["factor_hits"] == info["factor_misses"] == 0
+
+
+class TestRoundInterest:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("interest", [0.5, 1.5, 2.5, 562.5, 563.5, 10000.5, 0.49, 3.51, 0.0])
+    def test_matches_numpy_rounding(self, interest):
+        """
+        Test that exact .5 amounts and ordinary values round as np.round with the epsilon did.
+        """
+        assert round_interest(interest, 1) == int(np.round(interest + EPSILON))
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_half_rounds_up(self):
+        """
+        Test that the epsilon makes halves round up rather than to even.
+        """
+        assert round_interest(2.5, 1) == 3
+        assert round_interest(135000, 0.05 / 12) == int(np.round(135000 * 0.05 / 12 + EPSILON))
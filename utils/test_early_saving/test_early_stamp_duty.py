@@ -0,0 +1,86 @@
+"""
+Unit tests for the stamp duty bands in investments.utils.saving (utils/saving.py)
+and their pence version in investments.utils.money (utils/money.py)
+Covers: happy paths, edge cases.
+"""
+
+import numpy as np
+import pytest
+
+from investments.properties import flat
+from investments.utils.money import stamp_duty_pence, stamp_duty_pence_array
+from investments.utils.saving import (
+    STAMP_DUTY_RATES,
+    STAMP_DUTY_THRESHOLDS,
+    calculate_stamp_duty_array,
+    cost_index,
+    costs,
+    costs_array,
+    stamp_duty_for_value,
+)
+
+# Every band edge, a pound and a penny either side, plus values well inside each band
+EDGE_VALUES = sorted(
+    {0, 1, 125000, 600000, 1200000, 3000000}
+    | {threshold + offset for threshold in STAMP_DUTY_THRESHOLDS for offset in (-1, -0.01, 0, 0.01, 1)}
+)
+
+def priced(value):
+    """A copy of the flat with another value."""
+    prop = flat.clone()
+    prop.property_value = value
+    return prop
+
+
+class TestStampDutyBands:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("first_time_buy", [True, False])
+    def test_array_matches_scalar(self, first_time_buy):
+        """
+        Test that calculate_stamp_duty_array equals stamp_duty_for_value at and around each band edge.
+        """
+        expected = [stamp_duty_for_value(first_time_buy, value) for value in EDGE_VALUES]
+        assert calculate_stamp_duty_array(first_time_buy, EDGE_VALUES).tolist() == expected
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("first_time_buy", [True, False])
+    @pytest.mark.parametrize("moving_help", [True, False])
+    def test_cost_index_and_costs_array_match_costs(self, first_time_buy, moving_help):
+        """
+        Test that cost_index and costs_array equal costs at and around each band edge.
+        """
+        expected = [costs(priced(value), first_time_buy, moving_help) for value in EDGE_VALUES]
+        assert [cost_index(True, value, first_time_buy, moving_help) for value in EDGE_VALUES] == expected
+        assert costs_array(EDGE_VALUES, first_time_buy, moving_help).tolist() == expected
+
+    @pytest.mark.happy_path
+    def test_rate_changes_at_each_threshold(self):
+        """
+        Test that each band charges its own rate on the pound above its threshold.
+        """
+        for threshold, (numerator, denominator) in zip(STAMP_DUTY_THRESHOLDS, STAMP_DUTY_RATES[1:]):
+            step = stamp_duty_for_value(False, threshold + 1) - stamp_duty_for_value(False, threshold)
+            assert step == pytest.approx(numerator / denominator)
+
+    @pytest.mark.happy_path
+    @pytest.mark.parametrize("first_time_buy", [True, False])
+    def test_pence_matches_pounds(self, first_time_buy):
+        """
+        Test that the pence versions agree with stamp_duty_for_value at and around each band edge.
+        """
+        pence = [round(value * 100) for value in EDGE_VALUES]
+        expected = [round(stamp_duty_for_value(first_time_buy, value) * 100) for value in EDGE_VALUES]
+        assert [stamp_duty_pence(first_time_buy, value) for value in pence] == expected
+        assert stamp_duty_pence_array(first_time_buy, np.array(pence)).tolist() == expected
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_first_time_buyers_pay_nothing(self):
+        """
+        Test that first time buyers pay no stamp duty in any band.
+        """
+        assert all(stamp_duty_for_value(True, value) == 0 for value in EDGE_VALUES)
+        assert not calculate_stamp_duty_array(True, EDGE_VALUES).any()
@@ -0,0 +1,163 @@
+"""
+Unit tests for configure, event, Collector and enable_timing/disable_timing
+in investments.utils.trace (utils/trace.py)
+Covers: happy paths, edge cases.
+"""
+
+import importlib
+
+import pytest
+
+from investments.strategies import simulation
+from investments.strategies.simulation import trace
+
+
+@pytest.fixture(autouse=True)
+def default_trace():
+    """Puts the default configuration and untimed functions back after each test."""
+    yield
+    trace.disable_timing()
+    trace.reset_timings()
+    trace.configure()
+
+
+def emitted(count: int, level: int) -> list[int]:
+    """Emits count numbered events at level; returns the numbers that reached the sink."""
+    collector = trace.Collector()
+    trace.configure(trace.DEBUG, sample_rate=0.5, sink=collector, seed=7)
+    for i in range(count):
+        trace.event("test.sampled", level, i=i)
+    return [record["i"] for record in collector.named("test.sampled")]
+
+
+class TestConfigure:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    def test_info_level_flags(self):
+        """
+        Test that configure("info") turns on info and above and leaves debug off.
+        """
+        trace.configure("info")
+        assert (trace.debug_on, trace.info_on, trace.warning_on, trace.error_on) == (False, True, True, True)
+        trace.configure("ERROR")
+        assert (trace.debug_on, trace.info_on, trace.warning_on, trace.error_on) == (False, False, False, True)
+
+    @pytest.mark.happy_path
+    def test_events_below_level_are_dropped(self):
+        """
+        Test that only events at or above the configured level reach the sink, with their fields.
+        """
+        collector = trace.Collector()
+        trace.configure("info", sink=collector)
+        trace.event("test.debug", trace.DEBUG)
+        trace.event("test.info", trace.INFO, months=3)
+        trace.event("test.warning", trace.WARNING)
+        assert collector.events == [
+            {"event": "test.info", "level": "INFO", "months": 3},
+            {"event": "test.warning", "level": "WARNING"},
+        ]
+
+    @pytest.mark.happy_path
+    def test_seeded_sampling_is_deterministic(self):
+        """
+        Test that the same seed keeps the same sample of events below WARNING.
+        """
+        first = emitted(200, trace.DEBUG)
+        assert 0 < len(first) < 200
+        assert emitted(200, trace.DEBUG) == first
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_warnings_are_never_sampled(self):
+        """
+        Test that sample_rate does not drop warnings.
+        """
+        assert emitted(50, trace.WARNING) == list(range(50))
+
+    @pytest.mark.edge_case
+    def test_disable_turns_every_level_off(self):
+        """
+        Test that disable() silences warnings and errors too.
+        """
+        collector = trace.Collector()
+        trace.configure(sink=collector)
+        trace.disable()
+        trace.event("test.error", trace.ERROR)
+        assert not trace.error_on
+        assert collector.events == []
+
+    @pytest.mark.edge_case
+    def test_unknown_level_name_raises(self):
+        """
+        Test that an unknown level name is rejected.
+        """
+        with pytest.raises(KeyError):
+            trace.configure("verbose")
+
+
+class TestTiming:
+    # ------------------- Happy Path Tests -------------------
+
+    @pytest.mark.happy_path
+    def test_enable_rebinds_and_disable_restores(self):
+        """
+        Test that enable_timing swaps a timed module attribute for a wrapper and disable_timing
+        puts the original back.
+        """
+        original = simulation.move_forward_one_month
+        trace.enable_timing()
+        wrapper = simulation.move_forward_one_month
+        assert wrapper is not original
+        assert wrapper.__wrapped_original__ is original
+        trace.disable_timing()
+        assert simulation.move_forward_one_month is original
+
+    @pytest.mark.happy_path
+    def test_imported_names_are_rebound(self):
+        """
+        Test that a timed function is rebound in its own module and in every module that
+        imported it by name, and restored in both.
+        """
+        original = simulation.step
+        home = importlib.import_module(original.__module__)
+        assert home is not simulation and home.step is original
+
+        trace.enable_timing()
+        assert simulation.step is home.step
+        assert simulation.step.__wrapped_original__ is original
+        trace.disable_timing()
+        assert simulation.step is original
+        assert home.step is original
+
+    @pytest.mark.happy_path
+    def test_timed_calls_are_counted(self):
+        """
+        Test that calls through the rebound names are counted, and only while timing is on.
+        """
+        name = f"{simulation.step.__module__}.step"
+        trace.enable_timing()
+        trace.reset_timings()
+        months, _, _ = simulation.test_strategy(1800, 5000, 0.5, "FF", 0.1, history_mode="off")
+        report = {row["function"]: row for row in trace.timing_report()}
+        calls = report[name]["calls"]
+        assert calls > 0
+        trace.disable_timing()
+        simulation.test_strategy(1800, 5000, 0.5, "FF", 0.1, history_mode="off")
+        assert trace.timings[name][0] == calls
+
+    # ------------------- Edge Case Tests -------------------
+
+    @pytest.mark.edge_case
+    def test_enable_twice_keeps_one_wrapper(self):
+        """
+        Test that enabling timing twice neither wraps a wrapper nor loses the original.
+        """
+        original = simulation.step
+        trace.enable_timing()
+        wrapper = simulation.step
+        trace.enable_timing()
+        assert simulation.step is wrapper
+        trace.disable_timing()
+        assert simulation.step is original
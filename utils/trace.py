@@ -0,0 +1,188 @@
+import os
+import sys
+import time
+import types
+import random
+import functools
+
+"""
+Structured event and timing layer used instead of print() in utils/, strategies/ and run/.
+
+Events are dicts ({"event": name, "level": "WARNING", **fields}) passed to a sink. Call sites
+check a per-level flag before building anything, so a disabled level costs one attribute
+lookup:
+
+    if trace.debug_on:
+        trace.event("lettings.profit", trace.DEBUG, profit=profit)
+
+By default only warnings are emitted (to stderr). Events below WARNING can be sampled.
+configure() can also be driven by the INVESTING_TRACE environment variable (e.g. "info").
+
+Timing is opt-in. @timed only registers a function; enable_timing() swaps every module-level
+reference to it for a timing wrapper and disable_timing() puts the originals back, so
+untimed runs execute the undecorated functions. Self time is also kept per call stack of timed
+functions, which utils/profiling.py exports for flamegraphs.
+"""
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+debug_on = False
+info_on = False
+warning_on = True
+error_on = True
+
+_level = WARNING
+_sample_rate = 1.0
+_rng = random.Random()
+_sink = None
+
+
+def stderr_sink(record: dict):
+    """Writes an event as one readable line."""
+    fields = " ".join(f"{key}={value}" for key, value in record.items() if key not in ("event", "level"))
+    sys.stderr.write(f"[{record['level']}] {record['event']} {fields}\n")
+
+
+class Collector:
+    """Sink that keeps events in memory, e.g. for tests or post-run analysis."""
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, record: dict):
+        self.events.append(record)
+
+    def named(self, name: str) -> list[dict]:
+        return [record for record in self.events if record["event"] == name]
+
+
+def _set_level(level):
+    global _level, debug_on, info_on, warning_on, error_on
+    _level = level
+    debug_on = level <= DEBUG
+    info_on = level <= INFO
+    warning_on = level <= WARNING
+    error_on = level <= ERROR
+
+
+def configure(level=WARNING, sample_rate: float = 1.0, sink=None, seed: int = None):
+    """
+    Emits events at level and above (a level constant or name such as "info") to sink
+    (stderr by default). Events below WARNING are kept with probability sample_rate.
+    """
+    global _sample_rate, _sink
+    if isinstance(level, str):
+        level = {name: value for value, name in LEVEL_NAMES.items()}[level.upper()]
+    _set_level(level)
+    _sample_rate = sample_rate
+    _sink = sink
+    if seed is not None:
+        _rng.seed(seed)
+
+
+def disable():
+    """Turns every level off, warnings included."""
+    _set_level(ERROR + 10)
+
+
+def event(name: str, level: int = INFO, **fields):
+    """Emits an event if its level is enabled (and, below WARNING, if it is sampled)."""
+    if level < _level:
+        return
+    if level < WARNING and _sample_rate < 1.0 and _rng.random() >= _sample_rate:
+        return
+    record = {"event": name, "level": LEVEL_NAMES.get(level, str(level))}
+    record.update(fields)
+    (_sink or stderr_sink)(record)
+
+
+# ------------------- Timing -------------------
+
+_registered = []  # functions marked with @timed
+_timing_enabled = False
+_installed = {}  # original function -> timing wrapper
+timings = {}  # qualified name -> [calls, total seconds]
+stacks = {}  # tuple of qualified names, outermost first -> self seconds
+_stack = []  # names of the timed calls in progress
+_child_time = []  # time spent in timed callees, per call in progress
+
+
+def timed(fn):
+    """Registers fn for the timing collector; returns fn unchanged unless timing is already on."""
+    _registered.append(fn)
+    if _timing_enabled:
+        _installed[fn] = _timing_wrapper(fn)
+        return _installed[fn]
+    return fn
+
+
+def _timing_wrapper(fn):
+    name = f"{fn.__module__}.{fn.__qualname__}"
+    stats = timings.setdefault(name, [0, 0.0])
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        _stack.append(name)
+        _child_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats[0] += 1
+            stats[1] += elapsed
+            key = tuple(_stack)
+            stacks[key] = stacks.get(key, 0.0) + elapsed - _child_time.pop()
+            _stack.pop()
+            if _child_time:
+                _child_time[-1] += elapsed
+    wrapper.__wrapped_original__ = fn
+    return wrapper
+
+
+def _rebind(mapping: dict):
+    """Replaces module attributes that are keys of mapping with the mapped value."""
+    for module in list(sys.modules.values()):
+        namespace = getattr(module, "__dict__", None)
+        if not namespace:
+            continue
+        for attr, value in list(namespace.items()):
+            if isinstance(value, types.FunctionType) and value in mapping:
+                namespace[attr] = mapping[value]
+
+
+def enable_timing():
+    """Starts timing every @timed function (inclusive wall time and call counts)."""
+    global _timing_enabled
+    _timing_enabled = True
+    pending = {fn: _timing_wrapper(fn) for fn in _registered if fn not in _installed}
+    _installed.update(pending)
+    _rebind(pending)
+
+
+def disable_timing():
+    """Puts the untimed functions back."""
+    global _timing_enabled
+    _timing_enabled = False
+    _rebind({wrapper: fn for fn, wrapper in _installed.items()})
+    _installed.clear()
+
+
+def reset_timings():
+    for stats in timings.values():
+        stats[0] = 0
+        stats[1] = 0.0
+    stacks.clear()
+
+
+def timing_report() -> list[dict]:
+    """Per-function calls, total and mean seconds, slowest first."""
+    rows = [
+        {"function": name, "calls": calls, "total_s": total, "mean_s": total / calls if calls else 0.0}
+        for name, (calls, total) in timings.items()
+    ]
+    return sorted(rows, key=lambda row: row["total_s"], reverse=True)
+
+
+if os.environ.get("INVESTING_TRACE"):
+    configure(os.environ["INVESTING_TRACE"])